@@ -0,0 +1,8 @@
+-- Cautarea seeder-ului: PREDICTIONS WHERE patient_id = ? AND user_id = ?
+CREATE INDEX IF NOT EXISTS idx_predictions_patient_user ON PREDICTIONS (patient_id, user_id);
+
+-- Filtrele pe interval de timp din istoric si rapoarte
+CREATE INDEX IF NOT EXISTS idx_predictions_date ON PREDICTIONS (date_created);
+
+-- Istoricul unui medic pe interval de timp
+CREATE INDEX IF NOT EXISTS idx_predictions_user_date ON PREDICTIONS (user_id, date_created);
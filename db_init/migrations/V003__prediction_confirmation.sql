@@ -0,0 +1,6 @@
+-- Diagnosticul confirmat clinic (1 = boala hepatica, 0 = sanatos); NULL cat timp nu este confirmat
+-- Doar randurile confirmate sunt folosite la re-antrenarea incrementala (retrain.py)
+ALTER TABLE PREDICTIONS ADD COLUMN IF NOT EXISTS confirmed_result INT NULL;
+
+-- Re-antrenarea citeste randurile confirmate de dupa ultimul watermark: WHERE confirmed_result IS NOT NULL AND id > ?
+CREATE INDEX IF NOT EXISTS idx_predictions_confirmed ON PREDICTIONS (confirmed_result, id);
@@ -0,0 +1,2 @@
+-- Versiunea modelului care a produs predictia (ex. 'SVM-20-v3', vezi registry.py); NULL pentru randurile vechi
+ALTER TABLE PREDICTIONS ADD COLUMN IF NOT EXISTS model_version VARCHAR(32) NULL;
@@ -0,0 +1,5 @@
+-- Identificatorul intrarii din jurnalul local de predictii (journal.py); NULL pentru randurile salvate direct
+ALTER TABLE PREDICTIONS ADD COLUMN IF NOT EXISTS journal_id CHAR(32) NULL;
+
+-- Reluarea jurnalului dupa o oprire brusca nu poate dubla predictiile deja scrise
+CREATE UNIQUE INDEX IF NOT EXISTS uq_predictions_journal ON PREDICTIONS (journal_id);
@@ -0,0 +1,150 @@
+##########################################################################
+#                                                                        #
+#  Copyright:   (c) 2026, Proiect MPS                                    #
+#  Autori:      Albu A. Sorin (R.Moldova) 1409A                          #
+#               Glavan P. Pavel (R.Moldova) 1409A                        #
+#               Duda I.I. Andrei-Ionuț 1409A                             #
+#               Jireadă C. Teodor 1409A                                  #
+#               Popovici I.L. Andrei 1409A                               #
+#               Noroc D. Sorin (R.Moldova) 1409A                         #
+#               Timofte C. Constantin 1409A                              #
+#               Matei I. Ion (R.Moldova) 1410B                           #
+#                                                                        #
+#  Descriere:   Sistem Expert pentru Predictia Bolilor Hepatice          #
+#               Utilizand algoritmii SVM si Multilayer Perceptron (MLP)  #
+#               Bazat pe setul de date ILPD (Indian Liver Patient)       #
+#                                                                        #
+#  Acest cod si informatiile sunt oferite "ca atare" fara nicio garantie #
+#  de orice fel, exprimata sau implicita. Acest proiect este realizat    #
+#  in scop didactic pentru disciplina Managementul Proiectelor Software. #
+#                                                                        #
+##########################################################################
+import os
+import hmac
+import time
+import base64
+import hashlib
+import logging
+import secrets
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import bcrypt
+
+log = logging.getLogger(__name__)
+
+auth_config = {
+    # Factorul de cost bcrypt (2^rounds iteratii); hash-urile cu alt cost sunt refacute la urmatorul login
+    'bcrypt_rounds': int(os.environ.get("ILPD_BCRYPT_ROUNDS", "12")),
+    # Firele dedicate bcrypt: limiteaza cate verificari costisitoare ruleaza simultan
+    'workers': 2,
+    # Durata de viata (secunde) a unui token de sesiune
+    'token_ttl': int(os.environ.get("ILPD_TOKEN_TTL", "900")),
+    # Cheia de semnare a token-urilor; fara ea se genereaza una la pornire (token-urile nu supravietuiesc repornirii)
+    'secret': os.environ.get("ILPD_AUTH_SECRET") or None
+}
+
+Session = namedtuple('Session', 'user_id role token expires')
+
+class AuthError(ValueError):
+    """
+    Credentiale gresite sau token de sesiune invalid/expirat
+    """
+
+def hash_password(password, rounds=None):
+    """
+    Hash bcrypt cu costul din configuratie
+    """
+    rounds = rounds or auth_config['bcrypt_rounds']
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+
+def hash_cost(stored_hash):
+    """
+    Costul unui hash bcrypt ('$2b$12$...' -> 12)
+    """
+    try: return int(stored_hash.split('$')[2])
+    except (IndexError, ValueError): return None
+
+def _b64(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode('ascii')
+
+class AuthService:
+    """
+    Autentificarea aplicatiei: verificarea bcrypt ruleaza pe un pool propriu de fire,
+    iar dupa login apelurile se verifica printr-un token semnat HMAC, fara bcrypt
+    """
+    def __init__(self, db, rounds=None, workers=None, secret=None, ttl=None):
+        self.db = db
+        self.rounds = rounds or auth_config['bcrypt_rounds']
+        self.ttl = ttl or auth_config['token_ttl']
+        secret = secret or auth_config['secret']
+        self._key = secret.encode('utf-8') if isinstance(secret, str) else (secret or secrets.token_bytes(32))
+        self.pool = ThreadPoolExecutor(max_workers=workers or auth_config['workers'], thread_name_prefix="auth")
+        # Hash fals cu acelasi cost: un utilizator inexistent plateste aceeasi verificare bcrypt ca o parola gresita
+        self._dummy_hash = self.pool.submit(hash_password, secrets.token_hex(16), self.rounds)
+
+    def hash_password(self, password):
+        return self.pool.submit(hash_password, password, self.rounds).result()
+
+    def create_user(self, username, password, role='MEDIC'):
+        """
+        Creeaza contul cu parola hash-uita pe pool-ul de autentificare
+        """
+        return self.db.create_user(username, self.hash_password(password), role)
+
+    def login(self, username, password):
+        """
+        Verifica parola si emite un token de sesiune
+        Daca hash-ul stocat are alt cost decat cel configurat, este refacut cu parola tocmai verificata
+        Returneaza: Session(user_id, role, token, expires); ridica AuthError pentru credentiale gresite
+        Utilizatorul inexistent si parola gresita primesc acelasi mesaj, dupa aceeasi verificare bcrypt
+        """
+        res = self.db.find_user(username)
+        user_id, stored_hash, role = res or (None, self._dummy_hash.result(), None)
+        ok = self.pool.submit(bcrypt.checkpw, password.encode('utf-8'), stored_hash.encode('utf-8')).result()
+        if not (ok and res): raise AuthError("Utilizator sau parola incorecta!")
+        if hash_cost(stored_hash) != self.rounds:
+            # Esecul actualizarii nu blocheaza autentificarea; se reincearca la urmatorul login
+            try: self.db.update_password_hash(user_id, self.hash_password(password))
+            except Exception as e: log.warning("Hash-ul utilizatorului %s nu a putut fi actualizat: %s", user_id, e)
+        return self.issue_token(user_id, role)
+
+    def issue_token(self, user_id, role):
+        expires = int(time.time()) + self.ttl
+        payload = f"{user_id}.{role}.{expires}"
+        return Session(user_id, role, f"{payload}.{self._sign(payload)}", expires)
+
+    def verify_token(self, token):
+        """
+        Verificarea ieftina a unei sesiuni (HMAC-SHA256 + expirare)
+        Returneaza: (user_id, role); ridica AuthError daca token-ul este invalid sau expirat
+        """
+        try:
+            payload, signature = (token or "").rsplit(".", 1)
+            user_id, role, expires = payload.split(".")
+            user_id, expires = int(user_id), int(expires)
+        except ValueError:
+            raise AuthError("Token de sesiune invalid.") from None
+        if not hmac.compare_digest(signature, self._sign(payload)): raise AuthError("Token de sesiune invalid.")
+        if expires < time.time(): raise AuthError("Sesiunea a expirat, autentificati-va din nou.")
+        return user_id, role
+
+    def refresh(self, token):
+        """
+        Prelungeste o sesiune inca valida (doar HMAC); token_ttl devine astfel timpul maxim de inactivitate
+        Returneaza: Session noua; ridica AuthError daca token-ul este invalid sau expirat
+        """
+        return self.issue_token(*self.verify_token(token))
+
+    def require(self, token, role=None):
+        """
+        Ca verify_token, dar cere si un anumit rol (ex. 'ADMIN' pentru crearea conturilor)
+        """
+        user_id, actual = self.verify_token(token)
+        if role is not None and actual != role: raise AuthError(f"Operatie permisa doar pentru rolul {role}.")
+        return user_id, actual
+
+    def _sign(self, payload):
+        return _b64(hmac.new(self._key, payload.encode('utf-8'), hashlib.sha256).digest())
+
+    def close(self):
+        self.pool.shutdown(wait=False)
@@ -0,0 +1,334 @@
+##########################################################################
+#                                                                        #
+#  Copyright:   (c) 2026, Proiect MPS                                    #
+#  Autori:      Albu A. Sorin (R.Moldova) 1409A                          #
+#               Glavan P. Pavel (R.Moldova) 1409A                        #
+#               Duda I.I. Andrei-Ionuț 1409A                             #
+#               Jireadă C. Teodor 1409A                                  #
+#               Popovici I.L. Andrei 1409A                               #
+#               Noroc D. Sorin (R.Moldova) 1409A                         #
+#               Timofte C. Constantin 1409A                              #
+#               Matei I. Ion (R.Moldova) 1410B                           #
+#                                                                        #
+#  Descriere:   Sistem Expert pentru Predictia Bolilor Hepatice          #
+#               Utilizand algoritmii SVM si Multilayer Perceptron (MLP)  #
+#               Bazat pe setul de date ILPD (Indian Liver Patient)       #
+#                                                                        #
+#  Acest cod si informatiile sunt oferite "ca atare" fara nicio garantie #
+#  de orice fel, exprimata sau implicita. Acest proiect este realizat    #
+#  in scop didactic pentru disciplina Managementul Proiectelor Software. #
+#                                                                        #
+##########################################################################
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+from statistics import median
+from lazy import lazy_import
+from dataset import COLUMNS, FEATURES, LONG_NAMES
+from sqlite_db import SqliteConnection, SqliteDatabase
+from ml_logic import MLHandler
+from prediction_cache import PredictionCache
+from seeder import seed_chunk, seeder_config
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+joblib = lazy_import("joblib")
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+bench_config = {
+    'output': os.environ.get("BENCH_OUTPUT", "bench_results.json"),
+    'baseline': os.environ.get("BENCH_BASELINE", "bench_baseline.json"),
+    # Abaterea relativa acceptata fata de referinta inainte ca o metrica sa fie raportata ca regresie
+    'tolerance': float(os.environ.get("BENCH_TOLERANCE", "0.25")),
+    # Modelele livrate cu proiectul, copiate intr-un director temporar pentru fiecare rulare
+    'models_dir': os.path.join(PROJECT_DIR, "models"),
+    'splits': [0.20, 0.30, 0.40, 0.50],
+    'seed': 42,
+    'repeat': 5,
+    'single_calls': 50,
+    'batch_rows': 1000,
+    'train_rows': 583,
+    'seed_rows': 10000,
+    'history_rows': [10000, 100000, 1000000],
+    'page_size': 200
+}
+
+SECTIONS = ('predict', 'train', 'startup', 'seeder', 'history')
+
+def fixture_rows(n, seed=None):
+    """
+    Pacienti plauzibili si reproductibili: in jurul mediei de antrenare a modelelor livrate, valizi clinic
+    Etichetele sunt derivate din SVM-ul livrat, deci setul are aceeasi structura la fiecare rulare
+    Returneaza: DataFrame cu coloanele dataset.COLUMNS
+    """
+    sc = joblib.load(os.path.join(bench_config['models_dir'], "scaler_20.pkl"))
+    svm = joblib.load(os.path.join(bench_config['models_dir'], "svm_20.pkl"))
+    rng = np.random.default_rng(bench_config['seed'] if seed is None else seed)
+    X = np.abs(sc.mean_ + rng.standard_normal((n, sc.mean_.shape[0])) * sc.scale_ * 0.5)
+    X[:, 0] = np.clip(np.round(X[:, 0]), 4, 90)
+    X[:, 1] = rng.integers(0, 2, n)
+    X[:, 3] = np.minimum(X[:, 3], X[:, 2])
+    X[:, 4:7] = np.round(X[:, 4:7])
+    df = pd.DataFrame(X, columns=FEATURES)
+    # Proportia bolnavi/sanatosi a setului ILPD (~71% / 29%), ordonati dupa decizia SVM
+    dec = svm.decision_function((X - sc.mean_) / sc.scale_)
+    df['Dataset'] = (dec > np.quantile(dec, 0.29)).astype(int)
+    return df[COLUMNS]
+
+def timed(fn, repeat):
+    """
+    Ruleaza fn o data neinregistrat (incalzire), apoi de `repeat` ori; returneaza mediana in secunde
+    """
+    fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return median(samples)
+
+def metric(value, unit, better='lower'):
+    return {'value': float(value), 'unit': unit, 'better': better}
+
+def _workdir():
+    """
+    Director temporar cu o copie a modelelor livrate; rularile nu ating models/ al proiectului
+    """
+    path = tempfile.mkdtemp(prefix="ilpd-bench-")
+    os.makedirs(os.path.join(path, "models"))
+    for fname in os.listdir(bench_config['models_dir']):
+        if fname.endswith(".pkl"): shutil.copy(os.path.join(bench_config['models_dir'], fname), os.path.join(path, "models"))
+    return path
+
+def _handler(splits):
+    handler = MLHandler(splits)
+    # Cache-ul de predictii ar masura cautarea in dictionar, nu modelele
+    handler.predictions = PredictionCache(0)
+    if not handler.initialize_ml_logic(): raise RuntimeError("Modelele nu au putut fi incarcate.")
+    return handler
+
+def bench_predict(cfg):
+    """
+    Latenta unui singur pacient si a unui lot, pentru fiecare split si algoritm
+    """
+    handler = _handler(cfg['splits'])
+    X = fixture_rows(cfg['batch_rows'])[FEATURES].to_numpy()
+    results = {}
+    for split in cfg['splits']:
+        for algo in ('SVM', 'MLP'):
+            name = f"{algo}-{int(round(split * 100))}"
+            rows = iter(range(10 ** 9))
+            single = timed(lambda: [handler.predict_batch(X[next(rows) % len(X)], split, algo)
+                                    for _ in range(cfg['single_calls'])], cfg['repeat']) / cfg['single_calls']
+            batch = timed(lambda: handler.predict_batch(X, split, algo), cfg['repeat'])
+            results[f"predict.single.{name}"] = metric(single * 1000, 'ms')
+            results[f"predict.batch{len(X)}.{name}"] = metric(batch * 1000, 'ms')
+    return results
+
+def bench_train(cfg):
+    """
+    Durata train_split (SVM + MLP + salvare) pe setul reproductibil
+    """
+    handler = MLHandler(cfg['splits'])
+    df = fixture_rows(cfg['train_rows'])
+    results = {}
+    for split in cfg['splits']:
+        elapsed = timed(lambda: handler.train_split(df, split, MLHandler.artifact_paths(split)), 1)
+        results[f"train.{int(round(split * 100))}"] = metric(elapsed, 's')
+    return results
+
+STARTUP_CODE = """
+import sys, time, json
+start = time.perf_counter()
+sys.path.insert(0, {project!r})
+from ml_logic import MLHandler, FEATURES
+handler = MLHandler({splits!r})
+handler.initialize_ml_logic()
+row = {row!r}
+for split in {splits!r}:
+    for algo in ('SVM', 'MLP'): handler.predict_batch(row, split, algo)
+print(json.dumps({{'seconds': time.perf_counter() - start}}))
+"""
+
+def bench_startup(cfg):
+    """
+    Pornirea la rece: proces nou (importuri + inregistrare + prima predictie pe fiecare model)
+    Pornirea la cald: handler nou in procesul curent, cu bibliotecile deja importate
+    """
+    row = fixture_rows(1)[FEATURES].to_numpy()[0].tolist()
+    code = STARTUP_CODE.format(project=PROJECT_DIR, splits=cfg['splits'], row=row)
+    env = dict(os.environ, PREDICTION_CACHE_SIZE="0")
+
+    def cold():
+        proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+        if proc.returncode != 0: raise RuntimeError(f"Pornirea a esuat: {proc.stderr.strip().splitlines()[-1:]}")
+        return json.loads(proc.stdout.strip().splitlines()[-1])['seconds']
+
+    # Prima rulare exporta pachetele si completeaza registrul, ca masuratorile sa vada starea obisnuita
+    cold()
+    cold_s = median(cold() for _ in range(cfg['repeat']))
+
+    def warm():
+        handler = _handler(cfg['splits'])
+        for split in cfg['splits']:
+            for algo in ('SVM', 'MLP'): handler.predict_batch(row, split, algo)
+    return {'startup.cold': metric(cold_s, 's'), 'startup.warm': metric(timed(warm, cfg['repeat']), 's')}
+
+def bench_seeder(cfg):
+    """
+    Debitul seeder-ului (seed_chunk, loturi de seeder_config['batch_size']) pe baza locala
+    Bazele locale sunt create in directorul de lucru temporar al rularii
+    """
+    conn = SqliteConnection("seeder.db")
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO USERS (username, password_hash, role) VALUES (%s, %s, %s)", ('medic', 'x', 'MEDIC'))
+    medic_id = cursor.lastrowid
+    df = fixture_rows(cfg['seed_rows']).rename(columns=LONG_NAMES)
+    batch = seeder_config['batch_size']
+
+    start = time.perf_counter()
+    for offset in range(0, len(df), batch):
+        seed_chunk(cursor, df.iloc[offset:offset + batch], medic_id, prefix='BEN')
+        conn.commit()
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return {'seeder.rows_per_s': metric(len(df) / elapsed, 'rows/s', 'higher')}
+
+def _grow_history(conn, start, stop):
+    """
+    Adauga pacientii si predictiile cu id-urile start+1..stop (in afara masuratorii)
+    """
+    rng = np.random.default_rng(start)
+    step = 100000
+    cur = conn.raw.cursor()
+    for lo in range(start, stop, step):
+        hi = min(lo + step, stop)
+        ids = range(lo + 1, hi + 1)
+        cur.executemany("INSERT INTO PATIENTS (id, cnp_internal_id, full_name, gender, birth_date) VALUES (?, ?, ?, ?, ?)",
+                        [(i, f"BEN{i:010d}", f"Pacient_BEN_{i}", 'Male', '1970-01-01') for i in ids])
+        values = rng.random((hi - lo, 9)).tolist()
+        cur.executemany("INSERT INTO PREDICTIONS (id, patient_id, user_id, prediction_result, confidence_score, age, gender_val, "
+                        "total_bilirubin, direct_bilirubin, alkaline_phosphotase, alamine_aminotransferase, "
+                        "aspartate_aminotransferase, total_proteins, albumin, albumin_and_globulin_ratio) "
+                        "VALUES (?, ?, 1, ?, ?, 45, 1, ?, ?, 200, 30, 40, ?, ?, ?)",
+                        [(i, i, int(v[0] > 0.5), v[1], v[2] * 5, v[3] * 2, v[4] + 6, v[5] + 3, v[6] + 0.5)
+                         for i, v in zip(ids, values)])
+    conn.commit()
+
+def bench_history(cfg):
+    """
+    Paginarea istoricului (prima pagina, pagina mai veche si mai noua din mijloc) la fiecare volum din history_rows
+    """
+    path = "history.db"
+    conn = SqliteConnection(path)
+    conn.raw.execute("INSERT INTO USERS (id, username, password_hash, role) VALUES (1, 'medic', 'x', 'MEDIC')")
+    db = SqliteDatabase(path, pool_size=1)
+    results, size, limit = {}, 0, cfg['page_size']
+    for target in sorted(cfg['history_rows']):
+        _grow_history(conn, size, target)
+        size, middle = target, target // 2
+        for name, kwargs in (('first', {}), ('older', {'before_id': middle}), ('newer', {'after_id': middle})):
+            page = timed(lambda: db.fetch_history_page(limit, **kwargs), cfg['repeat'])
+            results[f"history.{name}.{target}"] = metric(page * 1000, 'ms')
+    db.close(); conn.close()
+    return results
+
+BENCHMARKS = {'predict': bench_predict, 'train': bench_train, 'startup': bench_startup,
+              'seeder': bench_seeder, 'history': bench_history}
+
+def run(sections=SECTIONS, progress=print, **overrides):
+    """
+    Ruleaza sectiunile cerute intr-un director temporar
+    Returneaza: {'meta': {...}, 'results': {nume: {value, unit, better}}}
+    """
+    cfg = dict(bench_config, **overrides)
+    import sklearn
+    meta = {'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"), 'python': platform.python_version(),
+            'platform': platform.platform(), 'numpy': np.__version__, 'sklearn': sklearn.__version__,
+            'sections': list(sections), 'config': {k: cfg[k] for k in ('repeat', 'batch_rows', 'train_rows',
+                                                                      'seed_rows', 'history_rows', 'seed')}}
+    results, cwd, work = {}, os.getcwd(), _workdir()
+    try:
+        os.chdir(work)
+        for name in sections:
+            progress(f"Benchmark {name}...")
+            results.update(BENCHMARKS[name](cfg))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work, ignore_errors=True)
+    return {'meta': meta, 'results': results}
+
+def compare(current, baseline, tolerance=None):
+    """
+    Compara rezultatele cu referinta; o metrica regreseaza daca se abate in directia proasta peste toleranta
+    Returneaza: lista {name, baseline, current, change, status} cu status ok / regresie / imbunatatire / nou
+    """
+    tolerance = bench_config['tolerance'] if tolerance is None else tolerance
+    rows = []
+    for name, cur in sorted(current['results'].items()):
+        base = baseline['results'].get(name)
+        if base is None or not base['value']:
+            rows.append({'name': name, 'baseline': None, 'current': cur['value'], 'change': None, 'status': 'nou'})
+            continue
+        change = cur['value'] / base['value'] - 1.0
+        worse = change if cur['better'] == 'lower' else -change
+        status = 'regresie' if worse > tolerance else 'imbunatatire' if worse < -tolerance else 'ok'
+        rows.append({'name': name, 'baseline': base['value'], 'current': cur['value'], 'change': change, 'status': status})
+    return rows
+
+def format_results(report):
+    lines = [f"{'Metrica':<32} {'Valoare':>12}  Unitate"]
+    for name, r in sorted(report['results'].items()):
+        lines.append(f"{name:<32} {r['value']:>12.3f}  {r['unit']}")
+    return "\n".join(lines)
+
+def format_comparison(rows, tolerance=None):
+    tolerance = bench_config['tolerance'] if tolerance is None else tolerance
+    lines = [f"{'Metrica':<32} {'Referinta':>12} {'Curent':>12} {'Diferenta':>10}  Stare (toleranta {tolerance:.0%})"]
+    for r in rows:
+        base = f"{r['baseline']:.3f}" if r['baseline'] is not None else "-"
+        change = f"{r['change']:+.1%}" if r['change'] is not None else "-"
+        lines.append(f"{r['name']:<32} {base:>12} {r['current']:>12.3f} {change:>10}  {r['status']}")
+    return "\n".join(lines)
+
+def write_json(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, 'w', encoding='utf-8') as f: json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark-uri de performanta (inferenta, antrenare, pornire, seeder, istoric)")
+    parser.add_argument("sections", nargs="*", help=f"sectiunile rulate, din {', '.join(SECTIONS)} (implicit toate)")
+    parser.add_argument("--output", default=bench_config['output'])
+    parser.add_argument("--baseline", default=bench_config['baseline'])
+    parser.add_argument("--compare", action="store_true", help="compara cu referinta; codul de iesire 2 la regresie")
+    parser.add_argument("--save-baseline", action="store_true", help="salveaza rezultatele ca noua referinta")
+    parser.add_argument("--tolerance", type=float, default=bench_config['tolerance'])
+    parser.add_argument("--repeat", type=int, default=bench_config['repeat'])
+    parser.add_argument("--history-rows", type=int, nargs="+", default=bench_config['history_rows'])
+    args = parser.parse_args()
+    unknown = set(args.sections) - set(SECTIONS)
+    if unknown: parser.error(f"Sectiuni necunoscute: {', '.join(sorted(unknown))}")
+    try:
+        report = run(args.sections or SECTIONS, repeat=args.repeat, history_rows=args.history_rows)
+        write_json(args.output, report)
+        print(format_results(report))
+        print(f"Rezultate scrise in {args.output}")
+        if args.save_baseline:
+            write_json(args.baseline, report)
+            print(f"Referinta actualizata: {args.baseline}")
+        if args.compare:
+            with open(args.baseline, encoding='utf-8') as f: baseline = json.load(f)
+            rows = compare(report, baseline, args.tolerance)
+            print(format_comparison(rows, args.tolerance))
+            if any(r['status'] == 'regresie' for r in rows): sys.exit(2)
+    except Exception as e:
+        print(f"Eroare: {e}")
+        sys.exit(1)
@@ -0,0 +1,157 @@
+##########################################################################
+#                                                                        #
+#  Copyright:   (c) 2026, Proiect MPS                                    #
+#  Autori:      Albu A. Sorin (R.Moldova) 1409A                          #
+#               Glavan P. Pavel (R.Moldova) 1409A                        #
+#               Duda I.I. Andrei-Ionuț 1409A                             #
+#               Jireadă C. Teodor 1409A                                  #
+#               Popovici I.L. Andrei 1409A                               #
+#               Noroc D. Sorin (R.Moldova) 1409A                         #
+#               Timofte C. Constantin 1409A                              #
+#               Matei I. Ion (R.Moldova) 1410B                           #
+#                                                                        #
+#  Descriere:   Sistem Expert pentru Predictia Bolilor Hepatice          #
+#               Utilizand algoritmii SVM si Multilayer Perceptron (MLP)  #
+#               Bazat pe setul de date ILPD (Indian Liver Patient)       #
+#                                                                        #
+#  Acest cod si informatiile sunt oferite "ca atare" fara nicio garantie #
+#  de orice fel, exprimata sau implicita. Acest proiect este realizat    #
+#  in scop didactic pentru disciplina Managementul Proiectelor Software. #
+#                                                                        #
+##########################################################################
+import os
+import sys
+import json
+import struct
+import argparse
+from lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# Formatul pachetului (un fisier per split):
+#   MAGIC (8 octeti) | versiune (uint32) | lungime antet (uint32) | antet JSON | tablouri brute
+# Fiecare tablou incepe la un offset aliniat la ALIGN octeti, deci poate fi mapat direct in memorie
+# si paginile sunt partajate intre toate procesele care deschid acelasi fisier
+MAGIC = b"ILPDBNDL"
+VERSION = 1
+ALIGN = 64
+PREFIX = struct.Struct("<8sII")
+
+class BundleError(Exception):
+    """
+    Fisierul nu este un pachet valid (magic, versiune sau antet necorespunzator)
+    """
+
+class ModelBundle:
+    """
+    Pachetul unui split deschis din disc: metadate + tablouri numpy mapate in memorie (doar citire)
+    """
+    def __init__(self, path, meta, arrays):
+        self.path = path
+        self.meta = meta
+        self.arrays = arrays
+
+    def __getitem__(self, name): return self.arrays[name]
+
+    def mlp_layers(self):
+        """
+        Returneaza lista (W, b) a straturilor MLP, in ordinea forward
+        """
+        return [(self.arrays[f"mlp_coef_{i}"], self.arrays[f"mlp_intercept_{i}"])
+                for i in range(self.meta['mlp']['layers'])]
+
+    @property
+    def nbytes(self): return sum(a.nbytes for a in self.arrays.values())
+
+def _align(offset): return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+def bundle_arrays(svm, mlp, scaler):
+    """
+    Extrage parametrii modelelor sklearn antrenate in tablouri numpy si metadate serializabile
+    """
+    if svm.kernel != 'rbf': raise BundleError(f"Kernel SVM nesuportat: {svm.kernel}")
+    arrays = {
+        'scaler_mean': scaler.mean_, 'scaler_scale': scaler.scale_,
+        'svm_support_vectors': svm.support_vectors_, 'svm_dual_coef': svm.dual_coef_,
+        'svm_intercept': svm.intercept_,
+        # Atributele private evita avertismentul de depreciere al probA_/probB_
+        'svm_probA': getattr(svm, '_probA', None), 'svm_probB': getattr(svm, '_probB', None),
+    }
+    for i, (W, b) in enumerate(zip(mlp.coefs_, mlp.intercepts_)):
+        arrays[f"mlp_coef_{i}"] = W; arrays[f"mlp_intercept_{i}"] = b
+    arrays = {k: np.ascontiguousarray(v, dtype=np.float64) for k, v in arrays.items() if v is not None and len(v)}
+    meta = {
+        'features': int(scaler.mean_.shape[0]),
+        'svm': {'gamma': float(svm._gamma), 'classes': [int(c) for c in svm.classes_],
+                'probability': 'svm_probA' in arrays},
+        'mlp': {'layers': len(mlp.coefs_), 'activation': mlp.activation,
+                'out_activation': mlp.out_activation_, 'classes': [int(c) for c in mlp.classes_]},
+    }
+    return arrays, meta
+
+def write_bundle(path, svm, mlp, scaler, meta=None):
+    """
+    Scrie pachetul atomic (fisier temporar + redenumire), cititorii vad fie vechiul, fie noul pachet
+    """
+    arrays, header = bundle_arrays(svm, mlp, scaler)
+    header.update(meta or {})
+    layout, offset = {}, 0
+    for name, arr in arrays.items():
+        offset = _align(offset)
+        layout[name] = {'offset': offset, 'dtype': arr.dtype.str, 'shape': list(arr.shape)}
+        offset += arr.nbytes
+    header['arrays'] = layout
+    raw = json.dumps(header, sort_keys=True).encode('utf-8')
+    # Zona de date incepe si ea aliniata, offseturile din antet sunt relative la inceputul ei
+    data_start = _align(PREFIX.size + len(raw))
+    raw = raw.ljust(data_start - PREFIX.size, b" ")
+
+    tmp = path + ".tmp"
+    with open(tmp, 'wb') as f:
+        f.write(PREFIX.pack(MAGIC, VERSION, len(raw)))
+        f.write(raw)
+        for name, arr in arrays.items():
+            f.seek(data_start + layout[name]['offset'])
+            f.write(arr.tobytes())
+        f.flush(); os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return path
+
+def read_bundle(path):
+    """
+    Deschide pachetul prin np.memmap: nu se copiaza date, timpul de incarcare nu depinde de marimea modelelor
+    """
+    with open(path, 'rb') as f: prefix = f.read(PREFIX.size)
+    if len(prefix) < PREFIX.size: raise BundleError(f"Pachet trunchiat: {path}")
+    magic, version, header_len = PREFIX.unpack(prefix)
+    if magic != MAGIC: raise BundleError(f"Fisierul nu este un pachet de modele: {path}")
+    if version != VERSION: raise BundleError(f"Versiune de pachet nesuportata: {version}")
+
+    mm = np.memmap(path, dtype=np.uint8, mode='r')
+    meta = json.loads(bytes(mm[PREFIX.size:PREFIX.size + header_len]))
+    data_start = PREFIX.size + header_len
+    arrays = {}
+    for name, spec in meta['arrays'].items():
+        dtype = np.dtype(spec['dtype'])
+        count = int(np.prod(spec['shape'], dtype=np.int64))
+        start = data_start + spec['offset']
+        if start + count * dtype.itemsize > mm.shape[0]: raise BundleError(f"Pachet trunchiat: {path}")
+        arrays[name] = mm[start:start + count * dtype.itemsize].view(dtype).reshape(spec['shape'])
+    return ModelBundle(path, meta, arrays)
+
+if __name__ == "__main__":
+    # Exporta pachetele din artefactele joblib existente (models/svm_XX.pkl, mlp_XX.pkl, scaler_XX.pkl)
+    from ml_logic import MLHandler
+
+    parser = argparse.ArgumentParser(description="Exporta pachetele de modele mapabile in memorie")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[0.20, 0.30, 0.40, 0.50])
+    args = parser.parse_args()
+    try:
+        handler = MLHandler(args.sizes)
+        for size in handler.initialize_ml_logic():
+            path = handler.export_bundle(size)
+            b = read_bundle(path)
+            print(f"Split {size}: {path} ({os.path.getsize(path)} octeti, {len(b.arrays)} tablouri)")
+    except Exception as e:
+        print(f"Eroare: {e}")
+        sys.exit(1)
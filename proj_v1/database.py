@@ -19,10 +19,344 @@
 #  in scop didactic pentru disciplina Managementul Proiectelor Software. #
 #                                                                        #
 ##########################################################################
+import os
+import time
+import queue
+import logging
+import threading
+from contextlib import contextmanager
+from lazy import lazy_import
+
+# Conectorul MySQL se incarca abia la prima conexiune
+mysql = lazy_import("mysql.connector")
+
+log = logging.getLogger(__name__)
+
 db_config = {
     'host': '127.0.0.1', 
     'port': 3309, 
     'user': 'user', 
     'password': 'user', 
     'database': 'liver_disease'
-}
\ No newline at end of file
+}
+
+storage_config = {
+    # 'mariadb' (serverul din docker-compose) sau 'sqlite' (fisier local, fara server)
+    'backend': os.environ.get("ILPD_DB_BACKEND", "mariadb"),
+    'sqlite_path': os.environ.get("ILPD_SQLITE_PATH", "liver_disease.db")
+}
+
+pool_config = {
+    # Numarul maxim de conexiuni deschise simultan catre MariaDB
+    'pool_size': 4,
+    # Timpul maxim (secunde) de asteptare dupa o conexiune libera
+    'timeout': 10
+}
+
+HISTORY_SELECT = "SELECT pr.id, p.full_name, p.cnp_internal_id, pr.prediction_result, pr.confidence_score FROM PREDICTIONS pr JOIN PATIENTS p ON p.id = pr.patient_id"
+
+# Interogarile fixe ale aplicatiei; fiecare este pregatita o singura data pe conexiune
+QUERIES = {
+    'find_user': "SELECT id, password_hash, role FROM USERS WHERE username=%s",
+    'create_user': "INSERT INTO USERS (username, password_hash, role) VALUES (%s, %s, %s)",
+    'update_password': "UPDATE USERS SET password_hash=%s WHERE id=%s",
+    'patient_id': "SELECT id FROM PATIENTS WHERE cnp_internal_id=%s",
+    # Jurnalul de predictii: pacientul inserat sau gasit intr-o singura instructiune (id-ul vine din LAST_INSERT_ID),
+    # iar o intrare deja scrisa (acelasi journal_id) este ignorata la reluare
+    'upsert_patient': "INSERT INTO PATIENTS (cnp_internal_id, full_name, gender, birth_date) VALUES (%s,%s,%s,%s) ON DUPLICATE KEY UPDATE id=LAST_INSERT_ID(id)",
+    'journal_prediction': "INSERT INTO PREDICTIONS (patient_id, user_id, prediction_result, confidence_score, age, gender_val, total_bilirubin, direct_bilirubin, alkaline_phosphotase, alamine_aminotransferase, aspartate_aminotransferase, total_proteins, albumin, albumin_and_globulin_ratio, model_version, journal_id) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s) ON DUPLICATE KEY UPDATE journal_id=journal_id",
+    # Istoricul este paginat dupa cheie (pr.id), fara OFFSET, deci costul nu creste cu pagina
+    'history_first': HISTORY_SELECT + " ORDER BY pr.id DESC LIMIT %s",
+    'history_older': HISTORY_SELECT + " WHERE pr.id < %s ORDER BY pr.id DESC LIMIT %s",
+    'history_newer': HISTORY_SELECT + " WHERE pr.id > %s ORDER BY pr.id ASC LIMIT %s",
+    # Estimare din statisticile motorului InnoDB, fara COUNT(*) pe tot tabelul
+    'history_estimate': "SELECT TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'PREDICTIONS'",
+    # Diagnosticul confirmat si randurile confirmate noi pentru re-antrenare (in ordinea coloanelor modelelor)
+    'confirm_prediction': "UPDATE PREDICTIONS SET confirmed_result=%s WHERE id=%s",
+    'confirmed_since': "SELECT id, age, gender_val, total_bilirubin, direct_bilirubin, alkaline_phosphotase, alamine_aminotransferase, aspartate_aminotransferase, total_proteins, albumin, albumin_and_globulin_ratio, confirmed_result FROM PREDICTIONS WHERE confirmed_result IS NOT NULL AND id > %s ORDER BY id LIMIT %s",
+    'confirmed_until': "SELECT id, age, gender_val, total_bilirubin, direct_bilirubin, alkaline_phosphotase, alamine_aminotransferase, aspartate_aminotransferase, total_proteins, albumin, albumin_and_globulin_ratio, confirmed_result FROM PREDICTIONS WHERE confirmed_result IS NOT NULL AND id > %s AND id <= %s ORDER BY id LIMIT %s",
+}
+
+def is_data_error(error):
+    """
+    Erori cauzate de datele trimise (constrangeri, valori prea lungi sau invalide), nu de conexiune:
+    reincercarea aceleiasi instructiuni ar esua la fel
+    Numele claselor DB-API sunt aceleasi in mysql.connector si sqlite3, deci niciun driver nu este importat aici
+    """
+    if isinstance(error, (KeyError, TypeError, ValueError)): return True
+    return any(cls.__name__ in ('IntegrityError', 'DataError') for cls in type(error).__mro__)
+
+class _PooledConnection:
+    """
+    Conexiune fizica din pool impreuna cu cursoarele pregatite (prepared statements) asociate
+    """
+    def __init__(self, raw):
+        self.raw = raw
+        self.cursors = {}
+
+    def cursor(self, name):
+        if name not in self.cursors: self.cursors[name] = self.raw.cursor(prepared=True)
+        return self.cursors[name]
+
+    def batch_cursor(self):
+        # Cursorul obisnuit rescrie executemany pe INSERT ... VALUES intr-o singura instructiune cu mai multe randuri
+        if None not in self.cursors: self.cursors[None] = self.raw.cursor()
+        return self.cursors[None]
+
+    def close(self):
+        try: self.raw.close()
+        except Exception: pass
+
+class Database:
+    """
+    Strat de acces la date: pool de conexiuni reutilizate, interogari pregatite si timpi per interogare
+    Implementarea MariaDB; SqliteDatabase (sqlite_db.py) ofera aceleasi operatii peste un fisier local
+    """
+    queries = QUERIES
+
+    def __init__(self, config=None, pool_size=None):
+        self.config = config or db_config
+        self.pool_size = pool_size or pool_config['pool_size']
+        self.query_stats = {}
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self):
+        """
+        Imprumuta o conexiune din pool; la iesire tranzactia este confirmata sau anulata
+        si conexiunea revine in pool (sau este inchisa daca a aparut o eroare de retea)
+        """
+        if not self._slots.acquire(timeout=pool_config['timeout']):
+            raise RuntimeError("Nu exista conexiuni libere la baza de date.")
+        conn = None
+        try:
+            conn = self._checkout()
+            yield conn
+            conn.raw.commit()
+            self._idle.put(conn)
+        except Exception:
+            if conn is not None:
+                try:
+                    conn.raw.rollback()
+                    self._idle.put(conn)
+                except Exception:
+                    conn.close()
+            raise
+        finally:
+            self._slots.release()
+
+    def _checkout(self):
+        while True:
+            try: conn = self._idle.get_nowait()
+            except queue.Empty: return _PooledConnection(self._connect())
+            # Conexiunile ramase inactive pot fi inchise de server intre timp
+            if conn.raw.is_connected(): return conn
+            conn.close()
+
+    def _connect(self):
+        return mysql.connector.connect(**self.config)
+
+    def execute(self, conn, name, params=(), fetch=None):
+        """
+        Ruleaza interogarea pregatita `name` si inregistreaza durata ei
+        fetch: None, 'one' sau 'all'
+        """
+        start = time.perf_counter()
+        cursor = conn.cursor(name)
+        cursor.execute(self.queries[name], params)
+        if fetch == 'one':
+            # Se citeste tot rezultatul pentru ca acelasi cursor sa poata fi refolosit imediat
+            rows = cursor.fetchall()
+            result = rows[0] if rows else None
+        elif fetch == 'all': result = cursor.fetchall()
+        else: result = cursor.lastrowid
+        self._record(name, time.perf_counter() - start)
+        return result
+
+    def execute_many(self, conn, name, rows):
+        """
+        Ruleaza interogarea de inserare `name` pentru toate randurile intr-un singur drum la server
+        """
+        start = time.perf_counter()
+        cursor = conn.batch_cursor()
+        cursor.executemany(self.queries[name], rows)
+        self._record(name, time.perf_counter() - start)
+        return cursor.rowcount
+
+    def _record(self, name, elapsed):
+        with self._lock:
+            st = self.query_stats.setdefault(name, {'count': 0, 'total': 0.0, 'max': 0.0})
+            st['count'] += 1; st['total'] += elapsed; st['max'] = max(st['max'], elapsed)
+        log.debug("Interogare %s: %.2f ms", name, elapsed * 1000)
+
+    def timings(self):
+        """
+        Returneaza pentru fiecare interogare numarul de executii si durata medie/maxima (ms)
+        """
+        with self._lock:
+            return {name: {'count': st['count'], 'mean_ms': st['total'] / st['count'] * 1000,
+                           'max_ms': st['max'] * 1000} for name, st in self.query_stats.items()}
+
+    def close(self):
+        while True:
+            try: self._idle.get_nowait().close()
+            except queue.Empty: return
+
+    # --- Operatiile folosite de interfata ---
+
+    def find_user(self, username):
+        """
+        Returneaza (id, password_hash, role) sau None daca utilizatorul nu exista
+        """
+        with self.connection() as conn:
+            row = self.execute(conn, 'find_user', (username,), fetch='one')
+        if row is None: return None
+        return tuple(v.decode('utf-8') if isinstance(v, (bytes, bytearray)) else v for v in row)
+
+    def create_user(self, username, password_hash, role='MEDIC'):
+        with self.connection() as conn:
+            return self.execute(conn, 'create_user', (username, password_hash, role))
+
+    def update_password_hash(self, user_id, password_hash):
+        with self.connection() as conn:
+            self.execute(conn, 'update_password', (password_hash, user_id))
+
+    def upsert_patient(self, conn, patient):
+        """
+        Insereaza pacientul sau il gaseste dupa CNP, intr-un singur drum la server
+        Returneaza: id-ul pacientului
+        """
+        return self.execute(conn, 'upsert_patient', tuple(patient))
+
+    def save_journal_batch(self, entries):
+        """
+        Singura cale de scriere a predictiilor (vezi journal.py)
+        Scrie un lot din jurnalul de predictii intr-o singura tranzactie: un upsert per pacient distinct
+        si o singura inserare in lot a predictiilor; intrarile deja scrise (acelasi journal_id) sunt ignorate
+        entries: dictionare {journal_id, patient, user_id, result, confidence, clin, model_version}
+        """
+        with self.connection() as conn:
+            ids = {}
+            for e in entries:
+                cnp = e['patient'][0]
+                if cnp not in ids: ids[cnp] = self.upsert_patient(conn, e['patient'])
+            rows = [(ids[e['patient'][0]], e['user_id'], int(e['result']), float(e['confidence']), e['clin'][0], e['clin'][1],
+                     *e['clin'][2:], e['model_version'], e['journal_id']) for e in entries]
+            return self.execute_many(conn, 'journal_prediction', rows)
+
+    def fetch_history_page(self, limit, before_id=None, after_id=None):
+        """
+        Returneaza o pagina de istoric (id, nume, cnp, rezultat, incredere), mereu in ordine descrescatoare a id-ului
+        before_id: predictiile mai vechi decat id-ul dat; after_id: cele mai noi decat id-ul dat
+        """
+        with self.connection() as conn:
+            if after_id is not None:
+                return self.execute(conn, 'history_newer', (after_id, limit), fetch='all')[::-1]
+            if before_id is not None:
+                return self.execute(conn, 'history_older', (before_id, limit), fetch='all')
+            return self.execute(conn, 'history_first', (limit,), fetch='all')
+
+    def confirm_prediction(self, prediction_id, result):
+        """
+        Inregistreaza diagnosticul confirmat clinic (1 = boala, 0 = sanatos) pentru o predictie
+        """
+        with self.connection() as conn:
+            self.execute(conn, 'confirm_prediction', (result, prediction_id))
+
+    def fetch_confirmed(self, after_id, limit, until_id=None):
+        """
+        Returneaza predictiile confirmate cu id > after_id (si <= until_id), crescator dupa id
+        Randul: (id, cele 10 valori clinice, diagnostic confirmat)
+        """
+        with self.connection() as conn:
+            if until_id is not None:
+                return self.execute(conn, 'confirmed_until', (after_id, until_id, limit), fetch='all')
+            return self.execute(conn, 'confirmed_since', (after_id, limit), fetch='all')
+
+    def estimate_history_count(self):
+        with self.connection() as conn:
+            row = self.execute(conn, 'history_estimate', fetch='one')
+        return int(row[0] or 0) if row else 0
+
+def open_database(backend=None, pool_size=None):
+    """
+    Construieste stratul de date ales prin storage_config (sau ILPD_DB_BACKEND)
+    """
+    backend = backend or storage_config['backend']
+    if backend == 'mariadb': return Database(db_config, pool_size)
+    if backend == 'sqlite':
+        from sqlite_db import SqliteDatabase
+        return SqliteDatabase(storage_config['sqlite_path'], pool_size)
+    raise ValueError(f"Backend de stocare necunoscut: {backend}")
+
+def connect(backend=None):
+    """
+    O conexiune directa (fara pool), pentru scripturile de populare: seeder si generatorul sintetic
+    """
+    backend = backend or storage_config['backend']
+    if backend == 'mariadb': return mysql.connector.connect(**db_config)
+    if backend == 'sqlite':
+        from sqlite_db import SqliteConnection
+        return SqliteConnection(storage_config['sqlite_path'])
+    raise ValueError(f"Backend de stocare necunoscut: {backend}")
+
+class HistoryPager:
+    """
+    Fereastra glisanta de pagini de istoric: tine in memorie cel mult max_pages pagini
+    si spune interfetei ce randuri sa adauge sau sa elimine la derulare
+    """
+    def __init__(self, db, page_size=200, max_pages=5):
+        self.db = db
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.pages = []
+        self.at_newest = True
+        self.at_oldest = False
+
+    def rows(self):
+        return [row for page in self.pages for row in page]
+
+    def reset(self):
+        """
+        Incarca prima pagina (cele mai noi predictii)
+        Returneaza: randurile de afisat
+        """
+        page = list(self.db.fetch_history_page(self.page_size))
+        self.pages = [page] if page else []
+        self.at_newest = True
+        self.at_oldest = len(page) < self.page_size
+        return page
+
+    def older(self):
+        """
+        Incarca pagina urmatoare la capatul de jos al ferestrei
+        Returneaza: (randuri adaugate la final, randuri eliminate de la inceput)
+        """
+        if self.at_oldest or not self.pages: return [], []
+        page = list(self.db.fetch_history_page(self.page_size, before_id=self.pages[-1][-1][0]))
+        self.at_oldest = len(page) < self.page_size
+        if not page: return [], []
+        self.pages.append(page)
+        dropped = []
+        if len(self.pages) > self.max_pages:
+            dropped = self.pages.pop(0)
+            self.at_newest = False
+        return page, dropped
+
+    def newer(self):
+        """
+        Reincarca pagina anterioara la capatul de sus al ferestrei, dupa ce a fost eliminata
+        Returneaza: (randuri adaugate la inceput, randuri eliminate de la final)
+        """
+        if self.at_newest or not self.pages: return [], []
+        page = list(self.db.fetch_history_page(self.page_size, after_id=self.pages[0][0][0]))
+        self.at_newest = len(page) < self.page_size
+        if not page: return [], []
+        self.pages.insert(0, page)
+        dropped = []
+        if len(self.pages) > self.max_pages:
+            dropped = self.pages.pop()
+            self.at_oldest = False
+        return page, dropped
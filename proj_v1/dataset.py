@@ -0,0 +1,170 @@
+##########################################################################
+#                                                                        #
+#  Copyright:   (c) 2026, Proiect MPS                                    #
+#  Autori:      Albu A. Sorin (R.Moldova) 1409A                          #
+#               Glavan P. Pavel (R.Moldova) 1409A                        #
+#               Duda I.I. Andrei-Ionuț 1409A                             #
+#               Jireadă C. Teodor 1409A                                  #
+#               Popovici I.L. Andrei 1409A                               #
+#               Noroc D. Sorin (R.Moldova) 1409A                         #
+#               Timofte C. Constantin 1409A                              #
+#               Matei I. Ion (R.Moldova) 1410B                           #
+#                                                                        #
+#  Descriere:   Sistem Expert pentru Predictia Bolilor Hepatice          #
+#               Utilizand algoritmii SVM si Multilayer Perceptron (MLP)  #
+#               Bazat pe setul de date ILPD (Indian Liver Patient)       #
+#                                                                        #
+#  Acest cod si informatiile sunt oferite "ca atare" fara nicio garantie #
+#  de orice fel, exprimata sau implicita. Acest proiect este realizat    #
+#  in scop didactic pentru disciplina Managementul Proiectelor Software. #
+#                                                                        #
+##########################################################################
+import os
+import sys
+import json
+import hashlib
+from lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+COLUMNS = ['Age', 'Gender', 'TB', 'DB', 'Alk', 'Sgpt', 'Sgot', 'TP', 'ALB', 'AG', 'Dataset']
+FEATURES = COLUMNS[:-1]
+
+# Numele lungi folosite de seeder si de scriptul de analiza
+LONG_NAMES = {
+    'TB': 'Total_Bilirubin', 'DB': 'Direct_Bilirubin', 'Alk': 'Alkaline_Phosphotase',
+    'Sgpt': 'Alamine_Aminotransferase', 'Sgot': 'Aspartate_Aminotransferase',
+    'TP': 'Total_Proteins', 'ALB': 'Albumin', 'AG': 'Albumin_and_Globulin_Ratio'
+}
+
+dataset_config = {
+    'url': "https://archive.ics.uci.edu/ml/machine-learning-databases/00225/Indian%20Liver%20Patient%20Dataset%20(ILPD).csv",
+    'cache_dir': os.environ.get("ILPD_CACHE_DIR", "cache"),
+    # Pe statiile fara internet se seteaza ILPD_OFFLINE=1, setul fiind servit doar din cache
+    'offline': os.environ.get("ILPD_OFFLINE", "0") == "1",
+    # Suma de control asteptata (optional); daca e setata, orice alt continut este respins
+    'sha256': os.environ.get("ILPD_SHA256") or None
+}
+
+# Copie in memorie a setului deja incarcat, pentru apelurile repetate din acelasi proces
+_loaded = {}
+
+class DatasetError(Exception):
+    """
+    Setul de date nu poate fi obtinut (offline fara cache sau suma de control invalida)
+    """
+
+def _digest(values):
+    """
+    Calculeaza amprenta SHA-256 a matricei curatate si codificate
+    Prima coloana a matricei este numarul randului din fisierul brut
+    """
+    h = hashlib.sha256()
+    h.update(",".join(['row'] + COLUMNS).encode('utf-8'))
+    h.update(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+    return h.hexdigest()
+
+def _manifest_path(cache_dir):
+    return os.path.join(cache_dir, "ilpd.json")
+
+def _fetch(source):
+    """
+    Citeste CSV-ul brut (URL sau fisier local), elimina randurile incomplete si codifica etichetele
+    Returneaza: np.ndarray cu numarul randului original urmat de coloanele COLUMNS
+    """
+    df = pd.read_csv(source, names=COLUMNS, header=None).dropna()
+    df['Gender'] = df['Gender'].map({'Female': 0, 'Male': 1})
+    df['Dataset'] = df['Dataset'].map({1: 1, 2: 0})
+    df = df.dropna().astype(np.float64)
+    return np.column_stack([df.index.to_numpy(dtype=np.float64), df.to_numpy()])
+
+def _read_cache(cache_dir):
+    """
+    Incarca matricea din cache si verifica suma de control din manifest
+    Returneaza: (sha256, np.ndarray) sau None daca nu exista un cache valid
+    """
+    path = _manifest_path(cache_dir)
+    if not os.path.exists(path): return None
+    try:
+        with open(path, encoding='utf-8') as f: manifest = json.load(f)
+        values = np.load(os.path.join(cache_dir, manifest['file']), allow_pickle=False)
+    except Exception as e:
+        print(f"Cache ILPD ilizibil: {e}")
+        return None
+    if _digest(values) != manifest['sha256']:
+        print("Cache ILPD corupt (suma de control nu corespunde), se ignora.")
+        return None
+    return manifest['sha256'], values
+
+def _write_cache(cache_dir, sha, values, source):
+    """
+    Salveaza matricea sub un nume derivat din continut si actualizeaza manifestul
+    Esecul scrierii nu este fatal, setul ramane disponibil in memorie
+    """
+    try:
+        if not os.path.exists(cache_dir): os.makedirs(cache_dir)
+        fname = f"ilpd-{sha[:16]}.npy"
+        tmp = os.path.join(cache_dir, fname + ".tmp")
+        with open(tmp, 'wb') as f: np.save(f, values, allow_pickle=False)
+        os.replace(tmp, os.path.join(cache_dir, fname))
+        manifest = {'sha256': sha, 'file': fname, 'rows': int(values.shape[0]),
+                    'columns': ['row'] + COLUMNS, 'source': str(source)}
+        tmp = _manifest_path(cache_dir) + ".tmp"
+        with open(tmp, 'w', encoding='utf-8') as f: json.dump(manifest, f, indent=2)
+        os.replace(tmp, _manifest_path(cache_dir))
+    except Exception as e:
+        print(f"Nu s-a putut scrie cache-ul ILPD: {e}")
+
+def _to_frame(values):
+    """
+    Reconstruieste DataFrame-ul pastrand indexul randurilor din fisierul brut
+    """
+    return pd.DataFrame(values[:, 1:].copy(), columns=COLUMNS, index=values[:, 0].astype(np.int64))
+
+def load_dataset(offline=None, source=None, refresh=False):
+    """
+    Punctul unic de acces la setul ILPD curatat si codificat (Gender 0/1, Dataset 1=boala 0=sanatos)
+    Descarca setul o singura data, apoi il serveste din cache-ul local
+    Returneaza: DataFrame cu coloanele COLUMNS
+    """
+    cfg = dataset_config
+    offline = cfg['offline'] if offline is None else offline
+    cache_dir = cfg['cache_dir']
+
+    if not refresh and cache_dir in _loaded:
+        return _to_frame(_loaded[cache_dir][1])
+
+    cached = None if refresh else _read_cache(cache_dir)
+    if cached is None:
+        if offline and source is None:
+            raise DatasetError(f"Mod offline activ si nu exista cache ILPD valid in '{cache_dir}'.")
+        source = source or cfg['url']
+        values = _fetch(source)
+        sha = _digest(values)
+        if cfg['sha256'] and sha != cfg['sha256']:
+            raise DatasetError(f"Suma de control ILPD neasteptata: {sha}")
+        _write_cache(cache_dir, sha, values, source)
+        cached = sha, values
+    elif cfg['sha256'] and cached[0] != cfg['sha256']:
+        raise DatasetError(f"Cache-ul ILPD nu corespunde sumei de control configurate: {cached[0]}")
+
+    _loaded[cache_dir] = cached
+    return _to_frame(cached[1])
+
+def dataset_hash(offline=None):
+    """
+    Returneaza amprenta SHA-256 a setului curent (incarcandu-l daca e necesar)
+    """
+    load_dataset(offline=offline)
+    return _loaded[dataset_config['cache_dir']][0]
+
+if __name__ == "__main__":
+    # Pre-populeaza cache-ul: fara argumente descarca de la UCI, altfel importa un CSV local
+    try:
+        src = sys.argv[1] if len(sys.argv) > 1 else None
+        df = load_dataset(source=src, refresh=True)
+        print(f"Set ILPD in cache: {df.shape[0]} randuri, sha256={dataset_hash()}")
+    except Exception as e:
+        print(f"Eroare: {e}")
+        sys.exit(1)
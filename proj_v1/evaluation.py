@@ -0,0 +1,168 @@
+##########################################################################
+#                                                                        #
+#  Copyright:   (c) 2026, Proiect MPS                                    #
+#  Autori:      Albu A. Sorin (R.Moldova) 1409A                          #
+#               Glavan P. Pavel (R.Moldova) 1409A                        #
+#               Duda I.I. Andrei-Ionuț 1409A                             #
+#               Jireadă C. Teodor 1409A                                  #
+#               Popovici I.L. Andrei 1409A                               #
+#               Noroc D. Sorin (R.Moldova) 1409A                         #
+#               Timofte C. Constantin 1409A                              #
+#               Matei I. Ion (R.Moldova) 1410B                           #
+#                                                                        #
+#  Descriere:   Sistem Expert pentru Predictia Bolilor Hepatice          #
+#               Utilizand algoritmii SVM si Multilayer Perceptron (MLP)  #
+#               Bazat pe setul de date ILPD (Indian Liver Patient)       #
+#                                                                        #
+#  Acest cod si informatiile sunt oferite "ca atare" fara nicio garantie #
+#  de orice fel, exprimata sau implicita. Acest proiect este realizat    #
+#  in scop didactic pentru disciplina Managementul Proiectelor Software. #
+#                                                                        #
+##########################################################################
+import os
+import json
+import hashlib
+import logging
+import threading
+from dataset import load_dataset, dataset_hash, dataset_config
+
+log = logging.getLogger(__name__)
+
+evaluation_config = {
+    'cache_dir': os.path.join(dataset_config['cache_dir'], "evaluation")
+}
+
+# Amprentele fisierelor, refolosite cat timp (mtime, dimensiune) nu se schimba
+_file_hashes = {}
+
+def file_sha256(path):
+    """
+    Calculeaza SHA-256 pentru un artefact, recalculand doar daca fisierul s-a modificat
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _file_hashes.get(path)
+    if cached and cached[0] == stamp: return cached[1]
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""): h.update(block)
+    _file_hashes[path] = (stamp, h.hexdigest())
+    return _file_hashes[path][1]
+
+def report_key(data_sha, artifact_paths):
+    """
+    Cheia raportului: amprenta setului de date plus amprentele tuturor artefactelor modelelor
+    artifact_paths: {split: {'SVM': cale, 'MLP': cale, 'SC': cale}}
+    """
+    h = hashlib.sha256(data_sha.encode('utf-8'))
+    for size in sorted(artifact_paths):
+        for name in sorted(artifact_paths[size]):
+            h.update(f"{size}:{name}:{file_sha256(artifact_paths[size][name])}".encode('utf-8'))
+    return h.hexdigest()
+
+def compute_report(df, models_data, test_sizes):
+    """
+    Calculeaza statisticile descriptive si metricile fiecarui model (split, algoritm) pe intregul set
+    Returneaza: dictionar serializabil JSON
+    """
+    from sklearn.metrics import confusion_matrix, accuracy_score, precision_score, recall_score, f1_score
+    X_all = df.drop('Dataset', axis=1); Y_all = df['Dataset']
+    desc = X_all.describe().T[['mean', 'std', 'min', 'max']]
+    desc['variance'] = desc['std'] ** 2
+    report = {'describe': {idx: {k: float(row[k]) for k in ('mean', 'variance', 'min', 'max')}
+                           for idx, row in desc.iterrows()},
+              'models': []}
+    for sz in test_sizes:
+        data = models_data[sz]
+        X_scaled = data['SCALER'].transform(X_all)
+        for name in ['SVM', 'MLP']:
+            y_pred = data[name].predict(X_scaled)
+            report['models'].append({
+                'split': sz, 'model': name,
+                'accuracy': float(accuracy_score(Y_all, y_pred)),
+                'precision': float(precision_score(Y_all, y_pred, zero_division=0)),
+                'recall': float(recall_score(Y_all, y_pred, zero_division=0)),
+                'f1': float(f1_score(Y_all, y_pred, zero_division=0)),
+                'confusion': confusion_matrix(Y_all, y_pred, labels=[0, 1]).tolist()
+            })
+    return report
+
+class EvaluationCache:
+    """
+    Rapoarte de evaluare pastrate pe disc si in memorie, cheiate dupa setul de date si artefactele modelelor
+    Orice re-antrenare schimba amprenta artefactelor si deci cheia, invalidand raportul vechi
+    """
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or evaluation_config['cache_dir']
+        self._memory = {}
+        self._lock = threading.Lock()
+
+    def key_for(self, handler):
+        return report_key(dataset_hash(), {sz: handler.artifact_paths(sz) for sz in handler.test_sizes})
+
+    def get(self, key):
+        with self._lock:
+            if key in self._memory: return self._memory[key]
+        path = os.path.join(self.cache_dir, f"{key}.json")
+        if not os.path.exists(path): return None
+        try:
+            with open(path, encoding='utf-8') as f: report = json.load(f)
+        except Exception as e:
+            log.warning("Raport de evaluare ilizibil %s: %s", path, e)
+            return None
+        with self._lock: self._memory[key] = report
+        return report
+
+    def put(self, key, report):
+        """
+        Salveaza raportul (scriere atomica) si sterge rapoartele vechi, devenite invalide
+        """
+        with self._lock: self._memory = {key: report}
+        try:
+            if not os.path.exists(self.cache_dir): os.makedirs(self.cache_dir)
+            tmp = os.path.join(self.cache_dir, f"{key}.json.tmp")
+            with open(tmp, 'w', encoding='utf-8') as f: json.dump(report, f)
+            os.replace(tmp, os.path.join(self.cache_dir, f"{key}.json"))
+            for fname in os.listdir(self.cache_dir):
+                if fname.endswith(".json") and fname != f"{key}.json":
+                    os.remove(os.path.join(self.cache_dir, fname))
+        except Exception as e:
+            log.warning("Nu s-a putut salva raportul de evaluare: %s", e)
+
+    def refresh(self, handler):
+        """
+        Recalculeaza si salveaza raportul pentru artefactele curente (apelata dupa antrenare)
+        """
+        key = self.key_for(handler)
+        report = compute_report(load_dataset(), handler.models_data, handler.test_sizes)
+        self.put(key, report)
+        return report
+
+    def get_or_compute(self, handler):
+        """
+        Returneaza raportul din cache daca artefactele si setul de date nu s-au schimbat, altfel il recalculeaza
+        """
+        report = self.get(self.key_for(handler))
+        return report if report is not None else self.refresh(handler)
+
+def format_report(report):
+    """
+    Formateaza raportul ca text pentru fereastra de statistici
+    """
+    text = "A. STATISTICI DESCRIPTIVE\n"
+    text += f"{'Atribut':<15} | {'Media':<8} | {'Var':<8} | {'Min':<6} | {'Max':<6}\n" + "-"*55 + "\n"
+    for idx, row in report['describe'].items():
+        text += f"{idx:<15} | {row['mean']:.2f} | {row['variance']:.2f} | {row['min']:.1f} | {row['max']:.1f}\n"
+
+    text += "\nB. PERFORMANTA MODELE\n"
+    text += f"{'SPLIT':<10} | {'MDL':<5} | {'ACC':<7} | {'PREC':<7} | {'REC':<7} | {'F1':<7}\n" + "-"*60 + "\n"
+    for m in report['models']:
+        sz = m['split']
+        text += (f"{int(round((1-sz)*100))}/{int(round(sz*100)):<7} | {m['model']:<5} | {m['accuracy']:.4f} | "
+                 f"{m['precision']:.4f} | {m['recall']:.4f} | {m['f1']:.4f}\n")
+
+    text += "\nC. MATRICE DE CONFUZIE (randuri = real 0/1, coloane = prezis 0/1)\n"
+    for m in report['models']:
+        (tn, fp), (fn, tp) = m['confusion']
+        text += f"{int(round((1-m['split'])*100))}/{int(round(m['split']*100))} {m['model']:<4}: [[{tn}, {fp}], [{fn}, {tp}]]\n"
+    return text
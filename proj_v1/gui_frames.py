@@ -19,22 +19,41 @@
 #  in scop didactic pentru disciplina Managementul Proiectelor Software. #
 #                                                                        #
 ##########################################################################
-import bcrypt
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk 
-import mysql.connector
 import subprocess
 import os
-import numpy as np
-import pandas as pd
-from sklearn.metrics import confusion_matrix, accuracy_score, precision_score, recall_score, f1_score
-from utils import validate_patient_data, calculate_age_from_dob
+from utils import validate_patient_data, validate_patient_batch, calculate_age_from_dob
+from evaluation import format_report
+from database import HistoryPager
+from workers import BusyIndicator, QueueFullError
+from auth import AuthError
+from ml_logic import to_feature_matrix
+from retrain import Retrainer
+from lazy import lazy_import
+
+# numpy/pandas sunt necesare doar la importul CSV, nu la afisarea ferestrelor
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
 
 # Setari pentru aspectul vizual al interfetei grafice
 ctk.set_appearance_mode("System")
 ctk.set_default_color_theme("blue")
 
+def journal_status(stats):
+    """
+    Textul si culoarea starii jurnalului de predictii afisate in meniu ("" cand totul a ajuns in baza de date)
+    """
+    if stats['rejected']:
+        return (f"{stats['rejected']} predictii respinse de baza de date (vezi jurnalul .dead): "
+                f"{stats['last_rejected']}", "red")
+    if stats['last_error']:
+        return (f"Baza de date indisponibila: {stats['pending']} predictii pastrate pe disc, "
+                f"se reincearca automat ({stats['last_error']})", "orange")
+    if stats['pending']: return f"{stats['pending']} predictii in curs de salvare...", "gray"
+    return "", "gray"
+
 class LoginFrame(ctk.CTkFrame):
     """
     Gestioneaza interfata de autentificare si validarea credentialelor utilizatorilor
@@ -56,32 +75,36 @@ class LoginFrame(ctk.CTkFrame):
         self.p = ctk.CTkEntry(container, show="*", width=200)
         self.p.grid(row=1, column=1, pady=10, padx=10)
 
-        ctk.CTkButton(self, text="Login", command=self.login).pack(pady=30)
+        self.login_btn = ctk.CTkButton(self, text="Login", command=self.login)
+        self.login_btn.pack(pady=30)
 
     def login(self):
         """
         Verifica utilizatorul si parola in baza de date si initiaza sesiunea
+        Interogarea ruleaza pe un fir de lucru, iar bcrypt pe pool-ul AuthService; interfata ramane responsiva
         Returneaza: None, dar schimba frame-ul curent daca autentificarea reuseste
         """
-        user_input = self.u.get()
-        pass_input = self.p.get()
         try:
-            # Se conecteaza la baza de date si cauta hash-ul parolei
-            conn = mysql.connector.connect(**self.controller.db_config)
-            cursor = conn.cursor()
-            cursor.execute("SELECT id, password_hash, role FROM USERS WHERE username=%s", (user_input,))
-            res = cursor.fetchone()
-            conn.close()
-
-            if res:
-                user_id, stored_hash, role = res
-                if bcrypt.checkpw(pass_input.encode('utf-8'), stored_hash.encode('utf-8')):
-                    self.controller.logged_user_id = user_id
-                    self.controller.logged_user_role = role
-                    self.controller.show_frame("DashboardFrame")
-                else: messagebox.showerror("Eroare", "Parola incorecta!")
-            else: messagebox.showerror("Eroare", "Utilizator inexistent!")
-        except Exception as e: messagebox.showerror("Eroare DB", str(e))
+            self.controller.tasks.submit(self.authenticate, self.u.get(), self.p.get(),
+                                         on_done=self.on_login, on_error=self.on_login_error,
+                                         busy=BusyIndicator(self.login_btn, "Se verifica..."))
+        except QueueFullError as e: messagebox.showwarning("Ocupat", str(e))
+
+    def authenticate(self, user_input, pass_input):
+        """
+        Ruleaza pe firul de lucru: verifica parola (cu actualizarea costului bcrypt, daca e cazul)
+        Returneaza: Session; ridica AuthError (ValueError) pentru credentiale gresite
+        """
+        return self.controller.auth.login(user_input, pass_input)
+
+    def on_login(self, session):
+        self.controller.session = session
+        self.controller.logged_user_id, self.controller.logged_user_role = session.user_id, session.role
+        self.controller.show_frame("DashboardFrame")
+
+    def on_login_error(self, error):
+        if isinstance(error, ValueError): messagebox.showerror("Eroare", str(error))
+        else: messagebox.showerror("Eroare DB", str(error))
 
 class DashboardFrame(ctk.CTkFrame):
     """
@@ -102,7 +125,17 @@ class DashboardFrame(ctk.CTkFrame):
 
         self.admin_btn = ctk.CTkButton(self, text="Gestionare Medici (ADMIN)", fg_color="darkred", hover_color="red", command=lambda: controller.show_frame("AdminUserFrame"), **btn_style)
 
-        ctk.CTkButton(self, text="Delogare", fg_color="gray", command=lambda: controller.show_frame("LoginFrame"), **btn_style).pack(pady=30)
+        ctk.CTkButton(self, text="Delogare", fg_color="gray", command=controller.logout, **btn_style).pack(pady=30)
+
+        # Starea salvarii predictiilor (jurnalul local -> baza de date), actualizata periodic
+        self.journal_lbl = ctk.CTkLabel(self, text="", wraplength=600)
+        self.journal_lbl.pack(pady=5)
+        self.update_journal()
+
+    def update_journal(self):
+        text, color = journal_status(self.controller.journal.stats())
+        self.journal_lbl.configure(text=text, text_color=color)
+        self.after(2000, self.update_journal)
 
     def refresh(self):
         """
@@ -139,7 +172,13 @@ class AdminUserFrame(ctk.CTkFrame):
         self.new_p = ctk.CTkEntry(f, placeholder_text="Parola", show="*")
         self.new_p.pack(pady=10, padx=10)
 
-        ctk.CTkButton(self, text="Creeaza Cont", command=self.create_user).pack(pady=20)
+        self.create_btn = ctk.CTkButton(self, text="Creeaza Cont", command=self.create_user)
+        self.create_btn.pack(pady=20)
+
+        # Actualizarea modelelor din predictiile confirmate de medici (retrain.py)
+        ctk.CTkLabel(self, text="Operatii modele ML", font=("Arial", 16)).pack(pady=(10, 5))
+        self.retrain_btn = ctk.CTkButton(self, text="Re-antrenare incrementala", command=self.retrain)
+        self.retrain_btn.pack(pady=(0, 20))
         ctk.CTkButton(self, text="Inapoi", fg_color="transparent", border_width=2, command=lambda: controller.show_frame("DashboardFrame")).pack()
 
     def create_user(self):
@@ -148,20 +187,56 @@ class AdminUserFrame(ctk.CTkFrame):
         """
         u, p = self.new_u.get(), self.new_p.get()
         if not u or not p: return
-        # Genereaza un hash securizat pentru parola inainte de stocare
-        hashed_p = bcrypt.hashpw(p.encode('utf-8'), bcrypt.gensalt())
+        if not self.controller.touch_session(): return
         try:
-            conn = mysql.connector.connect(**self.controller.db_config)
-            cursor = conn.cursor()
-            cursor.execute("INSERT INTO USERS (username, password_hash, role) VALUES (%s, %s, 'MEDIC')", (u, hashed_p.decode('utf-8')))
-            conn.commit(); conn.close()
-            messagebox.showinfo("Succes", f"Medicul {u} adaugat!")
-        except Exception as e: messagebox.showerror("Eroare DB", str(e))
+            self.controller.tasks.submit(self.store_user, u, p,
+                                         on_done=lambda _: messagebox.showinfo("Succes", f"Medicul {u} adaugat!"),
+                                         on_error=self.on_store_error,
+                                         busy=BusyIndicator(self.create_btn))
+        except QueueFullError as e: messagebox.showwarning("Ocupat", str(e))
+
+    def retrain(self):
+        """
+        Actualizeaza modelele cu predictiile confirmate noi, pe un fir de lucru
+        """
+        if not self.controller.models_ready.is_set():
+            messagebox.showinfo("Asteptati", "Modelele se incarca in fundal, incercati in cateva secunde.")
+            return
+        try:
+            self.controller.tasks.submit(Retrainer(self.controller.ml_handler, self.controller.db).run,
+                                         on_done=self.show_retrain,
+                                         on_error=lambda e: messagebox.showerror("Eroare re-antrenare", str(e)),
+                                         busy=BusyIndicator(self.retrain_btn, "Re-antrenare in curs..."))
+        except QueueFullError as e: messagebox.showwarning("Ocupat", str(e))
+
+    def show_retrain(self, summary):
+        if not summary['rows']:
+            messagebox.showinfo("Re-antrenare", "Nu exista predictii confirmate noi de la ultima antrenare.")
+            return
+        refits = [str(s) for s, r in summary['splits'].items() if r['svm_refit']]
+        messagebox.showinfo("Re-antrenare", f"{summary['rows']} predictii confirmate noi integrate in modele.\n"
+                                            f"SVM reantrenat complet pentru: {', '.join(refits) or 'niciun split'}")
+
+    def on_store_error(self, error):
+        # Sesiunea expirata intre timp duce la autentificare; rolul nepermis ramane o eroare obisnuita
+        if isinstance(error, AuthError) and not self.controller.touch_session(): return
+        messagebox.showerror("Eroare", str(error))
+
+    def store_user(self, u, p):
+        """
+        Ruleaza pe firul de lucru: genereaza un hash securizat pentru parola si salveaza contul
+        """
+        session = self.controller.session
+        self.controller.auth.require(session.token if session else None, 'ADMIN')
+        return self.controller.auth.create_user(u, p, 'MEDIC')
 
 class PatientFormFrame(ctk.CTkFrame): 
     """
     Formular complex pentru colectarea datelor clinice si rularea predictiei
     """
+    SPLIT_MAP = {"80% Train": 0.20, "70% Train": 0.30, "60% Train": 0.40, "50% Train": 0.50}
+    LOADING_TEXT = "Modelele se incarca..."
+
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.controller = controller
@@ -195,8 +270,92 @@ class PatientFormFrame(ctk.CTkFrame):
         self.split.pack(pady=5)
 
         # Butoane
-        ctk.CTkButton(self, text="Ruleaza Predictie", fg_color="green", hover_color="darkgreen", command=self.run).pack(pady=10)
-        ctk.CTkButton(self, text="Inapoi la Meniu", fg_color="gray", command=lambda: controller.show_frame("DashboardFrame")).pack(pady=5)
+        self.run_btn = ctk.CTkButton(self, text="Ruleaza Predictie", fg_color="green", hover_color="darkgreen", command=self.run)
+        self.run_btn.pack(pady=10)
+        self.compare_btn = ctk.CTkButton(self, text="Compara toate modelele", command=self.compare)
+        self.compare_btn.pack(pady=5)
+        self.csv_btn = ctk.CTkButton(self, text="Importa CSV (scorare in lot)", command=self.import_csv)
+        self.csv_btn.pack(pady=5)
+        ctk.CTkButton(self, text="Inapoi la Meniu", fg_color="gray", command=self.back).pack(pady=5)
+
+        # Sarcina de predictie in curs (anulata la parasirea formularului)
+        self.task = None
+        # Verificarea periodica a modelelor programata cu after(); cel mult una la un moment dat
+        self.models_job = None
+
+    def refresh(self):
+        """
+        Activeaza butoanele de predictie doar dupa ce modelele sunt pregatite in fundal
+        Fiecare navigare inlocuieste verificarea deja programata, deci un esec produce un singur mesaj
+        """
+        if self.models_job is not None:
+            self.after_cancel(self.models_job)
+            self.models_job = None
+        if self.controller.models_ready.is_set():
+            for btn, text in self.button_texts():
+                if btn.cget("text") == self.LOADING_TEXT: btn.configure(state="normal", text=text)
+            return
+        if self.controller.models_error:
+            for btn, _ in self.button_texts(): btn.configure(state="disabled", text="Modele indisponibile")
+            messagebox.showerror("Eroare ML", self.controller.models_error)
+            return
+        for btn, _ in self.button_texts(): btn.configure(state="disabled", text=self.LOADING_TEXT)
+        self.models_job = self.after(200, self.refresh)
+
+    def button_texts(self):
+        return ((self.run_btn, "Ruleaza Predictie"), (self.compare_btn, "Compara toate modelele"),
+                (self.csv_btn, "Importa CSV (scorare in lot)"))
+
+    def back(self):
+        """
+        Revine la meniu; rezultatul unei predictii inca in curs nu mai este afisat
+        """
+        if self.task is not None: self.task.cancel()
+        self.controller.show_frame("DashboardFrame")
+
+    def read_form(self):
+        """
+        Citeste si valideaza formularul pe firul Tk
+        Returneaza: (date clinice, pacient) sau None daca datele sunt invalide (eroarea este deja afisata)
+        """
+        # Calculeaza varsta pe baza datei nasterii pentru a fi folosita in algoritm
+        dob_str = self.p_ents["Data"].get()
+        calculated_age = calculate_age_from_dob(dob_str)
+        
+        if calculated_age is None:
+            messagebox.showerror("Eroare Validare", "Formatul datei de naștere este invalid (trebuie YYYY-MM-DD)!")
+            return None
+
+        raw_age = str(calculated_age) 
+
+        # Colectare restul datelor din interfata
+        raw_gen = self.gen.get()
+        raw_tb = self.c_ents["Bilirubina T"].get()
+        raw_db = self.c_ents["Bilirubina D"].get()
+        raw_alk = self.c_ents["Fosfataza"].get()
+        raw_alt = self.c_ents["ALT"].get()
+        raw_ast = self.c_ents["AST"].get()
+        raw_tp = self.c_ents["Proteine T"].get()
+        raw_alb = self.c_ents["Albumina"].get()
+        raw_ag = self.c_ents["Raport AG"].get()
+
+        # Valideaza datele pacientului inainte de a le trimite la modelul ML
+        is_valid, message = validate_patient_data(
+            raw_age, raw_gen, raw_tb, raw_db, raw_alk,
+            raw_alt, raw_ast, raw_tp, raw_alb, raw_ag
+        )
+
+        if not is_valid:
+            messagebox.showerror("Eroare Validare", message)
+            return None
+
+        clin_data = [float(raw_age), 1 if raw_gen == "Masculin" else 0]
+        for val in [raw_tb, raw_db, raw_alk, raw_alt, raw_ast, raw_tp, raw_alb, raw_ag]:
+            clin_data.append(float(val))
+
+        # Valorile din widget-uri sunt citite aici, pe firul Tk; restul ruleaza pe un fir de lucru
+        patient = (self.p_ents["CNP"].get(), self.p_ents["Nume"].get(), raw_gen[0], dob_str)
+        return clin_data, patient
 
     def run(self):
         """
@@ -204,74 +363,116 @@ class PatientFormFrame(ctk.CTkFrame):
         Returneaza: None, actualizeaza GUI cu rezultatul
         """
         try:
-            # Calculeaza varsta pe baza datei nasterii pentru a fi folosita in algoritm
-            dob_str = self.p_ents["Data"].get()
-            calculated_age = calculate_age_from_dob(dob_str)
-            
-            if calculated_age is None:
-                messagebox.showerror("Eroare Validare", "Formatul datei de naștere este invalid (trebuie YYYY-MM-DD)!")
-                return
-
-            raw_age = str(calculated_age) 
-
-            # Colectare restul datelor din interfata
-            raw_gen = self.gen.get()
-            raw_tb = self.c_ents["Bilirubina T"].get()
-            raw_db = self.c_ents["Bilirubina D"].get()
-            raw_alk = self.c_ents["Fosfataza"].get()
-            raw_alt = self.c_ents["ALT"].get()
-            raw_ast = self.c_ents["AST"].get()
-            raw_tp = self.c_ents["Proteine T"].get()
-            raw_alb = self.c_ents["Albumina"].get()
-            raw_ag = self.c_ents["Raport AG"].get()
-
-            # Valideaza datele pacientului inainte de a le trimite la modelul ML
-            is_valid, message = validate_patient_data(
-                raw_age, raw_gen, raw_tb, raw_db, raw_alk,
-                raw_alt, raw_ast, raw_tp, raw_alb, raw_ag
-            )
-
-            if not is_valid:
-                messagebox.showerror("Eroare Validare", message)
-                return
-
-            # Procesare daca datele sunt valide
-            split_map = {"80% Train": 0.20, "70% Train": 0.30, "60% Train": 0.40, "50% Train": 0.50}
-            sz = split_map[self.split.get()]
-
-            clin_data = [float(raw_age), 1 if raw_gen == "Masculin" else 0]
-            for val in [raw_tb, raw_db, raw_alk, raw_alt, raw_ast, raw_tp, raw_alb, raw_ag]:
-                clin_data.append(float(val))
-
-            # Normalizeaza datele folosind scalerul antrenat si obtine predictia
-            dp = self.controller.models_data[sz]
-            sc = dp['SCALER'].transform(np.array(clin_data).reshape(1, -1))
-            res = dp[self.algo.get()].predict(sc)[0]
-            prob = dp[self.algo.get()].predict_proba(sc)[0][1]
-
-            self.save_to_db(clin_data, res, prob)
-
-            self.controller.frames["PredictionFrame"].set_result(
-                "RISC RIDICAT" if res == 1 else "RISC SCAZUT",
-                prob, self.algo.get(), "high" if res==1 else "low"
-            )
-            self.controller.show_frame("PredictionFrame")
+            form = self.read_form()
+            if form is None: return
+            clin_data, patient = form
+            sz, algo = self.SPLIT_MAP[self.split.get()], self.algo.get()
+            self.task = self.controller.tasks.submit(
+                self.predict_and_save, clin_data, patient, self.controller.logged_user_id, sz, algo,
+                on_done=lambda result: self.show_result(algo, *result),
+                on_error=lambda e: messagebox.showerror("Eroare Date", f"A aparut o eroare: {str(e)}"),
+                busy=BusyIndicator(self.run_btn))
+        except QueueFullError as e:
+            messagebox.showwarning("Ocupat", str(e))
         except Exception as e:
             messagebox.showerror("Eroare Date", f"A aparut o eroare: {str(e)}")
 
-    def save_to_db(self, cl, r, pb):
+    def compare(self):
+        """
+        Scoreaza pacientul cu toate modelele incarcate (fiecare split si ambii algoritmi) intr-o singura operatie
+        """
+        try:
+            form = self.read_form()
+            if form is None: return
+            clin_data, patient = form
+            self.task = self.controller.tasks.submit(
+                self.compare_and_save, clin_data, patient, self.controller.logged_user_id,
+                on_done=self.show_comparison,
+                on_error=lambda e: messagebox.showerror("Eroare Date", f"A aparut o eroare: {str(e)}"),
+                busy=BusyIndicator(self.compare_btn))
+        except QueueFullError as e:
+            messagebox.showwarning("Ocupat", str(e))
+        except Exception as e:
+            messagebox.showerror("Eroare Date", f"A aparut o eroare: {str(e)}")
+
+    def compare_and_save(self, clin_data, patient, user_id):
+        """
+        Ruleaza pe firul de lucru: toate modelele in paralel, apoi o singura scriere in jurnalul de predictii
+        Returneaza: lista (split, algoritm, eticheta, probabilitate, versiune, latenta ms)
+        """
+        results = self.controller.ml_handler.predict_all(clin_data)
+        rows = [(r['split'], r['algo'], int(r['labels'][0]), float(r['probabilities'][0]), r['version'], r['ms'])
+                for r in results]
+        self.controller.journal.append_many(patient, user_id, clin_data, [(res, prob, ver) for _, _, res, prob, ver, _ in rows])
+        return rows
+
+    def show_comparison(self, rows):
+        self.controller.get_frame("PredictionFrame").set_comparison(rows)
+        self.controller.show_frame("PredictionFrame")
+
+    def predict_and_save(self, clin_data, patient, user_id, sz, algo):
+        """
+        Ruleaza pe firul de lucru: predictia si salvarea in baza de date
+        Returneaza: (eticheta, probabilitate, versiunea modelului)
+        """
+        # Normalizeaza datele folosind scalerul antrenat si obtine predictia intr-o singura trecere
+        labels, probs, version = self.controller.ml_handler.predict_versioned(clin_data, sz, algo)
+        res, prob = labels[0], probs[0]
+        self.save_to_db(patient, user_id, clin_data, res, prob, version)
+        return res, prob, version
+
+    def show_result(self, algo, res, prob, version=None):
+        self.controller.get_frame("PredictionFrame").set_result(
+            "RISC RIDICAT" if res == 1 else "RISC SCAZUT",
+            prob, algo, "high" if res==1 else "low", version
+        )
+        self.controller.show_frame("PredictionFrame")
+
+    def import_csv(self):
+        """
+        Scoreaza toate randurile unui fisier CSV de laborator cu modelul si split-ul selectate
+        Rezultatele sunt scrise langa fisierul sursa, in <nume>_scorat.csv
+        """
+        path = filedialog.askopenfilename(title="Alege fisierul CSV", filetypes=[("CSV", "*.csv")])
+        if not path: return
+        sz, algo = self.SPLIT_MAP[self.split.get()], self.algo.get()
+        try:
+            self.controller.tasks.submit(
+                self.score_csv, path, sz, algo,
+                on_done=lambda r: messagebox.showinfo("Import CSV", f"{r[0]} pacienti scorati ({algo}), "
+                                                      f"{r[1]} randuri invalide.\nRezultate: {r[2]}"),
+                on_error=lambda e: messagebox.showerror("Eroare Import", f"A aparut o eroare: {str(e)}"),
+                busy=BusyIndicator(self.csv_btn))
+        except QueueFullError as e: messagebox.showwarning("Ocupat", str(e))
+
+    def score_csv(self, path, sz, algo):
+        """
+        Ruleaza pe firul de lucru: citeste, valideaza, scoreaza si scrie fisierul rezultat
+        Returneaza: (randuri scorate, randuri invalide, cale fisier rezultat)
+        """
+        df = pd.read_csv(path)
+        X = to_feature_matrix(df)
+        valid, errors = validate_patient_batch(X)
+
+        out = df.copy()
+        out['Predictie'] = np.nan; out['Probabilitate'] = np.nan; out['Eroare'] = ""
+        if valid.any():
+            labels, probs = self.controller.ml_handler.predict_batch(X[valid], sz, algo)
+            out.loc[valid, 'Predictie'] = labels
+            out.loc[valid, 'Probabilitate'] = probs
+        for row, msg in errors: out.iloc[row, out.columns.get_loc('Eroare')] = msg
+
+        out_path = os.path.splitext(path)[0] + "_scorat.csv"
+        out.to_csv(out_path, index=False)
+        return int(valid.sum()), len(errors), out_path
+
+    def save_to_db(self, patient, user_id, cl, r, pb, version=None):
         """
-        Salveaza datele pacientului si rezultatul predictiei in baza de date MySQL
+        Scrie rezultatul predictiei in jurnalul local; pacientul si predictia ajung in baza de date prin firul de fundal,
+        astfel incat rezultatul nu asteapta dupa MariaDB si nu se pierde daca serverul este indisponibil
+        patient: (cnp, nume, gen, data nasterii), citite anterior din formular
         """
-        conn = mysql.connector.connect(**self.controller.db_config); cursor = conn.cursor()
-        cnp = self.p_ents["CNP"].get()
-        cursor.execute("INSERT IGNORE INTO PATIENTS (cnp_internal_id, full_name, gender, birth_date) VALUES (%s,%s,%s,%s)",
-                       (cnp, self.p_ents["Nume"].get(), self.gen.get()[0], self.p_ents["Data"].get()))
-        cursor.execute("SELECT id FROM PATIENTS WHERE cnp_internal_id=%s", (cnp,))
-        pid = cursor.fetchone()[0]
-        q = "INSERT INTO PREDICTIONS (patient_id, user_id, prediction_result, confidence_score, age, gender_val, total_bilirubin, direct_bilirubin, alkaline_phosphotase, alamine_aminotransferase, aspartate_aminotransferase, total_proteins, albumin, albumin_and_globulin_ratio) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)"
-        cursor.execute(q, (pid, self.controller.logged_user_id, int(r), float(pb), cl[0], cl[1], *cl[2:]))
-        conn.commit(); conn.close()
+        self.controller.journal.append(patient, user_id, cl, r, pb, version)
 
 class PredictionFrame(ctk.CTkFrame):
     """
@@ -283,47 +484,170 @@ class PredictionFrame(ctk.CTkFrame):
         self.res_lbl.pack(pady=40)
         self.prb_lbl = ctk.CTkLabel(self, text="-", font=("Arial", 16))
         self.prb_lbl.pack()
+        self.ver_lbl = ctk.CTkLabel(self, text="", font=("Arial", 12), text_color="gray")
+        self.ver_lbl.pack(pady=5)
 
         self.box = ctk.CTkLabel(self, text="STARE", width=200, height=60, corner_radius=10, text_color="white")
         self.box.pack(pady=40)
 
-        ctk.CTkButton(self, text="Inapoi la Dashboard", command=lambda: controller.show_frame("DashboardFrame")).pack(pady=10)
+        # Tabelul comparatiei intre modele; afisat doar dupa "Compara toate modelele"
+        self.table = ctk.CTkFrame(self, fg_color="transparent")
+        columns = ("model", "versiune", "rezultat", "prob", "latenta")
+        self.tree = ttk.Treeview(self.table, columns=columns, show="headings", height=8)
+        for col in columns: self.tree.heading(col, text=col.upper())
+        self.tree.pack(fill="both", expand=True)
+
+        self.back_btn = ctk.CTkButton(self, text="Inapoi la Dashboard", command=lambda: controller.show_frame("DashboardFrame"))
+        self.back_btn.pack(pady=10)
         ctk.CTkButton(self, text="Adauga alt Pacient", fg_color="transparent", border_width=2, command=lambda: controller.show_frame("PatientFormFrame")).pack()
 
-    def set_result(self, txt, pb, mdl, risk):
+    def set_result(self, txt, pb, mdl, risk, version=None):
         """
         Actualizeaza elementele vizuale cu datele obtinute in urma predictiei
         """
         self.res_lbl.configure(text=f"{txt}\n({mdl})")
         self.prb_lbl.configure(text=f"Probabilitate: {pb*100:.2f}%")
+        self.ver_lbl.configure(text=f"Versiune model: {version or 'necunoscuta'}")
         color = "#e74c3c" if risk=="high" else "#2ecc71" 
         self.box.configure(text=risk.upper(), fg_color=color)
+        self.table.pack_forget()
+
+    def set_comparison(self, rows):
+        """
+        Afiseaza rezultatele tuturor modelelor intr-un tabel, cu latenta fiecarui model
+        rows: lista (split, algoritm, eticheta, probabilitate, versiune, latenta ms)
+        """
+        high = sum(1 for row in rows if row[2] == 1)
+        risk = "high" if high * 2 > len(rows) else "low"
+        mean = sum(row[3] for row in rows) / len(rows)
+        self.set_result("RISC RIDICAT" if risk == "high" else "RISC SCAZUT", mean, f"{high}/{len(rows)} modele risc ridicat", risk)
+        self.prb_lbl.configure(text=f"Probabilitate medie: {mean*100:.2f}%")
+        self.ver_lbl.configure(text=f"Latenta totala modele: {sum(row[5] for row in rows):.1f} ms")
+        self.tree.delete(*self.tree.get_children())
+        for split, algo, res, prob, version, ms in rows:
+            self.tree.insert("", "end", values=(f"{algo} {int(round((1 - split) * 100))}% Train", version or "-",
+                                                "RIDICAT" if res == 1 else "SCAZUT", f"{prob*100:.2f}%", f"{ms:.2f} ms"))
+        self.table.pack(fill="x", padx=40, pady=(0, 10), before=self.back_btn)
 
 class HistoryFrame(ctk.CTkFrame):
     """
     Vizualizeaza istoricul predictiilor efectuate sub forma tabelara
+    Randurile sunt incarcate pe pagini pe masura ce utilizatorul deruleaza
     """
     def __init__(self, parent, controller):
         super().__init__(parent); self.controller = controller
         ctk.CTkLabel(self, text="Istoric Predictii", font=("Arial", 20)).pack(pady=10)
+        self.count_lbl = ctk.CTkLabel(self, text="")
+        self.count_lbl.pack()
 
         # Treeview ramane din tkinter normal, dar il punem intrun frame ctk
+        table = ctk.CTkFrame(self, fg_color="transparent")
+        table.pack(fill="both", expand=True, padx=20, pady=10)
         columns = ("nume", "cnp", "rezultat", "conf")
-        self.tree = ttk.Treeview(self, columns=columns, show="headings")
+        self.tree = ttk.Treeview(table, columns=columns, show="headings")
         for col in columns: self.tree.heading(col, text=col.upper())
-        self.tree.pack(fill="both", expand=True, padx=20, pady=10)
+        self.scroll = ttk.Scrollbar(table, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.on_scroll)
+        self.scroll.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
 
+        self.pager = None
+        self.loading = False
+        self.total_estimate = 0
+
+        ctk.CTkButton(self, text="Confirma diagnosticul", command=self.confirm).pack(pady=(10, 0))
         ctk.CTkButton(self, text="Inapoi la Meniu", command=lambda: controller.show_frame("DashboardFrame")).pack(pady=10)
 
+    def confirm(self):
+        """
+        Inregistreaza diagnosticul confirmat clinic pentru predictia selectata (folosit la re-antrenare)
+        """
+        selected = self.tree.selection()
+        if not selected:
+            messagebox.showwarning("Atentie", "Selectati o predictie din tabel.")
+            return
+        answer = messagebox.askyesnocancel("Confirmare diagnostic", "Pacientul are boala hepatica confirmata clinic?")
+        if answer is None: return
+        try:
+            self.controller.tasks.submit(self.controller.db.confirm_prediction, int(selected[0]), int(answer),
+                                         on_done=lambda _: messagebox.showinfo("Succes", "Diagnostic confirmat."),
+                                         on_error=lambda e: messagebox.showerror("Eroare DB", str(e)))
+        except QueueFullError as e: messagebox.showwarning("Ocupat", str(e))
+
     def refresh(self):
         """
         Incarca ultimele inregistrari din baza de date in tabelul Treeview
+        Interogarile ruleaza pe un fir de lucru; o baza de date indisponibila este raportata, nu blocheaza fereastra
         """
         for i in self.tree.get_children(): self.tree.delete(i)
-        conn = mysql.connector.connect(**self.controller.db_config); cursor = conn.cursor()
-        cursor.execute("SELECT p.full_name, p.cnp_internal_id, pr.prediction_result, pr.confidence_score FROM PATIENTS p JOIN PREDICTIONS pr ON p.id = pr.patient_id ORDER BY pr.id DESC")
-        for r in cursor.fetchall(): self.tree.insert("", "end", values=r)
-        conn.close()
+        self.pager, self.loading = None, True
+        self.count_lbl.configure(text="Se incarca istoricul...")
+        try:
+            self.controller.tasks.submit(self.load_first, on_done=self.show_first, on_error=self.on_load_error)
+        except QueueFullError as e:
+            self.loading = False
+            messagebox.showwarning("Ocupat", str(e))
+
+    def load_first(self):
+        """
+        Ruleaza pe firul de lucru: prima pagina si estimarea numarului total de predictii
+        """
+        pager = HistoryPager(self.controller.db)
+        return pager, pager.reset(), self.controller.db.estimate_history_count()
+
+    def show_first(self, result):
+        self.pager, rows, self.total_estimate = result
+        for r in rows: self.tree.insert("", "end", iid=str(r[0]), values=r[1:])
+        self.loading = False
+        self.update_count()
+
+    def on_load_error(self, error):
+        self.loading = False
+        if self.pager is None: self.count_lbl.configure(text="Istoricul nu a putut fi incarcat.")
+        messagebox.showerror("Eroare DB", str(error))
+
+    def on_scroll(self, first, last):
+        """
+        Sincronizeaza bara de derulare si incarca pagina urmatoare/anterioara la capetele ferestrei
+        """
+        self.scroll.set(first, last)
+        if self.pager is None or self.loading: return
+        if float(last) >= 0.95 and not self.pager.at_oldest: self.after_idle(self.load_page, True)
+        elif float(first) <= 0.05 and not self.pager.at_newest: self.after_idle(self.load_page, False)
+
+    def load_page(self, older):
+        """
+        Cere pe un fir de lucru pagina urmatoare (older) sau anterioara; rezultatul este aplicat de show_page
+        """
+        if self.loading or self.pager is None: return
+        self.loading = True
+        pager = self.pager
+        anchor = self.tree.identify_row(self.tree.winfo_height() - 5 if older else 5)
+        try:
+            self.controller.tasks.submit(pager.older if older else pager.newer,
+                                         on_done=lambda page: self.show_page(pager, older, anchor, *page),
+                                         on_error=self.on_load_error)
+        except QueueFullError:
+            self.loading = False
+
+    def show_page(self, pager, older, anchor, added, dropped):
+        """
+        Adauga pagina la capatul ferestrei si elimina pagina cea mai indepartata, pastrand pozitia vizibila
+        """
+        # Un refresh intre timp a inlocuit pager-ul: pagina veche nu mai corespunde tabelului
+        if pager is not self.pager: return
+        self.loading = False
+        if older:
+            for r in added: self.tree.insert("", "end", iid=str(r[0]), values=r[1:])
+        else:
+            for pos, r in enumerate(added): self.tree.insert("", pos, iid=str(r[0]), values=r[1:])
+        if dropped: self.tree.delete(*[str(r[0]) for r in dropped])
+        if anchor and self.tree.exists(anchor): self.tree.see(anchor)
+        self.update_count()
+
+    def update_count(self):
+        shown = len(self.tree.get_children())
+        self.count_lbl.configure(text=f"{shown} inregistrari afisate din aproximativ {max(self.total_estimate, shown)}")
 
 class StatisticsFrame(ctk.CTkFrame):
     """
@@ -338,41 +662,24 @@ class StatisticsFrame(ctk.CTkFrame):
 
         btn_f = ctk.CTkFrame(self, fg_color="transparent")
         btn_f.pack(pady=10)
-        ctk.CTkButton(btn_f, text="Genereaza Raport", command=self.show_stats).pack(side="left", padx=10)
+        self.report_btn = ctk.CTkButton(btn_f, text="Genereaza Raport", command=self.show_stats)
+        self.report_btn.pack(side="left", padx=10)
         ctk.CTkButton(btn_f, text="Inapoi", fg_color="gray", command=lambda: controller.show_frame("DashboardFrame")).pack(side="left", padx=10)
 
     def show_stats(self):
         """
-        Descarca setul de date calculeaza statistici descriptive si evalueaza acuratetea modelelor
+        Afiseaza statisticile descriptive si performanta modelelor din cache-ul de evaluare
+        Raportul se recalculeaza doar daca s-a schimbat setul de date sau un model
         """
+        if not self.controller.models_ready.is_set():
+            messagebox.showinfo("Asteptati", "Modelele se incarca in fundal, incercati in cateva secunde.")
+            return
         try:
-            url = "https://archive.ics.uci.edu/ml/machine-learning-databases/00225/Indian%20Liver%20Patient%20Dataset%20(ILPD).csv"
-            cols = ['Age', 'Gender', 'TB', 'DB', 'Alk', 'Sgpt', 'Sgot', 'TP', 'ALB', 'AG', 'Dataset']
-            df = pd.read_csv(url, names=cols, header=None).dropna()
-            # Transforma etichetele text in valori numerice pentru analiza
-            df['Gender'] = df['Gender'].map({'Female': 0, 'Male': 1})
-            df['Dataset'] = df['Dataset'].map({1: 1, 2: 0})
-            X_all = df.drop('Dataset', axis=1); Y_all = df['Dataset']
-            
-            #Sectiunea A: Statistici Descriptive
-            # Calculeaza media varianta minimul si maximul pentru fiecare atribut
-            desc = X_all.describe().T[['mean', 'std', 'min', 'max']]
-            desc['variance'] = desc['std'] ** 2
-            report = "A. STATISTICI DESCRIPTIVE\n"
-            report += f"{'Atribut':<15} | {'Media':<8} | {'Var':<8} | {'Min':<6} | {'Max':<6}\n" + "-"*55 + "\n"
-            for idx, row in desc.iterrows():
-                report += f"{idx:<15} | {row['mean']:.2f} | {row['variance']:.2f} | {row['min']:.1f} | {row['max']:.1f}\n"
-
-            #Sectiunea B: Performanta
-            report += "\nB. PERFORMANTA MODELE\n"
-            report += f"{'SPLIT':<10} | {'MDL':<5} | {'ACC':<7} | {'F1':<7}\n" + "-"*40 + "\n"
-            for sz in self.controller.test_sizes:
-                data = self.controller.models_data[sz]
-                X_scaled = data['SCALER'].transform(X_all)
-                for name in ['SVM', 'MLP']:
-                    y_pred = data[name].predict(X_scaled)
-                    acc, f1 = accuracy_score(Y_all, y_pred), f1_score(Y_all, y_pred)
-                    report += f"{int((1-sz)*100)}/{(int(sz*100)):<5} | {name:<5} | {acc:.4f} | {f1:.4f}\n"
-
-            self.txt.delete("1.0", tk.END); self.txt.insert(tk.END, report)
-        except Exception as e: messagebox.showerror("Eroare", str(e))
\ No newline at end of file
+            self.controller.tasks.submit(
+                self.controller.evaluations.get_or_compute, self.controller.ml_handler,
+                on_done=self.render, on_error=lambda e: messagebox.showerror("Eroare", str(e)),
+                busy=BusyIndicator(self.report_btn))
+        except QueueFullError as e: messagebox.showwarning("Ocupat", str(e))
+
+    def render(self, report):
+        self.txt.delete("1.0", tk.END); self.txt.insert(tk.END, format_report(report))
@@ -0,0 +1,228 @@
+##########################################################################
+#                                                                        #
+#  Copyright:   (c) 2026, Proiect MPS                                    #
+#  Autori:      Albu A. Sorin (R.Moldova) 1409A                          #
+#               Glavan P. Pavel (R.Moldova) 1409A                        #
+#               Duda I.I. Andrei-Ionuț 1409A                             #
+#               Jireadă C. Teodor 1409A                                  #
+#               Popovici I.L. Andrei 1409A                               #
+#               Noroc D. Sorin (R.Moldova) 1409A                         #
+#               Timofte C. Constantin 1409A                              #
+#               Matei I. Ion (R.Moldova) 1410B                           #
+#                                                                        #
+#  Descriere:   Sistem Expert pentru Predictia Bolilor Hepatice          #
+#               Utilizand algoritmii SVM si Multilayer Perceptron (MLP)  #
+#               Bazat pe setul de date ILPD (Indian Liver Patient)       #
+#                                                                        #
+#  Acest cod si informatiile sunt oferite "ca atare" fara nicio garantie #
+#  de orice fel, exprimata sau implicita. Acest proiect este realizat    #
+#  in scop didactic pentru disciplina Managementul Proiectelor Software. #
+#                                                                        #
+##########################################################################
+import sys
+import time
+import argparse
+from lazy import lazy_import
+
+np = lazy_import("numpy")
+
+inference_config = {
+    # Randuri evaluate deodata de nucleul RBF; limiteaza matricea temporara N x vectori suport
+    'chunk_rows': 8192,
+    # Limitele Platt din libsvm (probabilitatile nu ating niciodata exact 0 sau 1)
+    'min_prob': 1e-7
+}
+
+def _sigmoid(z):
+    """
+    Sigmoida stabila numeric (fara overflow in exp pentru |z| mare)
+    """
+    out = np.empty_like(z)
+    pos = z >= 0
+    out[pos] = 1.0 / (1.0 + np.exp(-z[pos]))
+    ez = np.exp(z[~pos])
+    out[~pos] = ez / (1.0 + ez)
+    return out
+
+def _pairwise_coupling(r):
+    """
+    Cuplarea perechilor din libsvm (multiclass_probability) pentru k = 2, vectorizata pe randuri
+    r = P(clasa 0 | clasa 0 sau 1); libsvm nu returneaza r direct ci solutia iterativa (oprita la eps),
+    de aceea este reprodusa pas cu pas pentru a obtine aceleasi probabilitati ca sklearn
+    Returneaza: probabilitatea clasei 0
+    """
+    k, eps = 2, 0.005 / 2
+    s = 1.0 - r
+    Q = np.empty((r.shape[0], k, k))
+    Q[:, 0, 0] = s * s; Q[:, 1, 1] = r * r
+    Q[:, 0, 1] = Q[:, 1, 0] = -r * s
+    p = np.full((r.shape[0], k), 1.0 / k)
+    active = np.arange(r.shape[0])
+    for _ in range(100):
+        Qa, pa = Q[active], p[active]
+        Qp = np.einsum('nij,nj->ni', Qa, pa)
+        pQp = np.einsum('ni,ni->n', pa, Qp)
+        keep = np.abs(Qp - pQp[:, None]).max(axis=1) >= eps
+        active, Qa, pa, Qp, pQp = active[keep], Qa[keep], pa[keep], Qp[keep], pQp[keep]
+        if active.size == 0: break
+        for t in range(k):
+            diff = (-Qp[:, t] + pQp) / Qa[:, t, t]
+            pa[:, t] += diff
+            pQp = (pQp + diff * (diff * Qa[:, t, t] + 2 * Qp[:, t])) / (1 + diff) / (1 + diff)
+            Qp = (Qp + diff[:, None] * Qa[:, t, :]) / (1 + diff)[:, None]
+            pa /= (1 + diff)[:, None]
+        p[active] = pa
+    return p[:, 0]
+
+ACTIVATIONS = {
+    'relu': lambda z: np.maximum(z, 0, out=z),
+    'tanh': lambda z: np.tanh(z, out=z),
+    'logistic': _sigmoid,
+    'identity': lambda z: z,
+}
+
+class CompiledSplit:
+    """
+    Motorul de inferenta al unui split: scalare -> model -> (eticheta, probabilitate) intr-o singura trecere numpy
+    Parametrii sunt pregatiti o singura data la compilare, apelurile nu mai fac validari sklearn
+    """
+    def __init__(self, bundle):
+        meta = bundle.meta
+        mean, scale = bundle['scaler_mean'], bundle['scaler_scale']
+        self.n_features = meta['features']
+
+        # SVM: X_scalat = X * inv_scale + shift; normele vectorilor suport sunt precalculate pentru nucleul RBF
+        self.inv_scale = 1.0 / scale
+        self.shift = -mean / scale
+        # Split-urile cu scalere identice pot imparti aceeasi matrice scalata (MLHandler.predict_all)
+        self.scaler_key = np.asarray(mean).tobytes() + np.asarray(scale).tobytes()
+        self.sv = np.ascontiguousarray(bundle['svm_support_vectors'])
+        self.sv_sq = np.einsum('ij,ij->i', self.sv, self.sv)
+        self.gamma = meta['svm']['gamma']
+        self.dual_coef = np.ascontiguousarray(bundle['svm_dual_coef'][0])
+        self.svm_intercept = float(bundle['svm_intercept'][0])
+        self.svm_classes = np.asarray(meta['svm']['classes'])
+        if meta['svm']['probability']:
+            self.prob_a, self.prob_b = float(bundle['svm_probA'][0]), float(bundle['svm_probB'][0])
+        else:
+            self.prob_a = self.prob_b = None
+
+        # MLP: scalerul este contopit in primul strat (W' = W / scale, b' = b - (mean / scale) @ W)
+        layers = [(np.array(W), np.array(b)) for W, b in bundle.mlp_layers()]
+        W0, b0 = layers[0]
+        self.first_layer = layers[0]
+        layers[0] = (W0 * self.inv_scale[:, None], b0 + self.shift @ W0)
+        self.layers = layers
+        self.hidden = ACTIVATIONS[meta['mlp']['activation']]
+        if meta['mlp']['out_activation'] != 'logistic':
+            raise ValueError(f"Iesire MLP nesuportata: {meta['mlp']['out_activation']}")
+        self.mlp_classes = np.asarray(meta['mlp']['classes'])
+
+    def scale(self, X):
+        return X * self.inv_scale + self.shift
+
+    def svm_decision(self, X, scaled=False):
+        """
+        Functia de decizie RBF: sum_i dual_coef_i * exp(-gamma * ||x - sv_i||^2) + intercept
+        scaled: X este deja trecut prin scaler (vezi scale())
+        """
+        out = np.empty(X.shape[0])
+        step = inference_config['chunk_rows']
+        for start in range(0, X.shape[0], step):
+            Xs = X[start:start + step] if scaled else self.scale(X[start:start + step])
+            d2 = np.einsum('ij,ij->i', Xs, Xs)[:, None] + self.sv_sq[None, :] - 2.0 * (Xs @ self.sv.T)
+            np.maximum(d2, 0, out=d2)
+            d2 *= -self.gamma
+            out[start:start + step] = np.exp(d2, out=d2) @ self.dual_coef + self.svm_intercept
+        return out
+
+    def svm(self, X, scaled=False):
+        """
+        Probabilitatea clasei 1 prin scalarea Platt a valorii de decizie (ca libsvm: f = -decizie, r = sigmoid(-(A*f + B)))
+        urmata de cuplarea perechilor, exact ca predict_proba din sklearn
+        """
+        if self.prob_a is None: raise ValueError("Modelul SVM nu a fost antrenat cu probability=True")
+        dec = self.svm_decision(X, scaled)
+        lo = inference_config['min_prob']
+        r = np.clip(_sigmoid(-(self.prob_a * -dec + self.prob_b)), lo, 1.0 - lo)
+        p1 = 1.0 - _pairwise_coupling(r)
+        return self.svm_classes[(p1 > 0.5).astype(np.intp)], p1
+
+    def mlp(self, X, scaled=False):
+        """
+        Trecerea forward cu activarile din pachet si iesirea logistica
+        Pentru intrari deja scalate se foloseste primul strat original, fara scalerul contopit
+        """
+        layers = [self.first_layer] + self.layers[1:] if scaled else self.layers
+        a = X
+        for W, b in layers[:-1]:
+            a = self.hidden(a @ W + b)
+        W, b = layers[-1]
+        p1 = _sigmoid((a @ W + b)[:, 0])
+        return self.mlp_classes[(p1 > 0.5).astype(np.intp)], p1
+
+    def predict(self, X, algo, scaled=False):
+        """
+        Returneaza: (etichete np.ndarray, probabilitati clasa 1 np.ndarray) pentru matricea N x n_features
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1: X = X.reshape(1, -1)
+        if algo == 'SVM': return self.svm(X, scaled)
+        if algo == 'MLP': return self.mlp(X, scaled)
+        raise ValueError(f"Algoritm necunoscut: {algo}")
+
+def compile_bundle(bundle):
+    return CompiledSplit(bundle)
+
+def _per_call(fn, X, budget=0.5):
+    """
+    Ruleaza fn(X) repetat cel putin `budget` secunde si returneaza durata medie a unui apel
+    """
+    fn(X)
+    calls, start = 0, time.perf_counter()
+    while True:
+        fn(X); calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= budget: return elapsed / calls
+
+def benchmark(handler, split, sizes=(1, 10, 100, 1000, 10000, 100000), seed=0):
+    """
+    Compara latenta per apel a motorului compilat cu drumul sklearn (transform + predict + predict_proba)
+    Returneaza: lista de dictionare {algo, rows, sklearn_ms, engine_ms, speedup}
+    """
+    models = handler.models_data[split]
+    engine = compile_bundle(handler.models_data.get_bundle(split))
+    sc = models['SCALER']
+    rng = np.random.default_rng(seed)
+    # Pacienti plauzibili: in jurul mediei setului de antrenare
+    base = sc.mean_ + rng.standard_normal((max(sizes), sc.mean_.shape[0])) * sc.scale_ * 0.5
+    base[:, 1] = rng.integers(0, 2, base.shape[0])
+    results = []
+    for algo in ('SVM', 'MLP'):
+        model = models[algo]
+        def sk(X):
+            Xs = sc.transform(X)
+            return model.predict(Xs), model.predict_proba(Xs)
+        for n in sizes:
+            X = base[:n]
+            t_sk, t_en = _per_call(sk, X), _per_call(lambda X: engine.predict(X, algo), X)
+            results.append({'algo': algo, 'rows': n, 'sklearn_ms': t_sk * 1000, 'engine_ms': t_en * 1000,
+                            'speedup': t_sk / t_en})
+    return results
+
+if __name__ == "__main__":
+    from ml_logic import MLHandler
+
+    parser = argparse.ArgumentParser(description="Latenta motorului de inferenta numpy vs sklearn")
+    parser.add_argument("--split", type=float, default=0.20)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000, 10000, 100000])
+    args = parser.parse_args()
+    try:
+        handler = MLHandler([args.split])
+        if not handler.initialize_ml_logic(): sys.exit(1)
+        print(f"{'Model':<5} {'Randuri':>8} {'sklearn (ms)':>13} {'numpy (ms)':>11} {'Castig':>8}")
+        for r in benchmark(handler, args.split, args.sizes):
+            print(f"{r['algo']:<5} {r['rows']:>8} {r['sklearn_ms']:>13.3f} {r['engine_ms']:>11.3f} {r['speedup']:>7.1f}x")
+    except Exception as e:
+        print(f"Eroare: {e}")
+        sys.exit(1)
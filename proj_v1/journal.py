@@ -0,0 +1,268 @@
+##########################################################################
+#                                                                        #
+#  Copyright:   (c) 2026, Proiect MPS                                    #
+#  Autori:      Albu A. Sorin (R.Moldova) 1409A                          #
+#               Glavan P. Pavel (R.Moldova) 1409A                        #
+#               Duda I.I. Andrei-Ionuț 1409A                             #
+#               Jireadă C. Teodor 1409A                                  #
+#               Popovici I.L. Andrei 1409A                               #
+#               Noroc D. Sorin (R.Moldova) 1409A                         #
+#               Timofte C. Constantin 1409A                              #
+#               Matei I. Ion (R.Moldova) 1410B                           #
+#                                                                        #
+#  Descriere:   Sistem Expert pentru Predictia Bolilor Hepatice          #
+#               Utilizand algoritmii SVM si Multilayer Perceptron (MLP)  #
+#               Bazat pe setul de date ILPD (Indian Liver Patient)       #
+#                                                                        #
+#  Acest cod si informatiile sunt oferite "ca atare" fara nicio garantie #
+#  de orice fel, exprimata sau implicita. Acest proiect este realizat    #
+#  in scop didactic pentru disciplina Managementul Proiectelor Software. #
+#                                                                        #
+##########################################################################
+import os
+import json
+import time
+import uuid
+import logging
+import threading
+from collections import deque
+from itertools import islice
+from database import is_data_error
+
+log = logging.getLogger(__name__)
+
+journal_config = {
+    'path': os.environ.get("ILPD_JOURNAL", os.path.join("journal", "predictions.jsonl")),
+    # 'always': fsync la fiecare predictie (nimic pierdut la caderea curentului)
+    # 'interval': fsync cel mult o data la fsync_interval secunde; 'never': doar bufferul sistemului de operare
+    'fsync': os.environ.get("ILPD_JOURNAL_FSYNC", "always"),
+    'fsync_interval': 1.0,
+    # Firul de fundal scrie in baza de date la fiecare flush_interval secunde sau cand se aduna batch_size intrari
+    'flush_interval': float(os.environ.get("ILPD_JOURNAL_FLUSH_S", "0.5")),
+    'batch_size': 200,
+    # Pauza maxima intre reincercari cand baza de date nu raspunde
+    'retry_max': 30.0,
+    # Intrarile respinse definitiv de baza de date (constrangeri, date invalide) sunt mutate in <path>.dead
+    # Jurnalul este golit dupa ce tot continutul a ajuns in baza de date si depaseste aceasta dimensiune
+    'compact_bytes': 1 << 20
+}
+
+FSYNC_POLICIES = ('always', 'interval', 'never')
+
+class PredictionJournal:
+    """
+    Jurnal local append-only pentru predictii: rezultatul clinic este scris intai pe disc, iar un fir de fundal
+    il trimite in baza de date in loturi (Database.save_journal_batch)
+    Pozitia pana la care jurnalul a ajuns in baza de date se pastreaza in <path>.offset; la repornire intrarile
+    de dupa ea sunt retrimise, iar journal_id unic face reluarea idempotenta
+    O intrare respinsa definitiv este izolata in <path>.dead, ca sa nu blocheze predictiile de dupa ea
+    """
+    def __init__(self, db, path=None, fsync=None, batch_size=None, flush_interval=None, background=True):
+        cfg = journal_config
+        self.db = db
+        self.path = path or cfg['path']
+        self.fsync = fsync or cfg['fsync']
+        if self.fsync not in FSYNC_POLICIES: raise ValueError(f"Politica fsync necunoscuta: {self.fsync}")
+        self.batch_size = batch_size or cfg['batch_size']
+        self.flush_interval = cfg['flush_interval'] if flush_interval is None else flush_interval
+        self.dead_path = self.path + ".dead"
+        self.written = 0
+        self.failures = 0
+        self.rejected = 0
+        self.last_error = None
+        self.last_rejected = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._last_sync = time.monotonic()
+        # Intrarile inca nescrise in baza de date: (offset dupa linie, intrare)
+        self._pending = deque()
+
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory): os.makedirs(directory)
+        self._checkpoint = self._recover()
+        self._file = open(self.path, 'ab')
+        self._size = self._file.tell()
+
+        self._thread = None
+        if background: self.start()
+
+    def start(self):
+        """
+        Porneste firul de fundal; pana atunci predictiile se aduna doar pe disc (ex. cat timp schema este migrata)
+        """
+        if self._thread is not None: return
+        self._thread = threading.Thread(target=self._run, name="prediction-journal", daemon=True)
+        self._thread.start()
+
+    def _read_checkpoint(self):
+        try:
+            with open(self.path + ".offset", encoding='utf-8') as f: return int(json.load(f)['offset'])
+        except FileNotFoundError:
+            return 0
+        except Exception as e:
+            # Un checkpoint ilizibil inseamna doar retrimiterea intregului jurnal
+            log.warning("Checkpoint jurnal ilizibil (%s), se reia de la inceput", e)
+            return 0
+
+    def _write_checkpoint(self, offset):
+        tmp = self.path + ".offset.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f: json.dump({'offset': offset}, f)
+        os.replace(tmp, self.path + ".offset")
+        self._checkpoint = offset
+
+    def _recover(self):
+        """
+        Incarca intrarile de dupa checkpoint si taie o eventuala linie scrisa pe jumatate la sfarsitul fisierului
+        Returneaza: offset-ul checkpoint-ului
+        """
+        if not os.path.exists(self.path): return 0
+        checkpoint = self._read_checkpoint()
+        with open(self.path, 'rb') as f: data = f.read()
+        if checkpoint > len(data): checkpoint = 0
+        pos = checkpoint
+        while pos < len(data):
+            end = data.find(b"\n", pos)
+            if end < 0: break
+            try: entry = json.loads(data[pos:end])
+            except ValueError: break
+            pos = end + 1
+            self._pending.append((pos, entry))
+        if pos < len(data):
+            log.warning("Jurnal %s: %d octeti incompleti la sfarsit, se elimina", self.path, len(data) - pos)
+            with open(self.path, 'r+b') as f:
+                f.truncate(pos)
+                os.fsync(f.fileno())
+        if self._pending: log.info("Jurnal %s: %d predictii de retrimis", self.path, len(self._pending))
+        return checkpoint
+
+    def append(self, patient, user_id, clin, result, confidence, model_version=None):
+        """
+        Scrie o predictie in jurnal; baza de date este actualizata ulterior de firul de fundal
+        Returneaza: journal_id-ul intrarii
+        """
+        return self.append_many(patient, user_id, clin, [(result, confidence, model_version)])[0]
+
+    def append_many(self, patient, user_id, clin, results):
+        """
+        Scrie rezultatele mai multor modele pentru acelasi pacient cu o singura scriere (si un singur fsync)
+        results: lista (rezultat, incredere, versiune model)
+        Returneaza: lista journal_id
+        """
+        patient, clin = list(patient), [float(v) for v in clin]
+        entries = [{'journal_id': uuid.uuid4().hex, 'patient': patient, 'user_id': user_id, 'result': int(r),
+                    'confidence': float(pb), 'clin': clin, 'model_version': version} for r, pb, version in results]
+        lines = [json.dumps(e, separators=(',', ':')).encode('utf-8') + b"\n" for e in entries]
+        with self._lock:
+            self._file.write(b"".join(lines))
+            self._file.flush()
+            if self.fsync == 'always' or (self.fsync == 'interval' and
+                                          time.monotonic() - self._last_sync >= journal_config['fsync_interval']):
+                os.fsync(self._file.fileno())
+                self._last_sync = time.monotonic()
+            for line, entry in zip(lines, entries):
+                self._size += len(line)
+                self._pending.append((self._size, entry))
+            full = len(self._pending) >= self.batch_size
+        if full: self._wake.set()
+        return [e['journal_id'] for e in entries]
+
+    def pending(self):
+        with self._lock: return len(self._pending)
+
+    def flush(self):
+        """
+        Trimite in baza de date toate intrarile in asteptare, in loturi de batch_size
+        Erorile de conexiune sunt propagate; intrarile raman in jurnal pentru urmatoarea incercare
+        Returneaza: numarul de predictii scrise
+        """
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._lock: batch = list(islice(self._pending, self.batch_size))
+                if not batch: break
+                count = self._save([entry for _, entry in batch])
+                with self._lock:
+                    for _ in batch: self._pending.popleft()
+                    self._write_checkpoint(batch[-1][0])
+                    self._compact()
+                written += count
+                self.written += count
+        return written
+
+    def _save(self, entries):
+        """
+        Scrie un lot; la o eroare de date lotul este injumatatit pana cand intrarea vinovata ramane singura
+        si este mutata in fisierul de intrari respinse; jumatatile deja scrise sunt ignorate la reluare (journal_id)
+        Returneaza: numarul de predictii scrise
+        """
+        try:
+            self.db.save_journal_batch(entries)
+            return len(entries)
+        except Exception as e:
+            if not is_data_error(e): raise
+            if len(entries) == 1:
+                self._reject(entries[0], e)
+                return 0
+            half = len(entries) // 2
+            return self._save(entries[:half]) + self._save(entries[half:])
+
+    def _reject(self, entry, error):
+        line = json.dumps({'time': time.strftime("%Y-%m-%d %H:%M:%S"), 'error': str(error), 'entry': entry},
+                          separators=(',', ':')).encode('utf-8') + b"\n"
+        with open(self.dead_path, 'ab') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self.rejected += 1
+        self.last_rejected = str(error)
+        log.error("Jurnal: predictia %s (CNP %s) a fost respinsa de baza de date si mutata in %s: %s",
+                  entry.get('journal_id'), (entry.get('patient') or [None])[0], self.dead_path, error)
+
+    def _compact(self):
+        """
+        Goleste jurnalul cand totul a ajuns in baza de date (apelat cu _lock luat)
+        Checkpoint-ul este resetat inainte de trunchiere: o oprire intre cei doi pasi doar retrimite intrari deja scrise
+        """
+        if self._pending or self._size < journal_config['compact_bytes']: return
+        self._write_checkpoint(0)
+        self._file.truncate(0)
+        self._size = 0
+
+    def _run(self):
+        delay = self.flush_interval
+        while not self._stop.is_set():
+            self._wake.wait(delay)
+            self._wake.clear()
+            if self._stop.is_set(): break
+            try:
+                if self.fsync == 'interval':
+                    with self._lock: os.fsync(self._file.fileno())
+                self.flush()
+                self.last_error, delay = None, self.flush_interval
+            except Exception as e:
+                # Baza de date indisponibila: predictiile raman pe disc, reincercarea se face cu pauza dublata
+                self.failures += 1
+                self.last_error = str(e)
+                delay = min(max(delay, 0.1) * 2, journal_config['retry_max'])
+                log.warning("Jurnal: scrierea in baza de date a esuat (%s), reincercare in %.1f s", e, delay)
+
+    def stats(self):
+        with self._lock:
+            return {'pending': len(self._pending), 'written': self.written, 'failures': self.failures,
+                    'last_error': self.last_error, 'rejected': self.rejected, 'last_rejected': self.last_rejected,
+                    'bytes': self._size, 'checkpoint': self._checkpoint}
+
+    def close(self):
+        """
+        Opreste firul de fundal si incearca o ultima scriere; ce nu ajunge in baza de date ramane in jurnal
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None: self._thread.join()
+        try: self.flush()
+        except Exception as e: log.warning("Jurnal: %d predictii raman pentru urmatoarea pornire (%s)", self.pending(), e)
+        with self._lock:
+            os.fsync(self._file.fileno())
+            self._file.close()
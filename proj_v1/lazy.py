@@ -0,0 +1,65 @@
+##########################################################################
+#                                                                        #
+#  Copyright:   (c) 2026, Proiect MPS                                    #
+#  Autori:      Albu A. Sorin (R.Moldova) 1409A                          #
+#               Glavan P. Pavel (R.Moldova) 1409A                        #
+#               Duda I.I. Andrei-Ionuț 1409A                             #
+#               Jireadă C. Teodor 1409A                                  #
+#               Popovici I.L. Andrei 1409A                               #
+#               Noroc D. Sorin (R.Moldova) 1409A                         #
+#               Timofte C. Constantin 1409A                              #
+#               Matei I. Ion (R.Moldova) 1410B                           #
+#                                                                        #
+#  Descriere:   Sistem Expert pentru Predictia Bolilor Hepatice          #
+#               Utilizand algoritmii SVM si Multilayer Perceptron (MLP)  #
+#               Bazat pe setul de date ILPD (Indian Liver Patient)       #
+#                                                                        #
+#  Acest cod si informatiile sunt oferite "ca atare" fara nicio garantie #
+#  de orice fel, exprimata sau implicita. Acest proiect este realizat    #
+#  in scop didactic pentru disciplina Managementul Proiectelor Software. #
+#                                                                        #
+##########################################################################
+import sys
+import importlib
+import threading
+
+class LazyModule:
+    """
+    Inlocuitor pentru un modul greu (numpy, pandas, sklearn, mysql): importul real
+    are loc la primul acces la un atribut, nu la importul modulului care il foloseste
+    """
+    def __init__(self, name):
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+        self.__dict__['_lock'] = threading.Lock()
+
+    def _load(self):
+        module = self.__dict__['_module']
+        if module is None:
+            with self.__dict__['_lock']:
+                module = self.__dict__['_module']
+                if module is None:
+                    name = self.__dict__['_name']
+                    importlib.import_module(name)
+                    # Ca la "import a.b": numele legat este pachetul de nivel superior
+                    module = sys.modules[name.partition('.')[0]]
+                    self.__dict__['_module'] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "incarcat" if self.__dict__['_module'] is not None else "neincarcat"
+        return f"<modul lazy '{self.__dict__['_name']}' ({state})>"
+
+def lazy_import(name):
+    """
+    Echivalentul lenes al "import name"; daca modulul e deja incarcat il returneaza direct
+    """
+    top = name.partition('.')[0]
+    if name in sys.modules and top in sys.modules: return sys.modules[top]
+    return LazyModule(name)
@@ -19,21 +19,48 @@
 #  in scop didactic pentru disciplina Managementul Proiectelor Software. #
 #                                                                        #
 ##########################################################################
+import time
+_IMPORT_START = time.perf_counter()
+import logging
+import argparse
+import threading
 import customtkinter as ctk 
-from database import db_config
+from tkinter import messagebox
+from database import db_config, storage_config, open_database
+from auth import AuthService, AuthError
+from journal import PredictionJournal
 from ml_logic import MLHandler
+from workers import TaskRunner
 import gui_frames as gui
+IMPORT_MS = (time.perf_counter() - _IMPORT_START) * 1000
+
+log = logging.getLogger(__name__)
 
 # Configureaza tema vizuala a aplicatiei
 ctk.set_appearance_mode("System") 
 ctk.set_default_color_theme("blue")
 
+app_config = {
+    # Timpul maxim (ms) acceptat pana la afisarea ecranului de autentificare
+    'login_budget_ms': 1000,
+    # Split-ul incalzit in fundal la pornire (primul folosit de formular)
+    'warmup_split': 0.20
+}
+
+# Un pacient valid oarecare, folosit doar pentru a plati costurile primei predictii
+WARMUP_ROW = [45, 1, 1.0, 0.3, 200, 30, 35, 6.5, 3.2, 1.0]
+
 class App(ctk.CTk): 
     """
     Clasa principala a aplicatiei care gestioneaza navigarea intre ferestre si starea globala
     Actioneaza ca un controller principal
     """
+    FRAMES = {F.__name__: F for F in (gui.LoginFrame, gui.DashboardFrame, gui.PatientFormFrame, 
+                                      gui.PredictionFrame, gui.StatisticsFrame, gui.AdminUserFrame, gui.HistoryFrame)}
+
     def __init__(self):
+        self.started = time.perf_counter()
+        self.startup_timings = {'imports_ms': IMPORT_MS}
         super().__init__()
         # Initializeaza fereastra principala
         self.title("Sistem Suport Decizional - Liver Disease 2026")
@@ -41,40 +68,146 @@ class App(ctk.CTk):
 
         # Incarca configuratia
         self.db_config = db_config
+        # MariaDB sau SQLite local, dupa storage_config (ILPD_DB_BACKEND)
+        self.db = open_database()
+        self.auth = AuthService(self.db)
+        self.session = None
+        # Predictiile sunt scrise intai pe disc; firul care le trimite in baza de date (inclusiv intrarile
+        # ramase de la rularea anterioara) porneste dupa verificarea schemei
+        self.journal = PredictionJournal(self.db, background=False)
+        # Munca lenta (DB, bcrypt, predictie) ruleaza pe fire de lucru, rezultatele revin prin after()
+        self.tasks = TaskRunner(self)
+        if storage_config['backend'] == 'sqlite': self.journal.start()
+        else: self.tasks.submit(self.check_schema, on_done=lambda _: self.journal.start(), on_error=self.on_schema_failed)
         self.logged_user_id = None
         self.logged_user_role = None
 
-        # Initializeaza logica 
+        # Initializeaza logica; incarcarea (sau antrenarea) modelelor se face in fundal
         self.test_sizes = [0.20, 0.30, 0.40, 0.50]
         self.ml_handler = MLHandler(self.test_sizes)
-        self.models_data = self.ml_handler.initialize_ml_logic()
+        self.models_data = self.ml_handler.models_data
+        self.evaluations = self.ml_handler.evaluations
+        self.models_ready = threading.Event()
+        self.models_error = None
 
         # Creeaza containerul principal 
-        container = ctk.CTkFrame(self)
-        container.pack(fill="both", expand=True)
+        self.container = ctk.CTkFrame(self)
+        self.container.pack(fill="both", expand=True)
         
-        container.grid_rowconfigure(0, weight=1)
-        container.grid_columnconfigure(0, weight=1)
+        self.container.grid_rowconfigure(0, weight=1)
+        self.container.grid_columnconfigure(0, weight=1)
 
+        # Ferestrele sunt construite la prima navigare catre ele
         self.frames = {}
+        self.show_frame("LoginFrame")
+        self.update_idletasks()
+        self.startup_timings['login_ms'] = (time.perf_counter() - self.started) * 1000
+        if self.startup_timings['login_ms'] > app_config['login_budget_ms']:
+            log.warning("Ecranul de login a aparut in %.0f ms (buget %d ms)",
+                        self.startup_timings['login_ms'], app_config['login_budget_ms'])
+
+        self.tasks.submit(self.warm_up, on_done=self.on_models_ready, on_error=self.on_models_failed)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def check_schema(self):
+        """
+        Ruleaza pe un fir de lucru: aplica migrarile MariaDB lipsa (migrate.py) sau refuza pornirea
+        """
+        from migrate import ensure_schema
+        applied = ensure_schema()
+        if applied: log.info("Migrari aplicate la pornire: %s", ", ".join(f"V{v:03d}" for v in applied))
+        return applied
+
+    def on_schema_failed(self, error):
+        log.error("Schema bazei de date nu poate fi folosita: %s", error)
+        messagebox.showerror("Eroare Baza de Date", f"Aplicatia nu poate porni: {error}")
+        self.on_close()
+
+    def on_close(self):
+        """
+        La inchiderea ferestrei: ultima scriere din jurnal in baza de date, apoi oprirea firelor de lucru
+        """
+        self.tasks.shutdown()
+        self.journal.close()
+        self.destroy()
+
+    def warm_up(self):
+        """
+        Ruleaza pe un fir de lucru: pregateste modelele si face o predictie de proba pe split-ul implicit,
+        astfel incat prima predictie reala sa nu plateasca incarcarea si initializarile lazy
+        """
+        start = time.perf_counter()
+        models = self.ml_handler.initialize_ml_logic()
+        if not models: raise RuntimeError("Modelele nu au putut fi incarcate sau antrenate.")
+        self.startup_timings['models_ms'] = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        split = app_config['warmup_split'] if app_config['warmup_split'] in models else next(iter(models))
+        for algo in ('SVM', 'MLP'): self.ml_handler.predict_batch(WARMUP_ROW, split, algo)
+        self.startup_timings['warmup_ms'] = (time.perf_counter() - start) * 1000
+        return models
+
+    def on_models_ready(self, models):
+        self.models_data = models
+        self.models_ready.set()
+        self.startup_timings['ready_ms'] = (time.perf_counter() - self.started) * 1000
+        log.info("Pornire: importuri %.0f ms | login %.0f ms | modele %.0f ms | warm-up %.0f ms | gata in %.0f ms",
+                 *(self.startup_timings[k] for k in ('imports_ms', 'login_ms', 'models_ms', 'warmup_ms', 'ready_ms')))
 
-        for F in (gui.LoginFrame, gui.DashboardFrame, gui.PatientFormFrame, 
-                  gui.PredictionFrame, gui.StatisticsFrame, gui.AdminUserFrame, gui.HistoryFrame):
-            frame = F(parent=container, controller=self)
-            self.frames[F.__name__] = frame
+    def on_models_failed(self, error):
+        self.models_error = str(error)
+        log.error("Eroare la pregatirea modelelor: %s", error)
+
+    def get_frame(self, name):
+        """
+        Returneaza fereastra ceruta, construind-o la prima utilizare
+        """
+        if name not in self.frames:
+            start = time.perf_counter()
+            frame = self.FRAMES[name](parent=self.container, controller=self)
             frame.grid(row=0, column=0, sticky="nsew")
+            self.frames[name] = frame
+            log.info("Fereastra %s construita in %.0f ms", name, (time.perf_counter() - start) * 1000)
+        return self.frames[name]
+
+    def touch_session(self):
+        """
+        Prelungeste sesiunea la fiecare actiune a utilizatorului; o sesiune expirata (inactiva mai mult de
+        token_ttl) il trimite inapoi la autentificare
+        Returneaza: True daca sesiunea este valida
+        """
+        if self.session is None: return False
+        try:
+            self.session = self.auth.refresh(self.session.token)
+            return True
+        except AuthError as e:
+            self.logout(str(e))
+            return False
 
+    def logout(self, message=None):
+        self.session = None
+        self.logged_user_id = self.logged_user_role = None
         self.show_frame("LoginFrame")
+        if message: messagebox.showwarning("Sesiune", message)
 
     def show_frame(self, name):
         """
         Afiseaza fereastra specificata prin nume si actualizeaza continutul daca este necesar
         """
-        frame = self.frames[name]
+        if name != "LoginFrame" and self.session is not None and not self.touch_session(): return
+        frame = self.get_frame(name)
         if hasattr(frame, "refresh"): frame.refresh()
         frame.tkraise()
 
 if __name__ == "__main__":
     # Punctul de intrare in aplicatie
+    parser = argparse.ArgumentParser(description="Sistem Suport Decizional - Liver Disease")
+    parser.add_argument("--importtime", action="store_true",
+                        help="masoara importul la rece al modulelor (-X importtime) inainte de pornire")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s: %(message)s")
+    if args.importtime:
+        from profiling import import_time_report, format_report
+        log.info("Raport import:\n%s", format_report(*import_time_report()))
     app = App()
-    app.mainloop()
\ No newline at end of file
+    app.mainloop()
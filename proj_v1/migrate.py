@@ -0,0 +1,208 @@
+##########################################################################
+#                                                                        #
+#  Copyright:   (c) 2026, Proiect MPS                                    #
+#  Autori:      Albu A. Sorin (R.Moldova) 1409A                          #
+#               Glavan P. Pavel (R.Moldova) 1409A                        #
+#               Duda I.I. Andrei-Ionuț 1409A                             #
+#               Jireadă C. Teodor 1409A                                  #
+#               Popovici I.L. Andrei 1409A                               #
+#               Noroc D. Sorin (R.Moldova) 1409A                         #
+#               Timofte C. Constantin 1409A                              #
+#               Matei I. Ion (R.Moldova) 1410B                           #
+#                                                                        #
+#  Descriere:   Sistem Expert pentru Predictia Bolilor Hepatice          #
+#               Utilizand algoritmii SVM si Multilayer Perceptron (MLP)  #
+#               Bazat pe setul de date ILPD (Indian Liver Patient)       #
+#                                                                        #
+#  Acest cod si informatiile sunt oferite "ca atare" fara nicio garantie #
+#  de orice fel, exprimata sau implicita. Acest proiect este realizat    #
+#  in scop didactic pentru disciplina Managementul Proiectelor Software. #
+#                                                                        #
+##########################################################################
+import os
+import re
+import sys
+import hashlib
+import argparse
+from lazy import lazy_import
+from database import db_config, QUERIES
+
+# Conectorul MySQL se incarca abia la prima conexiune (migrate este importat si la pornirea aplicatiei)
+mysql = lazy_import("mysql.connector")
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "db_init", "migrations")
+
+migrate_config = {
+    # La pornire aplicatia aplica singura migrarile lipsa; cu ILPD_AUTO_MIGRATE=0 refuza sa porneasca pe o schema veche
+    'auto': os.environ.get("ILPD_AUTO_MIGRATE", "1") == "1"
+}
+
+# Fisierele se numesc V<versiune>__<descriere>.sql si sunt aplicate in ordinea numerica a versiunii
+FILE_PATTERN = re.compile(r"^V(\d+)__(\w+)\.sql$")
+
+CREATE_VERSION_TABLE = """
+    CREATE TABLE IF NOT EXISTS SCHEMA_VERSION (
+        version INT PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        checksum CHAR(64) NOT NULL,
+        applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+# Interogarile fierbinti ale aplicatiei, cu parametri exemplu pentru EXPLAIN
+EXPLAIN_QUERIES = {
+    'find_user': (QUERIES['find_user'], ('medic',)),
+    'patient_id': (QUERIES['patient_id'], ('UCI0000000001',)),
+    'history_first': (QUERIES['history_first'], (200,)),
+    'history_older': (QUERIES['history_older'], (1000, 200)),
+    'history_newer': (QUERIES['history_newer'], (1000, 200)),
+    'confirmed_since': (QUERIES['confirmed_since'], (0, 500)),
+    'seeder_patient_user': ("SELECT id FROM PREDICTIONS WHERE patient_id = %s AND user_id = %s", (1, 1)),
+    'history_date_range': ("SELECT id, patient_id, prediction_result FROM PREDICTIONS "
+                           "WHERE date_created BETWEEN %s AND %s ORDER BY date_created DESC LIMIT 200",
+                           ('2026-01-01', '2026-02-01')),
+}
+
+class MigrationError(Exception):
+    """
+    Schema bazei de date nu corespunde fisierelor de migrare
+    """
+
+def discover(directory=None):
+    """
+    Returneaza migrarile disponibile ca lista ordonata de (versiune, nume, cale, sha256)
+    """
+    directory = directory or MIGRATIONS_DIR
+    found = []
+    for fname in os.listdir(directory):
+        match = FILE_PATTERN.match(fname)
+        if not match: continue
+        path = os.path.join(directory, fname)
+        with open(path, 'rb') as f: checksum = hashlib.sha256(f.read()).hexdigest()
+        found.append((int(match.group(1)), match.group(2), path, checksum))
+    found.sort()
+    versions = [m[0] for m in found]
+    if len(versions) != len(set(versions)): raise MigrationError("Exista doua migrari cu aceeasi versiune.")
+    return found
+
+def split_statements(sql):
+    """
+    Imparte un script SQL in instructiuni, ignorand comentariile si ';' din interiorul sirurilor
+    """
+    statements, current, quote = [], [], None
+    for line in sql.splitlines():
+        if quote is None and line.strip().startswith("--"): continue
+        for ch in line:
+            if quote:
+                if ch == quote: quote = None
+            elif ch in ("'", '"', '`'):
+                quote = ch
+            elif ch == ';':
+                statement = "".join(current).strip()
+                if statement: statements.append(statement)
+                current = []
+                continue
+            current.append(ch)
+        current.append("\n")
+    statement = "".join(current).strip()
+    if statement: statements.append(statement)
+    return statements
+
+def _pending(cursor, directory=None):
+    """
+    Migrarile din director inca neinregistrate in SCHEMA_VERSION
+    """
+    cursor.execute(CREATE_VERSION_TABLE)
+    cursor.execute("SELECT version, checksum FROM SCHEMA_VERSION")
+    applied = dict(cursor.fetchall())
+    missing = []
+    for version, name, path, checksum in discover(directory):
+        if version not in applied:
+            missing.append((version, name, path, checksum))
+        # O migrare deja aplicata nu se mai modifica; schimbarile merg intr-un fisier nou
+        elif applied[version] != checksum:
+            raise MigrationError(f"Migrarea V{version:03d} a fost modificata dupa aplicare.")
+    return missing
+
+def pending(conn, directory=None):
+    """
+    Returneaza: versiunile migrarilor care nu au fost aplicate pe baza de date
+    """
+    cursor = conn.cursor()
+    try: return [m[0] for m in _pending(cursor, directory)]
+    finally: cursor.close()
+
+def ensure_schema(config=None, apply=None, directory=None):
+    """
+    Verificarea de la pornirea aplicatiei: schema MariaDB trebuie sa contina toate migrarile livrate,
+    altfel scrierile (jurnalul de predictii) ar esua la nesfarsit pe coloane inexistente
+    Aplica migrarile lipsa sau, cu aplicarea automata dezactivata, ridica MigrationError
+    Returneaza: versiunile aplicate acum
+    """
+    apply = migrate_config['auto'] if apply is None else apply
+    conn = mysql.connector.connect(**(config or db_config))
+    try:
+        if apply: return migrate(conn, directory)
+        missing = pending(conn, directory)
+        if missing:
+            raise MigrationError(f"Schema bazei de date nu este la zi (lipsesc migrarile "
+                                 f"{', '.join(f'V{v:03d}' for v in missing)}); rulati: python migrate.py")
+        return []
+    finally:
+        conn.close()
+
+def migrate(conn, directory=None):
+    """
+    Aplica, in ordine, migrarile inca neinregistrate in SCHEMA_VERSION
+    DDL-ul MariaDB nu este tranzactional, de aceea fisierele folosesc IF NOT EXISTS si pot fi reluate
+    Returneaza: lista versiunilor aplicate acum
+    """
+    cursor = conn.cursor()
+    done = []
+    for version, name, path, checksum in _pending(cursor, directory):
+        with open(path, encoding='utf-8') as f: sql = f.read()
+        try:
+            for statement in split_statements(sql): cursor.execute(statement)
+            cursor.execute("INSERT INTO SCHEMA_VERSION (version, name, checksum) VALUES (%s, %s, %s)",
+                           (version, name, checksum))
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise MigrationError(f"Migrarea V{version:03d} ({name}) a esuat: {e}")
+        print(f"Aplicata migrarea V{version:03d} {name}")
+        done.append(version)
+    cursor.close()
+    return done
+
+def explain_check(conn, queries=None):
+    """
+    Ruleaza EXPLAIN pe interogarile aplicatiei si raporteaza orice scanare completa de tabel (type=ALL)
+    Returneaza: lista de (nume interogare, tabel) care au regresat; lista goala inseamna succes
+    """
+    queries = queries or EXPLAIN_QUERIES
+    cursor = conn.cursor(dictionary=True)
+    problems = []
+    for name, (sql, params) in queries.items():
+        cursor.execute("EXPLAIN " + sql, params)
+        for row in cursor.fetchall():
+            if str(row.get('type', '')).upper() == 'ALL':
+                problems.append((name, row.get('table')))
+    cursor.close()
+    return problems
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aplica migrarile schemei si verifica planurile interogarilor")
+    parser.add_argument("--check", action="store_true", help="ruleaza si verificarea EXPLAIN dupa migrare")
+    args = parser.parse_args()
+    try:
+        conn = mysql.connector.connect(**db_config)
+        migrate(conn)
+        if args.check:
+            problems = explain_check(conn)
+            for name, table in problems: print(f"Scanare completa: {name} pe tabelul {table}")
+            if problems: sys.exit(1)
+            print("Toate interogarile folosesc indecsi.")
+        conn.close()
+    except (MigrationError, mysql.connector.Error) as e:
+        print(f"Eroare: {e}")
+        sys.exit(1)
@@ -20,76 +20,571 @@
 #                                                                        #
 ##########################################################################
 import os
-import pandas as pd
-import joblib
-from sklearn.preprocessing import StandardScaler
-from sklearn.svm import SVC
-from sklearn.neural_network import MLPClassifier
-from sklearn.model_selection import train_test_split
+import json
+import time
+import logging
+import threading
+import multiprocessing
+from functools import partial
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections.abc import Mapping
+from lazy import lazy_import
+from dataset import load_dataset, dataset_hash, FEATURES, LONG_NAMES
+from utils import validate_patient_batch
+from evaluation import EvaluationCache
+from bundle import read_bundle, write_bundle
+from inference import compile_bundle
+from registry import ModelRegistry
+from prediction_cache import PredictionCache, canonical_rows
+
+log = logging.getLogger(__name__)
+
+# Bibliotecile grele se incarca la prima utilizare (antrenare, incarcare artefacte, predictie),
+# astfel incat importul modulului de catre interfata sa ramana ieftin
+joblib = lazy_import("joblib")
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+ml_config = {
+    # Plafonul de memorie (octeti) pentru artefactele tinute incarcate; 0 = nelimitat
+    'max_bytes': int(os.environ.get("ML_MAX_BYTES", "0")) or None,
+    # Numarul de procese folosite la antrenare; 0 = toate nucleele disponibile
+    'workers': int(os.environ.get("ML_WORKERS", "0")) or os.cpu_count() or 1,
+    # Procesele de antrenare pornesc curat ("spawn"): un fork dintr-un proces cu mai multe fire (Tk, pool-uri,
+    # jurnalul de predictii) poate mosteni un lacat ocupat si se poate bloca
+    'mp_start': os.environ.get("ML_MP_START", "spawn"),
+    'seed': 42,
+    # Configuratia castigatoare exportata de search.py; lipsa fisierului inseamna valorile implicite
+    'hyperparams': os.environ.get("ML_HYPERPARAMS", "models/hyperparams.json"),
+    # Firele care evalueaza modelele in paralel la compararea tuturor modelelor (predict_all)
+    'compare_workers': int(os.environ.get("ML_COMPARE_WORKERS", "4"))
+}
+
+# Hiperparametrii folositi cand nu exista o configuratie exportata
+DEFAULT_PARAMS = {
+    'SVM': {'C': 1.0, 'gamma': 'scale'},
+    'MLP': {'hidden_layer_sizes': [50, 25], 'alpha': 0.0001, 'max_iter': 1000}
+}
+
+GENDER_CODES = {'male': 1, 'm': 1, 'masculin': 1, 'female': 0, 'f': 0, 'feminin': 0}
+
+def to_feature_matrix(data):
+    """
+    Converteste un DataFrame (coloane scurte sau lungi ILPD) ori un array in matricea N x 10 a modelelor
+    Genul poate fi dat numeric (0/1) sau text (Male/Female, Masculin/Feminin, M/F)
+    """
+    if hasattr(data, 'columns'):
+        names = [LONG_NAMES.get(c, c) for c in FEATURES]
+        if all(c in data.columns for c in FEATURES): data = data[FEATURES]
+        elif all(c in data.columns for c in names): data = data[names]
+        else: data = data.iloc[:, :len(FEATURES)]
+        gender = data.iloc[:, 1]
+        if not pd.api.types.is_numeric_dtype(gender):
+            data = data.assign(**{data.columns[1]: gender.map(lambda g: GENDER_CODES.get(str(g).strip().lower()))})
+        # Valorile nenumerice devin NaN si sunt raportate ulterior de validare
+        return data.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+    X = np.asarray(data, dtype=np.float64)
+    return X.reshape(1, -1) if X.ndim == 1 else X
+
+def load_hyperparams(path=None):
+    """
+    Citeste configuratia exportata de cautarea de hiperparametri, completata cu valorile implicite
+    """
+    params = {name: dict(values) for name, values in DEFAULT_PARAMS.items()}
+    path = path or ml_config['hyperparams']
+    if not os.path.exists(path): return params
+    try:
+        with open(path, encoding='utf-8') as f: exported = json.load(f)
+        for name in params: params[name].update(exported.get(name, {}).get('params', {}))
+    except Exception as e:
+        log.warning("Hiperparametrii din %s nu au putut fi cititi, se folosesc cei impliciti: %s", path, e)
+    return params
+
+def build_model(name, seed, params=None):
+    """
+    Construieste estimatorul neantrenat pentru algoritmul cerut
+    Fara params explicit se folosesc hiperparametrii exportati (sau cei impliciti)
+    """
+    from sklearn.svm import SVC
+    from sklearn.neural_network import MLPClassifier
+    params = dict(load_hyperparams()[name] if params is None else params)
+    if name == 'SVM': return SVC(kernel='rbf', probability=True, random_state=seed, **params)
+    if 'hidden_layer_sizes' in params: params['hidden_layer_sizes'] = tuple(params['hidden_layer_sizes'])
+    return MLPClassifier(random_state=seed, **params)
+
+def process_pool(workers):
+    """
+    Pool de procese pentru antrenare, pornit cu metoda din ml_config['mp_start']
+    """
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(ml_config['mp_start']))
+
+def fit_model(X, Y, size, name, seed):
+    """
+    Antreneaza un singur model pe un split (rulata si in procesele worker)
+    Impartirea si scalarea depind doar de seed, deci rezultatul nu depinde de ordinea job-urilor
+    Returneaza: (size, name, model, scaler, secunde)
+    """
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.model_selection import train_test_split
+    start = time.perf_counter()
+    X_train, X_test, y_train, y_test = train_test_split(X, Y, test_size=size, random_state=seed, stratify=Y)
+    sc = StandardScaler(); X_tr_s = sc.fit_transform(X_train)
+    model = build_model(name, seed)
+    model.fit(X_tr_s, y_train)
+    return size, name, model, sc, time.perf_counter() - start
+
+def _sklearn_scores(model, Xs):
+    """
+    Eticheta si probabilitatea clasei 1 pentru randuri deja scalate (drumul sklearn, fara motor compilat)
+    """
+    proba = model.predict_proba(Xs)
+    labels = model.classes_[np.argmax(proba, axis=1)]
+    return labels.astype(int), proba[:, list(model.classes_).index(1)]
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+class LazyModels(Mapping):
+    """
+    Dictionar lazy split -> modele: fiecare artefact (SVM, MLP, SCALER) este citit de pe disc
+    la prima cerere si eliberat in ordine LRU cand se depaseste plafonul de memorie
+    """
+    NAMES = ('SVM', 'MLP', 'SCALER')
+
+    def __init__(self, max_bytes=None):
+        self.max_bytes = max_bytes
+        self.load_stats = {}
+        self._paths = {}
+        self._bundle_paths = {}
+        self._bundles = {}
+        self._versions = {}
+        self._loaded = OrderedDict()
+        self._lock = threading.RLock()
+
+    def register(self, size, paths, objects=None, bundle=None, version=None):
+        """
+        Inregistreaza fisierele unui split; obiectele deja construite (ex. la antrenare) intra direct in cache
+        Reinregistrarea inlocuieste atomic modelele servite: predictiile in curs pastreaza referintele vechi
+        """
+        with self._lock:
+            self._paths[size] = {'SVM': paths['SVM'], 'MLP': paths['MLP'], 'SCALER': paths['SC']}
+            self._bundles.pop(size, None)
+            self._versions[size] = version
+            for key in [k for k in self._loaded if k[0] == size]: del self._loaded[key]
+            if bundle: self._bundle_paths[size] = bundle
+            for name, obj in (objects or {}).items():
+                self._store((size, name), obj, self._file_size(self._paths[size][name]))
+
+    def get_model(self, size, name):
+        """
+        Returneaza artefactul cerut, incarcandu-l de pe disc daca nu este in memorie
+        """
+        key = (size, name)
+        with self._lock:
+            if key in self._loaded:
+                self._loaded.move_to_end(key)
+                return self._loaded[key][0]
+            path = self._paths[size][name]
+            start = time.perf_counter()
+            obj = joblib.load(path)
+            elapsed = time.perf_counter() - start
+            nbytes = self._file_size(path)
+            stats = self.load_stats.setdefault(key, {'loads': 0, 'seconds': 0.0, 'bytes': 0})
+            stats['loads'] += 1; stats['seconds'] = elapsed; stats['bytes'] = nbytes
+            log.info("Incarcat %s split %s in %.1f ms (%d octeti)", name, size, elapsed * 1000, nbytes)
+            self._store(key, obj, nbytes)
+            return obj
+
+    def get_bundle(self, size):
+        """
+        Returneaza pachetul mapat in memorie al split-ului (None daca nu are cale inregistrata)
+        Daca pachetul lipseste sau e mai vechi decat artefactele joblib, este reexportat din acestea
+        """
+        with self._lock:
+            if size in self._bundles: return self._bundles[size]
+            path = self._bundle_paths.get(size)
+            if path is None: return None
+            if self._bundle_stale(size, path):
+                models = self[size]
+                write_bundle(path, models['SVM'], models['MLP'], models['SCALER'], {'split': size})
+                log.info("Exportat pachetul %s", path)
+            start = time.perf_counter()
+            bundle = self._bundles[size] = read_bundle(path)
+            log.info("Mapat pachetul split %s in %.2f ms", size, (time.perf_counter() - start) * 1000)
+            return bundle
+
+    def _bundle_stale(self, size, path):
+        if not os.path.exists(path): return True
+        built = os.path.getmtime(path)
+        return any(os.path.exists(p) and os.path.getmtime(p) > built for p in self._paths[size].values())
+
+    def version(self, size):
+        """
+        Eticheta versiunii servite a split-ului (din registrul de modele), None daca nu este cunoscuta
+        """
+        with self._lock: return self._versions.get(size)
+
+    @property
+    def lock(self): return self._lock
+
+    def memory_usage(self):
+        """
+        Returneaza numarul de octeti estimat pentru artefactele aflate in memorie
+        """
+        with self._lock: return sum(nbytes for _, nbytes in self._loaded.values())
+
+    def loaded_keys(self):
+        with self._lock: return list(self._loaded)
+
+    def _store(self, key, obj, nbytes):
+        self._loaded[key] = (obj, nbytes)
+        self._loaded.move_to_end(key)
+        # Elibereaza cele mai vechi artefacte, dar il pastreaza mereu pe cel tocmai cerut
+        while self.max_bytes and len(self._loaded) > 1 and self.memory_usage() > self.max_bytes:
+            old_key, (_, old_bytes) = self._loaded.popitem(last=False)
+            log.info("Eliberat %s split %s (%d octeti)", old_key[1], old_key[0], old_bytes)
+
+    @staticmethod
+    def _file_size(path):
+        try: return os.path.getsize(path)
+        except (OSError, TypeError): return 0
+
+    def __getitem__(self, size):
+        if size not in self._paths: raise KeyError(size)
+        return _SplitModels(self, size)
+
+    def __iter__(self): return iter(list(self._paths))
+
+    def __len__(self): return len(self._paths)
+
+class _SplitModels(Mapping):
+    """
+    Vederea unui singur split; accesul la o cheie declanseaza incarcarea lazy
+    """
+    def __init__(self, owner, size):
+        self._owner = owner; self._size = size
+
+    def __getitem__(self, name):
+        if name not in LazyModels.NAMES: raise KeyError(name)
+        return self._owner.get_model(self._size, name)
+
+    def __iter__(self): return iter(LazyModels.NAMES)
+
+    def __len__(self): return len(LazyModels.NAMES)
 
 class MLHandler:
     """
     Gestioneaza intregul flux de lucru ML de la incarcarea datelor la antrenare si salvare
     """
-    def __init__(self, test_sizes):
+    def __init__(self, test_sizes, max_bytes=None, workers=None):
         self.test_sizes = test_sizes
-        self.models_data = {}
+        self.workers = workers or ml_config['workers']
+        self.models_data = LazyModels(max_bytes if max_bytes is not None else ml_config['max_bytes'])
+        self.train_report = []
+        self.evaluations = EvaluationCache()
+        self.registry = ModelRegistry()
+        self.predictions = PredictionCache()
+        self.compare_pool = ThreadPoolExecutor(max_workers=ml_config['compare_workers'], thread_name_prefix="ml-compare")
+        # Motoarele de inferenta compilate, cheiate pe split si legate de pachetul din care provin
+        self._engines = {}
 
     def initialize_ml_logic(self):
         """
         Pregateste mediul de lucru si asigura disponibilitatea modelelor antrenate
-        Returneaza dictionar cu modelele incarcate sau nou antrenate
+        Returneaza dictionar lazy cu modelele (incarcate la prima utilizare) sau nou antrenate
         """
         # Verifica daca directorul pentru modele exista si il creeaza daca e necesar
         if not os.path.exists("models"): os.makedirs("models")
-        url = "https://archive.ics.uci.edu/ml/machine-learning-databases/00225/Indian%20Liver%20Patient%20Dataset%20(ILPD).csv"
-        cols = ['Age', 'Gender', 'TB', 'DB', 'Alk', 'Sgpt', 'Sgot', 'TP', 'ALB', 'AG', 'Dataset']
         try:
-            # Incarca setul
-            df = pd.read_csv(url, names=cols, header=None).dropna()
-            df['Gender'] = df['Gender'].map({'Female': 0, 'Male': 1})
-            df['Dataset'] = df['Dataset'].map({1: 1, 2: 0})
-            
+            missing = []
             for size in self.test_sizes:
-                suffix = str(int(size * 100))
-                f_paths = {
-                    'SVM': f"models/svm_{suffix}.pkl", 
-                    'MLP': f"models/mlp_{suffix}.pkl", 
-                    'SC': f"models/scaler_{suffix}.pkl"
-                }
-                # Verifica daca modelele exista deja pe disc
+                f_paths = self.artifact_paths(size)
+                # Daca modelele exista pe disc sunt doar inregistrate, citirea se face la prima cerere
                 if all(os.path.exists(path) for path in f_paths.values()):
-                    self.models_data[size] = {
-                        'SVM': joblib.load(f_paths['SVM']), 
-                        'MLP': joblib.load(f_paths['MLP']), 
-                        'SCALER': joblib.load(f_paths['SC'])
-                    }
+                    self.models_data.register(size, f_paths, bundle=self.bundle_path(size), version=self._adopt(size, f_paths))
+                else:
+                    missing.append(size)
+
+            # Setul de date este necesar doar daca lipseste cel putin un split antrenat
+            if missing:
+                df = load_dataset()
+                if self.workers > 1:
+                    self.train_parallel(df, missing)
                 else:
                     # Antreneaza modelele de la zero daca fisierele nu sunt gasite
-                    self.train_split(df, size, f_paths)
+                    for size in missing: self.train_split(df, size, self.artifact_paths(size))
+                self.refresh_evaluation()
             return self.models_data
         except Exception as e:
             print(f"Eroare ML: {e}")
             return {}
 
+    def _adopt(self, size, f_paths):
+        """
+        Versiunea fisierelor existente: cea curenta din registru daca amprentele corespund,
+        altfel fisierele (puse manual sau dintr-o versiune mai veche a aplicatiei) devin o versiune noua
+        """
+        try:
+            if not self.registry.matches(size, f_paths): self.registry.record(size, f_paths, 'import')
+            return self.registry.current(size)['version']
+        except Exception as e:
+            log.warning("Split %s nu a putut fi inregistrat in registrul de modele: %s", size, e)
+            return None
+
+    def model_version(self, split, algo):
+        """
+        Eticheta salvata cu fiecare predictie, ex. 'SVM-20-v3'
+        """
+        version = self.models_data.version(split)
+        return f"{algo}-{int(split * 100)}-{version}" if version else None
+
+    def activate(self, size, version):
+        """
+        Revine la o versiune arhivata: fisierele sunt inlocuite atomic si modelele servite schimbate fara repornire
+        """
+        f_paths = self.artifact_paths(size)
+        # Sub lacatul modelelor: nicio predictie nu poate citi fisierele noi sub eticheta versiunii vechi
+        with self.models_data.lock:
+            entry = self.registry.restore(size, version, f_paths)
+            self.models_data.register(size, f_paths, bundle=self.bundle_path(size), version=entry['version'])
+            self.predictions.invalidate(size)
+        self.refresh_evaluation()
+        return entry
+
+    @staticmethod
+    def artifact_paths(size):
+        """
+        Returneaza caile fisierelor salvate pentru un split
+        """
+        suffix = str(int(size * 100))
+        return {
+            'SVM': f"models/svm_{suffix}.pkl", 
+            'MLP': f"models/mlp_{suffix}.pkl", 
+            'SC': f"models/scaler_{suffix}.pkl"
+        }
+
+    @staticmethod
+    def bundle_path(size):
+        """
+        Returneaza calea pachetului mapabil in memorie (bundle.py) al unui split
+        """
+        return f"models/bundle_{int(size * 100)}.bin"
+
+    def export_bundle(self, size):
+        """
+        Scrie pachetul split-ului din modelele curente si il reinregistreaza, pastrand versiunea servita
+        """
+        with self.models_data.lock:
+            models, version = self.models_data[size], self.models_data.version(size)
+            path = write_bundle(self.bundle_path(size), models['SVM'], models['MLP'], models['SCALER'],
+                                {'split': size, 'version': version})
+            self.models_data.register(size, self.artifact_paths(size), bundle=path, version=version)
+        return path
+
+    def train_parallel(self, df, sizes):
+        """
+        Distribuie job-urile (split, algoritm) pe un pool de procese si salveaza rezultatele
+        Fiecare job primeste acelasi seed ca antrenarea secventiala, deci modelele sunt identice
+        """
+        X = df.drop('Dataset', axis=1); Y = df['Dataset']
+        seed = ml_config['seed']
+        start = time.perf_counter()
+        results = {}
+        with process_pool(self.workers) as pool:
+            jobs = [pool.submit(fit_model, X, Y, size, name, seed) for size in sizes for name in ('SVM', 'MLP')]
+            for job in jobs:
+                size, name, model, sc, elapsed = job.result()
+                results.setdefault(size, {})[name] = model
+                results[size]['SCALER'] = sc
+                self._record_timing(size, name, elapsed)
+
+        for size in sizes: self.save_split(size, results[size])
+        log.info("Antrenare paralela: %d job-uri pe %d procese in %.2f s",
+                 2 * len(sizes), self.workers, time.perf_counter() - start)
+
+    def predict_batch(self, data, split, algo):
+        """
+        Valideaza, scaleaza si clasifica N pacienti printr-un singur apel vectorizat
+        Eticheta este derivata din aceeasi probabilitate, deci este mereu coerenta cu ea
+        Returneaza: (etichete np.ndarray int, probabilitati risc ridicat np.ndarray float)
+        """
+        labels, proba, _ = self.predict_versioned(data, split, algo)
+        return labels, proba
+
+    def predict_versioned(self, data, split, algo):
+        """
+        Ca predict_batch, dar returneaza si eticheta versiunii care a produs rezultatul
+        Versiunea si modelele sunt citite impreuna, deci o inlocuire concurenta nu le poate amesteca
+        Randurile deja scorate de aceeasi versiune (si duplicatele din lot) sunt servite din PredictionCache
+        Returneaza: (etichete, probabilitati, versiune)
+        """
+        X = self._validated(data)
+        with self.models_data.lock:
+            version = self.model_version(split, algo)
+            engine = self.engine(split)
+            if engine is None:
+                models = self.models_data[split]
+                sc, model = models['SCALER'], models[algo]
+
+        def compute(X):
+            if engine is not None:
+                labels, proba = engine.predict(X, algo)
+                return labels.astype(int), proba
+            # Scalare directa cu parametrii scalerului, fara validarile sklearn la fiecare apel
+            return _sklearn_scores(model, (X - sc.mean_) / sc.scale_)
+
+        # Fara o versiune cunoscuta rezultatele nu pot fi legate de modelul care le-a produs
+        if version is None or not self.predictions.max_entries: return (*compute(X), version)
+
+        R, keys = canonical_rows(X)
+        labels = np.empty(len(keys), dtype=int); proba = np.empty(len(keys))
+        missing = {}
+        for i, (key, hit) in enumerate(zip(keys, self.predictions.lookup(split, algo, version, keys))):
+            if hit is None: missing.setdefault(key, []).append(i)
+            else: labels[i], proba[i] = hit
+        if missing:
+            rows = list(missing.values())
+            new_labels, new_proba = compute(R[[r[0] for r in rows]])
+            self.predictions.store(split, algo, version, list(missing), new_labels, new_proba)
+            for r, label, prob in zip(rows, new_labels, new_proba): labels[r] = label; proba[r] = prob
+        return labels, proba, version
+
+    def predict_all(self, data, algos=('SVM', 'MLP')):
+        """
+        Scoreaza aceleasi randuri cu toate modelele incarcate (fiecare split x algoritm) intr-un singur apel
+        Validarea se face o data, scalarea o data pentru fiecare scaler distinct, iar modelele ruleaza in paralel
+        Returneaza: lista {split, algo, labels, probabilities, version, ms}, ordonata dupa split si algoritm
+        """
+        X = self._validated(data)
+        # Toate split-urile sunt citite sub acelasi lock, deci tabelul corespunde unui singur set de versiuni
+        plans = []
+        with self.models_data.lock:
+            for split in sorted(self.models_data):
+                engine = self.engine(split)
+                if engine is not None:
+                    key, scale = engine.scaler_key, engine.scale
+                    fns = {algo: partial(engine.predict, algo=algo, scaled=True) for algo in algos}
+                else:
+                    models = self.models_data[split]
+                    sc = models['SCALER']
+                    key = sc.mean_.tobytes() + sc.scale_.tobytes()
+                    scale = lambda X, sc=sc: (X - sc.mean_) / sc.scale_
+                    fns = {algo: partial(_sklearn_scores, models[algo]) for algo in algos}
+                plans.append((split, key, scale, {algo: (self.model_version(split, algo), fn) for algo, fn in fns.items()}))
+
+        scaled, jobs = {}, []
+        for split, key, scale, fns in plans:
+            if key not in scaled: scaled[key] = scale(X)
+            for algo, (version, fn) in fns.items():
+                jobs.append((split, algo, version, self.compare_pool.submit(_timed, fn, scaled[key])))
+
+        results = []
+        for split, algo, version, future in jobs:
+            (labels, proba), elapsed = future.result()
+            results.append({'split': split, 'algo': algo, 'labels': np.asarray(labels).astype(int),
+                            'probabilities': proba, 'version': version, 'ms': elapsed * 1000})
+        return results
+
+    @staticmethod
+    def _validated(data):
+        """
+        Matricea de trasaturi a datelor primite; orice rand invalid respinge intreaga cerere
+        """
+        X = to_feature_matrix(data)
+        valid, errors = validate_patient_batch(X)
+        if errors:
+            shown = "; ".join(f"rand {row}: {msg}" for row, msg in errors[:5])
+            raise ValueError(f"{len(errors)} randuri invalide ({shown})")
+        return X
+
+    def engine(self, split):
+        """
+        Returneaza motorul numpy compilat din pachetul split-ului (inference.py)
+        Daca pachetul nu este disponibil, returneaza None si predictia trece prin sklearn
+        """
+        try: bundle = self.models_data.get_bundle(split)
+        except Exception as e:
+            log.warning("Pachetul split %s indisponibil, se foloseste sklearn: %s", split, e)
+            return None
+        if bundle is None: return None
+        cached = self._engines.get(split)
+        if cached is None or cached[0] is not bundle:
+            cached = self._engines[split] = (bundle, compile_bundle(bundle))
+        return cached[1]
+
+    def refresh_evaluation(self):
+        """
+        Recalculeaza raportul de evaluare imediat dupa antrenare, ca StatisticsFrame sa il primeasca instant
+        """
+        try: report = self.evaluations.refresh(self)
+        except Exception as e:
+            log.warning("Raportul de evaluare nu a putut fi actualizat: %s", e)
+            return
+        # Metricile pe setul ILPD sunt atasate versiunii curente a fiecarui split
+        for size in self.models_data:
+            metrics = {r['model']: {k: r[k] for k in ('accuracy', 'precision', 'recall', 'f1')}
+                       for r in report['models'] if r['split'] == size}
+            try: self.registry.set_metrics(size, metrics)
+            except Exception as e: log.warning("Metricile nu au putut fi salvate in registru: %s", e)
+
+    def _record_timing(self, size, name, elapsed):
+        self.train_report.append({'split': size, 'model': name, 'seconds': elapsed})
+        log.info("Antrenat %s split %s in %.2f s", name, size, elapsed)
+
     def train_split(self, df, size, f_paths):
         """
         Realizeaza impartirea datelor scalarea si antrenarea a algoritmilor
         """
         X = df.drop('Dataset', axis=1); Y = df['Dataset']
-        X_train, X_test, y_train, y_test = train_test_split(X, Y, test_size=size, random_state=42, stratify=Y)
-    
-        sc = StandardScaler(); X_tr_s = sc.fit_transform(X_train)
+        seed = ml_config['seed']
         
-        #SVM si MLP 
-        svm = SVC(kernel='rbf', probability=True, random_state=42)
-        mlp = MLPClassifier(hidden_layer_sizes=(50, 25), max_iter=1000, random_state=42)
-        
-        # Antreneaza ambele modele 
-        svm.fit(X_tr_s, y_train); mlp.fit(X_tr_s, y_train)
+        #SVM si MLP (scalerul depinde doar de split, deci este acelasi pentru ambele)
+        _, _, svm, sc, t_svm = fit_model(X, Y, size, 'SVM', seed)
+        _, _, mlp, _, t_mlp = fit_model(X, Y, size, 'MLP', seed)
+        self._record_timing(size, 'SVM', t_svm); self._record_timing(size, 'MLP', t_mlp)
         
         # salveaza modelele 
-        joblib.dump(svm, f_paths['SVM'])
-        joblib.dump(mlp, f_paths['MLP'])
-        joblib.dump(sc, f_paths['SC'])
-        self.models_data[size] = {'SVM': svm, 'MLP': mlp, 'SCALER': sc}
\ No newline at end of file
+        self.save_split(size, {'SVM': svm, 'MLP': mlp, 'SCALER': sc}, f_paths)
+
+    def save_split(self, size, objects, f_paths=None, source='train', **info):
+        """
+        Salveaza artefactele joblib si pachetul unui split, le inregistreaza ca versiune noua,
+        apoi inlocuieste modelele servite (fara repornirea aplicatiei)
+        """
+        f_paths = f_paths or self.artifact_paths(size)
+        keys = (('SVM', 'SVM'), ('MLP', 'MLP'), ('SCALER', 'SC'))
+        # Scriere in fisier temporar + redenumire: un cititor concurent nu vede niciodata un fisier pe jumatate
+        for name, key in keys:
+            with open(f_paths[key] + ".tmp", 'wb') as f: joblib.dump(objects[name], f)
+        info.setdefault('hyperparams', load_hyperparams())
+        info.setdefault('data_sha', self._data_sha())
+        # Ca in activate(): nicio predictie nu poate incarca fisierele noi sub eticheta versiunii vechi
+        with self.models_data.lock:
+            for _, key in keys: os.replace(f_paths[key] + ".tmp", f_paths[key])
+            version = None
+            try: version = self.registry.record(size, f_paths, source, **info)['version']
+            except Exception as e:
+                log.warning("Split %s nu a putut fi inregistrat in registrul de modele: %s", size, e)
+            self.models_data.register(size, f_paths, objects, self._write_bundle(size, objects, version), version)
+            self.predictions.invalidate(size)
+
+    @staticmethod
+    def _data_sha():
+        """
+        Amprenta setului ILPD daca este deja disponibil local (fara descarcare)
+        """
+        try: return dataset_hash(offline=True)
+        except Exception: return None
+
+    def _write_bundle(self, size, objects, version=None):
+        """
+        Exporta pachetul imediat dupa antrenare; un esec nu afecteaza artefactele joblib
+        """
+        try: return write_bundle(self.bundle_path(size), objects['SVM'], objects['MLP'], objects['SCALER'],
+                                 {'split': size, 'version': version})
+        except Exception as e:
+            log.warning("Pachetul split %s nu a putut fi scris: %s", size, e)
+            return None
@@ -29,23 +29,14 @@ from sklearn.svm import SVC
 from sklearn.neural_network import MLPClassifier
 from sklearn.metrics import accuracy_score, roc_curve, auc
 from sklearn.ensemble import IsolationForest
+from dataset import load_dataset, LONG_NAMES
 
 """
-Incarcarea setului de date ILPD de la sursa externa si 
-preprocesarea acestuia prin eliminarea valorilor lipsa si maparea 
+Incarcarea setului de date ILPD din cache-ul local comun (descarcat o singura data),
+deja preprocesat prin eliminarea valorilor lipsa si maparea 
 variabilelor categorice in format numeric 
 """
-url = "https://archive.ics.uci.edu/ml/machine-learning-databases/00225/Indian%20Liver%20Patient%20Dataset%20(ILPD).csv"
-column_names = ['Age', 'Gender', 'Total_Bilirubin', 'Direct_Bilirubin',
-                'Alkaline_Phosphotase', 'Alamine_Aminotransferase',
-                'Aspartate_Aminotransferase', 'Total_Protiens',
-                'Albumin', 'Albumin_and_Globulin_Ratio', 'Dataset']
-
-df = pd.read_csv(url, names=column_names, header=None)
-df = df.dropna()
-
-df['Gender'] = df['Gender'].map({'Female': 0, 'Male': 1})
-df['Dataset'] = df['Dataset'].map({1: 1, 2: 0})
+df = load_dataset().rename(columns=LONG_NAMES).rename(columns={'Total_Proteins': 'Total_Protiens'})
 
 X = df.drop('Dataset', axis=1)
 Y = df['Dataset']
@@ -0,0 +1,96 @@
+##########################################################################
+#                                                                        #
+#  Copyright:   (c) 2026, Proiect MPS                                    #
+#  Autori:      Albu A. Sorin (R.Moldova) 1409A                          #
+#               Glavan P. Pavel (R.Moldova) 1409A                        #
+#               Duda I.I. Andrei-Ionuț 1409A                             #
+#               Jireadă C. Teodor 1409A                                  #
+#               Popovici I.L. Andrei 1409A                               #
+#               Noroc D. Sorin (R.Moldova) 1409A                         #
+#               Timofte C. Constantin 1409A                              #
+#               Matei I. Ion (R.Moldova) 1410B                           #
+#                                                                        #
+#  Descriere:   Sistem Expert pentru Predictia Bolilor Hepatice          #
+#               Utilizand algoritmii SVM si Multilayer Perceptron (MLP)  #
+#               Bazat pe setul de date ILPD (Indian Liver Patient)       #
+#                                                                        #
+#  Acest cod si informatiile sunt oferite "ca atare" fara nicio garantie #
+#  de orice fel, exprimata sau implicita. Acest proiect este realizat    #
+#  in scop didactic pentru disciplina Managementul Proiectelor Software. #
+#                                                                        #
+##########################################################################
+import os
+import threading
+from collections import OrderedDict
+from lazy import lazy_import
+
+np = lazy_import("numpy")
+
+prediction_cache_config = {
+    # Numarul maxim de rezultate pastrate (LRU); 0 dezactiveaza cache-ul
+    'max_entries': int(os.environ.get("PREDICTION_CACHE_SIZE", "10000")),
+    # Zecimalele pastrate la canonicalizare: valori egale dupa rotunjire dau acelasi rezultat
+    'decimals': 6
+}
+
+def canonical_rows(X, decimals=None):
+    """
+    Forma canonica a randurilor: rotunjite si cu -0.0 normalizat, ca sa compare egal octet cu octet
+    Returneaza: (matricea rotunjita, cheile randurilor ca bytes)
+    """
+    decimals = prediction_cache_config['decimals'] if decimals is None else decimals
+    R = np.ascontiguousarray(np.round(np.asarray(X, dtype=np.float64), decimals) + 0.0)
+    return R, [row.tobytes() for row in R]
+
+class PredictionCache:
+    """
+    Cache LRU marginit in fata modelelor: cheia este (split, algoritm, versiune model, vector canonic)
+    Versiunea face parte din cheie, iar invalidate() goleste split-ul la orice inlocuire de model
+    """
+    def __init__(self, max_entries=None):
+        self.max_entries = prediction_cache_config['max_entries'] if max_entries is None else max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def lookup(self, split, algo, version, keys):
+        """
+        Returneaza lista (eticheta, probabilitate) sau None pentru fiecare cheie
+        """
+        out = []
+        with self._lock:
+            for key in keys:
+                full = (split, algo, version, key)
+                hit = self._data.get(full)
+                if hit is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                    self._data.move_to_end(full)
+                out.append(hit)
+        return out
+
+    def store(self, split, algo, version, keys, labels, probs):
+        if not self.max_entries: return
+        with self._lock:
+            for key, label, prob in zip(keys, labels, probs):
+                self._data[(split, algo, version, key)] = (int(label), float(prob))
+                self._data.move_to_end((split, algo, version, key))
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, split=None):
+        """
+        Elimina rezultatele unui split (sau toate); apelata cand registrul schimba modelele servite
+        """
+        with self._lock:
+            if split is None: self._data.clear(); return
+            for key in [k for k in self._data if k[0] == split]: del self._data[key]
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {'entries': len(self._data), 'max_entries': self.max_entries, 'hits': self.hits,
+                    'misses': self.misses, 'evictions': self.evictions,
+                    'hit_rate': self.hits / total if total else 0.0}
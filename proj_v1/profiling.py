@@ -0,0 +1,90 @@
+##########################################################################
+#                                                                        #
+#  Copyright:   (c) 2026, Proiect MPS                                    #
+#  Autori:      Albu A. Sorin (R.Moldova) 1409A                          #
+#               Glavan P. Pavel (R.Moldova) 1409A                        #
+#               Duda I.I. Andrei-Ionuț 1409A                             #
+#               Jireadă C. Teodor 1409A                                  #
+#               Popovici I.L. Andrei 1409A                               #
+#               Noroc D. Sorin (R.Moldova) 1409A                         #
+#               Timofte C. Constantin 1409A                              #
+#               Matei I. Ion (R.Moldova) 1410B                           #
+#                                                                        #
+#  Descriere:   Sistem Expert pentru Predictia Bolilor Hepatice          #
+#               Utilizand algoritmii SVM si Multilayer Perceptron (MLP)  #
+#               Bazat pe setul de date ILPD (Indian Liver Patient)       #
+#                                                                        #
+#  Acest cod si informatiile sunt oferite "ca atare" fara nicio garantie #
+#  de orice fel, exprimata sau implicita. Acest proiect este realizat    #
+#  in scop didactic pentru disciplina Managementul Proiectelor Software. #
+#                                                                        #
+##########################################################################
+import os
+import re
+import sys
+import argparse
+import subprocess
+
+profiling_config = {
+    # Modulele aplicatiei importate inainte de aparitia primei ferestre
+    'modules': ['database', 'ml_logic', 'workers', 'gui_frames'],
+    # Bibliotecile care nu trebuie incarcate la pornire (doar pe caile care le folosesc)
+    'heavy': ['numpy', 'pandas', 'sklearn', 'joblib', 'mysql.connector'],
+    # Bugetul (ms) pentru importul la rece al modulelor fara interfata grafica
+    'import_budget_ms': 1500
+}
+
+LINE_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+def parse_importtime(text):
+    """
+    Interpreteaza iesirea "python -X importtime" (stderr)
+    Returneaza: lista de dictionare {module, self_us, cumulative_us, depth}, in ordinea importului
+    """
+    rows = []
+    for line in text.splitlines():
+        m = LINE_PATTERN.match(line)
+        if m is None: continue
+        rows.append({'module': m.group(4), 'self_us': int(m.group(1)), 'cumulative_us': int(m.group(2)),
+                     'depth': (len(m.group(3)) - 1) // 2})
+    return rows
+
+def import_time_report(modules=None, python=None, cwd=None):
+    """
+    Importa modulele intr-un proces nou cu -X importtime (import la rece, fara cache in memorie)
+    Returneaza: (randurile masurate, lista modulelor grele incarcate)
+    """
+    modules = modules or profiling_config['modules']
+    code = ("import sys; import " + ", ".join(modules) +
+            "; print(','.join(m for m in %r if m in sys.modules))" % (profiling_config['heavy'],))
+    proc = subprocess.run([python or sys.executable, "-X", "importtime", "-c", code],
+                          cwd=cwd or os.path.dirname(os.path.abspath(__file__)),
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importul a esuat: {proc.stderr.strip().splitlines()[-1:]}")
+    heavy = [m for m in proc.stdout.strip().split(",") if m]
+    return parse_importtime(proc.stderr), heavy
+
+def format_report(rows, heavy=(), top=15):
+    """
+    Construieste textul raportului: totalul si modulele cu cel mai mare timp cumulat
+    """
+    total = sum(r['cumulative_us'] for r in rows if r['depth'] == 0)
+    lines = [f"Timp total de import: {total / 1000:.1f} ms ({len(rows)} module)"]
+    lines.append(f"{'Cumulat (ms)':>13} {'Propriu (ms)':>13}  Modul")
+    for r in sorted(rows, key=lambda r: r['cumulative_us'], reverse=True)[:top]:
+        lines.append(f"{r['cumulative_us'] / 1000:13.1f} {r['self_us'] / 1000:13.1f}  {'  ' * r['depth']}{r['module']}")
+    lines.append("Biblioteci grele incarcate la pornire: " + (", ".join(heavy) if heavy else "niciuna"))
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Raport al timpilor de import la pornirea aplicatiei")
+    parser.add_argument("modules", nargs="*", help="module de masurat (implicit cele ale aplicatiei)")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+    try:
+        rows, heavy = import_time_report(args.modules or None)
+        print(format_report(rows, heavy, args.top))
+    except Exception as e:
+        print(f"Eroare: {e}")
+        sys.exit(1)
@@ -0,0 +1,174 @@
+##########################################################################
+#                                                                        #
+#  Copyright:   (c) 2026, Proiect MPS                                    #
+#  Autori:      Albu A. Sorin (R.Moldova) 1409A                          #
+#               Glavan P. Pavel (R.Moldova) 1409A                        #
+#               Duda I.I. Andrei-Ionuț 1409A                             #
+#               Jireadă C. Teodor 1409A                                  #
+#               Popovici I.L. Andrei 1409A                               #
+#               Noroc D. Sorin (R.Moldova) 1409A                         #
+#               Timofte C. Constantin 1409A                              #
+#               Matei I. Ion (R.Moldova) 1410B                           #
+#                                                                        #
+#  Descriere:   Sistem Expert pentru Predictia Bolilor Hepatice          #
+#               Utilizand algoritmii SVM si Multilayer Perceptron (MLP)  #
+#               Bazat pe setul de date ILPD (Indian Liver Patient)       #
+#                                                                        #
+#  Acest cod si informatiile sunt oferite "ca atare" fara nicio garantie #
+#  de orice fel, exprimata sau implicita. Acest proiect este realizat    #
+#  in scop didactic pentru disciplina Managementul Proiectelor Software. #
+#                                                                        #
+##########################################################################
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import threading
+from evaluation import file_sha256
+
+log = logging.getLogger(__name__)
+
+registry_config = {
+    'path': os.environ.get("MODEL_REGISTRY", "models/registry.json"),
+    # Copiile artefactelor fiecarei versiuni, pentru revenirea la o versiune anterioara
+    'archive': os.environ.get("MODEL_ARCHIVE", "models/versions"),
+    # Versiuni pastrate in arhiva per split (versiunea curenta nu este stearsa niciodata)
+    'keep': 10
+}
+
+class RegistryError(Exception):
+    """
+    Versiunea ceruta nu exista sau arhiva ei nu mai este disponibila
+    """
+
+def atomic_copy(src, dst):
+    """
+    Copiaza prin fisier temporar + redenumire: cititorii vad fie fisierul vechi, fie pe cel complet
+    """
+    tmp = dst + ".tmp"
+    shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+class ModelRegistry:
+    """
+    Evidenta versiunilor de modele (registry.json): pentru fiecare versiune a unui split se retin
+    amprentele artefactelor, sursa (antrenare, re-antrenare, import), hiperparametrii, amprenta setului
+    de date si metricile; fisierele din models/ sunt mereu versiunea curenta
+    """
+    def __init__(self, path=None, archive=None):
+        self.path = path or registry_config['path']
+        self.archive = archive or registry_config['archive']
+        self._lock = threading.RLock()
+        self.data = self._read()
+
+    def _read(self):
+        if not os.path.exists(self.path): return {'current': {}, 'versions': []}
+        try:
+            with open(self.path, encoding='utf-8') as f: return json.load(f)
+        except Exception as e:
+            log.warning("Registrul de modele %s este ilizibil, se porneste unul nou: %s", self.path, e)
+            return {'current': {}, 'versions': []}
+
+    def _write(self):
+        folder = os.path.dirname(self.path)
+        if folder and not os.path.exists(folder): os.makedirs(folder)
+        tmp = self.path + ".tmp"
+        with open(tmp, 'w', encoding='utf-8') as f: json.dump(self.data, f, indent=2)
+        os.replace(tmp, self.path)
+
+    def entries(self, size=None):
+        with self._lock:
+            return [e for e in self.data['versions'] if size is None or e['split'] == size]
+
+    def current(self, size):
+        """
+        Returneaza intrarea versiunii curente a split-ului (sau None)
+        """
+        with self._lock:
+            version = self.data['current'].get(str(size))
+            return self._find(size, version) if version else None
+
+    def _find(self, size, version):
+        for e in self.data['versions']:
+            if e['split'] == size and e['version'] == version: return e
+        return None
+
+    def matches(self, size, paths):
+        """
+        Verifica daca fisierele de pe disc sunt exact versiunea curenta inregistrata
+        """
+        entry = self.current(size)
+        if entry is None: return False
+        return all(os.path.exists(p) and file_sha256(p) == entry['artifacts'].get(name) for name, p in paths.items())
+
+    def record(self, size, paths, source, **info):
+        """
+        Inregistreaza fisierele curente ale split-ului ca versiune noua si le arhiveaza
+        info: hiperparametri, amprenta setului de date, metrici sau alte detalii ale sursei
+        Returneaza: intrarea noua (cheia 'version' este eticheta folosita in aplicatie)
+        """
+        with self._lock:
+            number = 1 + max((e['number'] for e in self.entries(size)), default=0)
+            version = f"v{number}"
+            folder = os.path.join(self.archive, str(int(size * 100)), version)
+            if not os.path.exists(folder): os.makedirs(folder)
+            for name, path in paths.items(): atomic_copy(path, os.path.join(folder, os.path.basename(path)))
+            entry = {'split': size, 'version': version, 'number': number, 'source': source,
+                     'created': time.strftime("%Y-%m-%d %H:%M:%S"), 'archive': folder,
+                     'artifacts': {name: file_sha256(p) for name, p in paths.items()},
+                     'files': {name: os.path.basename(p) for name, p in paths.items()}}
+            entry.update(info)
+            self.data['versions'].append(entry)
+            self.data['current'][str(size)] = version
+            self._prune(size)
+            self._write()
+            log.info("Split %s: versiunea %s inregistrata (%s)", size, version, source)
+            return entry
+
+    def restore(self, size, version, paths):
+        """
+        Readuce in models/ artefactele unei versiuni arhivate si o marcheaza drept curenta
+        """
+        with self._lock:
+            entry = self._find(size, version)
+            # Arhiva unei versiuni sterse de _prune este None; intrarea ramane doar pentru audit
+            if entry is None or not entry.get('archive') or not os.path.isdir(entry['archive']):
+                raise RegistryError(f"Versiunea {version} a split-ului {size} nu este disponibila.")
+            for name, path in paths.items(): atomic_copy(os.path.join(entry['archive'], entry['files'][name]), path)
+            self.data['current'][str(size)] = version
+            self._write()
+            return entry
+
+    def set_metrics(self, size, metrics):
+        with self._lock:
+            entry = self.current(size)
+            if entry is None: return
+            entry['metrics'] = metrics
+            self._write()
+
+    def _prune(self, size):
+        """
+        Sterge arhivele cele mai vechi peste limita; intrarile raman in registru pentru audit
+        """
+        current = self.data['current'].get(str(size))
+        archived = [e for e in self.entries(size) if e.get('archive') and e['version'] != current]
+        for e in archived[:max(0, len(archived) - registry_config['keep'] + 1)]:
+            shutil.rmtree(e['archive'], ignore_errors=True)
+            e['archive'] = None
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Versiunile modelelor inregistrate")
+    parser.add_argument("--split", type=float, help="doar versiunile acestui split")
+    args = parser.parse_args()
+    try:
+        registry = ModelRegistry()
+        for e in registry.entries(args.split):
+            mark = "*" if registry.data['current'].get(str(e['split'])) == e['version'] else " "
+            acc = ", ".join(f"{m} {v['accuracy']:.3f}" for m, v in (e.get('metrics') or {}).items())
+            print(f"{mark} split {e['split']} {e['version']:<5} {e['created']} {e['source']:<8} {acc}")
+    except Exception as e:
+        print(f"Eroare: {e}")
+        sys.exit(1)
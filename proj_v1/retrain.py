@@ -0,0 +1,230 @@
+##########################################################################
+#                                                                        #
+#  Copyright:   (c) 2026, Proiect MPS                                    #
+#  Autori:      Albu A. Sorin (R.Moldova) 1409A                          #
+#               Glavan P. Pavel (R.Moldova) 1409A                        #
+#               Duda I.I. Andrei-Ionuț 1409A                             #
+#               Jireadă C. Teodor 1409A                                  #
+#               Popovici I.L. Andrei 1409A                               #
+#               Noroc D. Sorin (R.Moldova) 1409A                         #
+#               Timofte C. Constantin 1409A                              #
+#               Matei I. Ion (R.Moldova) 1410B                           #
+#                                                                        #
+#  Descriere:   Sistem Expert pentru Predictia Bolilor Hepatice          #
+#               Utilizand algoritmii SVM si Multilayer Perceptron (MLP)  #
+#               Bazat pe setul de date ILPD (Indian Liver Patient)       #
+#                                                                        #
+#  Acest cod si informatiile sunt oferite "ca atare" fara nicio garantie #
+#  de orice fel, exprimata sau implicita. Acest proiect este realizat    #
+#  in scop didactic pentru disciplina Managementul Proiectelor Software. #
+#                                                                        #
+##########################################################################
+import os
+import sys
+import copy
+import json
+import time
+import logging
+import argparse
+from lazy import lazy_import
+from dataset import load_dataset
+from ml_logic import ml_config, build_model
+from utils import validate_patient_batch
+
+np = lazy_import("numpy")
+
+log = logging.getLogger(__name__)
+
+retrain_config = {
+    # Watermark-ul (ultimul id PREDICTIONS folosit) si statisticile cumulate ale scalerului, per split
+    'state': os.environ.get("RETRAIN_STATE", "models/retrain_state.json"),
+    'batch_rows': 1000,
+    # Epoci partial_fit pentru MLP la fiecare actualizare
+    'mlp_epochs': 5,
+    # Pragurile peste care SVM-ul (care nu se poate actualiza incremental) este reantrenat complet
+    'svm_min_rows': 200,
+    'svm_fraction': 0.10,
+    # Deplasarea maxima a mediei unei caracteristici, in deviatii standard ale scalerului servit
+    'drift_threshold': 0.2
+}
+
+def load_state(path=None):
+    path = path or retrain_config['state']
+    if not os.path.exists(path): return {'watermark': 0, 'splits': {}, 'history': []}
+    with open(path, encoding='utf-8') as f: return json.load(f)
+
+def save_state(state, path=None):
+    """
+    Scrie starea atomic; watermark-ul avanseaza doar dupa ce modelele noi au fost salvate
+    """
+    path = path or retrain_config['state']
+    tmp = path + ".tmp"
+    with open(tmp, 'w', encoding='utf-8') as f: json.dump(state, f, indent=2)
+    os.replace(tmp, path)
+
+def fetch_confirmed(db, after_id, until_id=None, batch=None, ids=False):
+    """
+    Citeste pe pagini (dupa cheie) predictiile confirmate cu id > after_id
+    Returneaza: (X N x 10, y N, ultimul id citit), plus id-urile randurilor daca ids=True
+    """
+    batch = batch or retrain_config['batch_rows']
+    rows, last = [], after_id
+    while True:
+        page = db.fetch_confirmed(last, batch, until_id)
+        rows.extend(page)
+        if len(page) < batch: break
+        last = page[-1][0]
+    if rows: last = rows[-1][0]
+    data = np.array([r[1:] for r in rows], dtype=np.float64).reshape(-1, 11)
+    if ids: return data[:, :10], data[:, 10].astype(np.int64), last, np.array([r[0] for r in rows], dtype=np.int64)
+    return data[:, :10], data[:, 10].astype(np.int64), last
+
+def running_scaler(served, stats):
+    """
+    Reconstruieste scalerul cu statisticile cumulate (n, medie, varianta) din starea salvata
+    La prima rulare statisticile sunt cele ale scalerului servit
+    """
+    sc = copy.deepcopy(served)
+    if stats:
+        sc.n_samples_seen_ = stats['n']
+        sc.mean_ = np.array(stats['mean']); sc.var_ = np.array(stats['var'])
+        sc.scale_ = np.sqrt(np.where(sc.var_ > 0, sc.var_, 1.0))
+    return sc
+
+def feature_drift(served, running):
+    """
+    Deplasarea maxima a mediilor cumulate fata de scalerul servit, in deviatii standard
+    """
+    return float(np.max(np.abs(running.mean_ - served.mean_) / served.scale_))
+
+def rescale_mlp(mlp, old, new):
+    """
+    Reexprima primul strat MLP pentru un scaler nou, fara a schimba iesirea retelei:
+    ((x - m_old) / s_old) W + b = ((x - m_new) / s_new) W' + b', W' = W * s_new / s_old, b' = b + ((m_new - m_old) / s_old) W
+    """
+    W, b = mlp.coefs_[0], mlp.intercepts_[0]
+    mlp.coefs_[0] = W * (new.scale_ / old.scale_)[:, None]
+    mlp.intercepts_[0] = b + ((new.mean_ - old.mean_) / old.scale_) @ W
+
+class Retrainer:
+    """
+    Actualizeaza incremental modelele fiecarui split cu predictiile confirmate aparute dupa watermark
+    - MLP: cateva epoci partial_fit doar pe randurile noi
+    - scaler: statistici cumulate incremental; devine scalerul servit la urmatoarea reantrenare SVM
+    - SVM: reantrenat complet doar peste pragul de randuri noi sau de deriva a datelor
+    Costul unei actualizari fara SVM este proportional cu numarul de randuri noi, nu cu tot setul
+    """
+    def __init__(self, handler, db, state_path=None):
+        self.handler = handler
+        self.db = db
+        self.state_path = state_path or retrain_config['state']
+
+    def run(self, progress=log.info):
+        """
+        Returneaza: rezumatul rularii (randuri noi, split-uri actualizate, reantrenari SVM)
+        """
+        start = time.perf_counter()
+        state = load_state(self.state_path)
+        sizes = list(self.handler.models_data)
+        # Fiecare split are watermark-ul lui, salvat imediat dupa save_split: daca un split esueaza,
+        # cele deja publicate nu primesc aceleasi randuri a doua oara la rularea urmatoare
+        marks = {size: state['splits'].get(str(size), {}).get('watermark', state['watermark']) for size in sizes}
+        X, y, last_id, ids = fetch_confirmed(self.db, min(marks.values(), default=state['watermark']), ids=True)
+        summary = {'rows': int(len(y)), 'watermark': last_id, 'splits': {}}
+        if len(y) == 0:
+            progress("Nu exista predictii confirmate noi de la ultima antrenare.")
+            return summary
+
+        valid, errors = validate_patient_batch(X)
+        if errors: progress(f"{len(errors)} randuri confirmate invalide au fost ignorate.")
+        X, y, ids = X[valid], y[valid], ids[valid]
+        summary['rows'] = int(len(y))
+        if len(y) == 0:
+            # Watermark-ul avanseaza oricum, altfel fiecare rulare viitoare s-ar opri pe aceleasi randuri invalide
+            progress("Nicio predictie confirmata noua nu este valida, modelele raman neschimbate.")
+            state['watermark'] = last_id
+            for size in sizes: state['splits'].setdefault(str(size), {'pending_rows': 0, 'scaler': None})['watermark'] = last_id
+            save_state(state, self.state_path)
+            return summary
+
+        for size in sizes:
+            new = ids > marks[size]
+            if new.any():
+                summary['splits'][size] = self.update_split(size, X[new], y[new], state, last_id, progress)
+            state['splits'].setdefault(str(size), {'pending_rows': 0, 'scaler': None})['watermark'] = last_id
+            save_state(state, self.state_path)
+
+        state['watermark'] = last_id
+        summary['seconds'] = time.perf_counter() - start
+        state['history'] = (state.get('history', []) + [{'time': time.strftime("%Y-%m-%d %H:%M:%S"),
+                            'rows': summary['rows'], 'watermark': last_id,
+                            'svm_refits': [s for s, r in summary['splits'].items() if r['svm_refit']]}])[-50:]
+        save_state(state, self.state_path)
+        self.handler.refresh_evaluation()
+        return summary
+
+    def update_split(self, size, X, y, state, last_id, progress):
+        models = self.handler.models_data[size]
+        # Se lucreaza pe copii: modelele servite raman neschimbate pana la inlocuirea atomica din save_split
+        served = models['SCALER']
+        mlp, svm = copy.deepcopy(models['MLP']), models['SVM']
+        split_state = state['splits'].setdefault(str(size), {'pending_rows': 0, 'scaler': None})
+
+        sc = running_scaler(served, split_state['scaler'])
+        if len(y): sc.partial_fit(X)
+        split_state['scaler'] = {'n': int(sc.n_samples_seen_), 'mean': sc.mean_.tolist(), 'var': sc.var_.tolist()}
+        split_state['pending_rows'] += int(len(y))
+        drift = feature_drift(served, sc)
+
+        pending = split_state['pending_rows']
+        refit = (pending >= retrain_config['svm_min_rows'] or
+                 pending >= retrain_config['svm_fraction'] * svm.shape_fit_[0] or
+                 drift > retrain_config['drift_threshold'])
+        if refit:
+            # Scalerul cumulat devine cel servit; MLP-ul este reexprimat exact pentru noua scalare
+            rescale_mlp(mlp, served, sc)
+            svm = self.refit_svm(size, sc, last_id)
+            split_state['pending_rows'] = 0
+            scaler = sc
+        else:
+            scaler = served
+
+        Xs = scaler.transform(X)
+        for _ in range(retrain_config['mlp_epochs']): mlp.partial_fit(Xs, y)
+        self.handler.save_split(size, {'SVM': svm, 'MLP': mlp, 'SCALER': scaler}, source='retrain',
+                                watermark=last_id, rows=int(len(y)), svm_refit=refit)
+        progress(f"Split {size}: {len(y)} randuri noi, deriva {drift:.3f}, "
+                 f"SVM {'reantrenat complet' if refit else f'neschimbat ({pending} randuri in asteptare)'}")
+        return {'drift': drift, 'svm_refit': refit, 'pending_rows': split_state['pending_rows']}
+
+    def refit_svm(self, size, scaler, last_id):
+        """
+        Reantrenare completa SVM: partea de antrenare a setului ILPD + toate predictiile confirmate pana la last_id
+        """
+        from sklearn.model_selection import train_test_split
+        df = load_dataset()
+        X0 = df.drop('Dataset', axis=1).to_numpy(dtype=np.float64); Y0 = df['Dataset'].to_numpy(dtype=np.int64)
+        X_tr, _, y_tr, _ = train_test_split(X0, Y0, test_size=size, random_state=ml_config['seed'], stratify=Y0)
+        X_db, y_db, _ = fetch_confirmed(self.db, 0, until_id=last_id)
+        valid, _ = validate_patient_batch(X_db)
+        X_all = np.vstack([X_tr, X_db[valid]]); y_all = np.concatenate([y_tr, y_db[valid]])
+        svm = build_model('SVM', ml_config['seed'])
+        svm.fit(scaler.transform(X_all), y_all)
+        return svm
+
+if __name__ == "__main__":
+    from database import open_database
+    from ml_logic import MLHandler
+
+    parser = argparse.ArgumentParser(description="Re-antrenare incrementala din predictiile confirmate")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[0.20, 0.30, 0.40, 0.50])
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s: %(message)s")
+    try:
+        handler = MLHandler(args.sizes)
+        if not handler.initialize_ml_logic(): sys.exit(1)
+        summary = Retrainer(handler, open_database()).run(progress=print)
+        print(f"Gata: {summary['rows']} randuri, watermark {summary['watermark']}")
+    except Exception as e:
+        print(f"Eroare: {e}")
+        sys.exit(1)
@@ -0,0 +1,225 @@
+##########################################################################
+#                                                                        #
+#  Copyright:   (c) 2026, Proiect MPS                                    #
+#  Autori:      Albu A. Sorin (R.Moldova) 1409A                          #
+#               Glavan P. Pavel (R.Moldova) 1409A                        #
+#               Duda I.I. Andrei-Ionuț 1409A                             #
+#               Jireadă C. Teodor 1409A                                  #
+#               Popovici I.L. Andrei 1409A                               #
+#               Noroc D. Sorin (R.Moldova) 1409A                         #
+#               Timofte C. Constantin 1409A                              #
+#               Matei I. Ion (R.Moldova) 1410B                           #
+#                                                                        #
+#  Descriere:   Sistem Expert pentru Predictia Bolilor Hepatice          #
+#               Utilizand algoritmii SVM si Multilayer Perceptron (MLP)  #
+#               Bazat pe setul de date ILPD (Indian Liver Patient)       #
+#                                                                        #
+#  Acest cod si informatiile sunt oferite "ca atare" fara nicio garantie #
+#  de orice fel, exprimata sau implicita. Acest proiect este realizat    #
+#  in scop didactic pentru disciplina Managementul Proiectelor Software. #
+#                                                                        #
+##########################################################################
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import logging
+import argparse
+import itertools
+from concurrent.futures import as_completed
+from lazy import lazy_import
+from dataset import load_dataset, dataset_hash
+from ml_logic import ml_config, build_model, process_pool
+
+np = lazy_import("numpy")
+
+log = logging.getLogger(__name__)
+
+search_config = {
+    # Fiecare proba terminata este adaugata aici; o cautare repetata sau intrerupta reia de unde a ramas
+    'results': os.environ.get("SEARCH_RESULTS", "models/search_results.jsonl"),
+    'folds': 5,
+    'seed': 42,
+    'workers': ml_config['workers']
+}
+
+# Spatiul de cautare (grila completa sau esantionat aleator)
+SEARCH_SPACE = {
+    'SVM': {'C': [0.1, 1.0, 10.0, 100.0], 'gamma': ['scale', 0.01, 0.1, 1.0]},
+    'MLP': {'hidden_layer_sizes': [[50, 25], [100], [64, 32], [32, 16]],
+            'alpha': [0.0001, 0.001, 0.01], 'max_iter': [500, 1000]}
+}
+
+def candidates(algo, mode='grid', n_iter=10, seed=None, space=None):
+    """
+    Genereaza combinatiile de hiperparametri: toate (grid) sau n_iter alese fara repetare (random)
+    """
+    grid = (space or SEARCH_SPACE)[algo]
+    names = sorted(grid)
+    combos = [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+    if mode == 'grid': return combos
+    if mode != 'random': raise ValueError(f"Mod de cautare necunoscut: {mode}")
+    rng = random.Random(search_config['seed'] if seed is None else seed)
+    return rng.sample(combos, min(n_iter, len(combos)))
+
+def trial_key(algo, size, params, folds, seed, data_sha):
+    """
+    Identificatorul unei probe: depinde de tot ce influenteaza scorul, deci doua probe cu aceeasi cheie sunt echivalente
+    """
+    payload = json.dumps({'algo': algo, 'size': size, 'params': params, 'folds': folds,
+                          'seed': seed, 'data': data_sha}, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:24]
+
+def fold_indices(Y, size, folds, seed):
+    """
+    Partea de antrenare a split-ului (aceeasi ca in fit_model) si indicii StratifiedKFold pe ea
+    Indicii sunt calculati o singura data per split si impartiti de toate probele
+    """
+    from sklearn.model_selection import train_test_split, StratifiedKFold
+    train_idx, _ = train_test_split(np.arange(len(Y)), test_size=size, random_state=seed, stratify=Y)
+    skf = StratifiedKFold(n_splits=folds, shuffle=True, random_state=seed)
+    return train_idx, [(tr, va) for tr, va in skf.split(train_idx, Y[train_idx])]
+
+def run_trial(X, Y, folds, algo, params, seed):
+    """
+    Evalueaza o combinatie prin validare incrucisata (rulata si in procesele worker)
+    Scalerul este reantrenat pe fiecare fold, ca validarea sa nu vada statisticile ei
+    Returneaza: dictionar cu scorurile medii si durata
+    """
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.metrics import accuracy_score, f1_score
+    start = time.perf_counter()
+    acc, f1 = [], []
+    for tr, va in folds:
+        sc = StandardScaler().fit(X[tr])
+        model = build_model(algo, seed, params)
+        # Probabilitatile nu influenteaza predict(), iar calibrarea Platt ar multiplica durata SVM
+        if algo == 'SVM': model.set_params(probability=False)
+        model.fit(sc.transform(X[tr]), Y[tr])
+        pred = model.predict(sc.transform(X[va]))
+        acc.append(accuracy_score(Y[va], pred)); f1.append(f1_score(Y[va], pred, zero_division=0))
+    return {'accuracy': float(np.mean(acc)), 'accuracy_std': float(np.std(acc)),
+            'f1': float(np.mean(f1)), 'seconds': time.perf_counter() - start}
+
+class ResultsStore:
+    """
+    Rezultatele probelor intr-un fisier JSONL (un rand per proba, adaugat imediat dupa terminare)
+    Un rand incomplet (proces oprit in timpul scrierii) este ignorat la citire
+    """
+    def __init__(self, path=None):
+        self.path = path or search_config['results']
+        self.results = {}
+        if os.path.exists(self.path):
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    try: row = json.loads(line)
+                    except ValueError: continue
+                    self.results[row['key']] = row
+
+    def __contains__(self, key): return key in self.results
+
+    def add(self, row):
+        folder = os.path.dirname(self.path)
+        if folder and not os.path.exists(folder): os.makedirs(folder)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(row, sort_keys=True) + "\n")
+            f.flush(); os.fsync(f.fileno())
+        self.results[row['key']] = row
+
+    def rows(self, keys=None):
+        return [self.results[k] for k in keys] if keys is not None else list(self.results.values())
+
+def run_search(df, sizes, algos=('SVM', 'MLP'), mode='grid', n_iter=10, store=None, workers=None,
+               folds=None, seed=None, data_sha=None, progress=log.info):
+    """
+    Ruleaza toate probele (algoritm x combinatie x split) care nu sunt deja in store, pe un pool de procese
+    Returneaza: randurile tuturor probelor cerute (inclusiv cele reluate din store)
+    """
+    store = store or ResultsStore()
+    folds = folds or search_config['folds']
+    seed = search_config['seed'] if seed is None else seed
+    workers = workers or search_config['workers']
+    data_sha = data_sha or dataset_hash()
+    X = df.drop('Dataset', axis=1).to_numpy(dtype=np.float64); Y = df['Dataset'].to_numpy(dtype=np.int64)
+
+    keys, pending = [], []
+    for size in sizes:
+        train_idx, size_folds = fold_indices(Y, size, folds, seed)
+        for algo in algos:
+            for params in candidates(algo, mode, n_iter, seed):
+                key = trial_key(algo, size, params, folds, seed, data_sha)
+                keys.append(key)
+                if key not in store:
+                    pending.append((key, {'algo': algo, 'size': size, 'params': params}, train_idx, size_folds))
+    progress(f"Probe: {len(keys)} in total, {len(keys) - len(pending)} reluate din {store.path}, {len(pending)} de rulat")
+
+    def record(meta, key, scores):
+        store.add(dict(meta, key=key, folds=folds, seed=seed, data=data_sha, **scores))
+        progress(f"[{len(store.results)}] {meta['algo']} split {meta['size']} {meta['params']}: "
+                 f"acuratete {scores['accuracy']:.4f} ({scores['seconds']:.1f} s)")
+
+    if workers > 1 and len(pending) > 1:
+        # Fiecare proces primeste doar randurile de antrenare ale split-ului si fold-urile relative la ele
+        with process_pool(workers) as pool:
+            jobs = {pool.submit(run_trial, X[idx], Y[idx], fl, meta['algo'], meta['params'], seed): (key, meta)
+                    for key, meta, idx, fl in pending}
+            for job in as_completed(jobs):
+                key, meta = jobs[job]
+                record(meta, key, job.result())
+    else:
+        for key, meta, idx, fl in pending:
+            record(meta, key, run_trial(X[idx], Y[idx], fl, meta['algo'], meta['params'], seed))
+    return store.rows(keys)
+
+def best_params(rows):
+    """
+    Alege per algoritm combinatia cu cea mai buna acuratete CV medie pe toate split-urile cautate
+    """
+    scores = {}
+    for r in rows:
+        entry = scores.setdefault((r['algo'], json.dumps(r['params'], sort_keys=True)), [])
+        entry.append(r['accuracy'])
+    best = {}
+    for (algo, params), acc in scores.items():
+        mean = float(np.mean(acc))
+        if algo not in best or mean > best[algo]['cv_accuracy']:
+            best[algo] = {'params': json.loads(params), 'cv_accuracy': mean, 'splits': len(acc)}
+    return best
+
+def export_best(rows, path=None):
+    """
+    Scrie configuratia castigatoare in fisierul citit de ml_logic.build_model (scriere atomica)
+    Modelele existente nu se schimba pana la urmatoarea antrenare (ex. stergerea artefactelor din models/)
+    """
+    path = path or ml_config['hyperparams']
+    best = best_params(rows)
+    folder = os.path.dirname(path)
+    if folder and not os.path.exists(folder): os.makedirs(folder)
+    tmp = path + ".tmp"
+    with open(tmp, 'w', encoding='utf-8') as f: json.dump(best, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+    return best
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cautare de hiperparametri SVM/MLP cu rezultate reluabile")
+    parser.add_argument("--mode", choices=["grid", "random"], default="grid")
+    parser.add_argument("--n-iter", type=int, default=10, help="combinatii per algoritm in modul random")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[0.20, 0.30, 0.40, 0.50])
+    parser.add_argument("--algos", nargs="+", choices=["SVM", "MLP"], default=["SVM", "MLP"])
+    parser.add_argument("--workers", type=int, default=search_config['workers'])
+    parser.add_argument("--folds", type=int, default=search_config['folds'])
+    parser.add_argument("--export", action="store_true", help="scrie configuratia castigatoare pentru MLHandler")
+    args = parser.parse_args()
+    try:
+        rows = run_search(load_dataset(), args.sizes, args.algos, args.mode, args.n_iter,
+                          workers=args.workers, folds=args.folds, progress=print)
+        for algo, best in sorted(best_params(rows).items()):
+            print(f"Cel mai bun {algo}: {best['params']} (acuratete CV medie {best['cv_accuracy']:.4f})")
+        if args.export:
+            export_best(rows)
+            print(f"Configuratie exportata in {ml_config['hyperparams']}")
+    except Exception as e:
+        print(f"Eroare: {e}")
+        sys.exit(1)
@@ -19,97 +19,130 @@
 #  in scop didactic pentru disciplina Managementul Proiectelor Software. #
 #                                                                        #
 ##########################################################################
+import sys
+import time
+import argparse
 import pandas as pd
-import mysql.connector
-import bcrypt
+from database import connect, storage_config
+from auth import hash_password
+from dataset import load_dataset, COLUMNS, LONG_NAMES
 
-def run_complete_seeder():
+seeder_config = {
+    # Numarul de pacienti inserati si confirmati intr-o singura tranzactie
+    'batch_size': 1000
+}
+
+INSERT_PATIENTS = """
+    INSERT IGNORE INTO PATIENTS (cnp_internal_id, full_name, gender, birth_date)
+    VALUES (%s, %s, %s, %s)
+"""
+
+INSERT_PREDICTIONS = """
+    INSERT INTO PREDICTIONS (
+        patient_id, user_id, prediction_result, confidence_score,
+        age, gender_val, total_bilirubin, direct_bilirubin,
+        alkaline_phosphotase, alamine_aminotransferase,
+        aspartate_aminotransferase, total_proteins,
+        albumin, albumin_and_globulin_ratio
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+def seed_users(cursor):
     """
-    Executa popularea initiala a bazei de date cu utilizatori
-      default si date istorice preluate din setul de date ILPD
+    Defineste utilizatorii impliciti medic sau admin,
+    genereaza hashuri securizate pentru parole folosind bcrypt (costul din auth_config) inainte de inserarea in baza de date
+    Returneaza: id-ul utilizatorului medic, folosit ca autor al predictiilor istorice
     """
-    url = "https://archive.ics.uci.edu/ml/machine-learning-databases/00225/Indian%20Liver%20Patient%20Dataset%20(ILPD).csv"
-    column_names = ['Age', 'Gender', 'Total_Bilirubin', 'Direct_Bilirubin',
-                    'Alkaline_Phosphotase', 'Alamine_Aminotransferase',
-                    'Aspartate_Aminotransferase', 'Total_Proteins',
-                    'Albumin', 'Albumin_and_Globulin_Ratio', 'Dataset']
+    utilizatori_raw = [
+        ('medic', 'medic', 'MEDIC'),
+        ('admin', 'admin', 'ADMIN')
+    ]
+    
+    utilizatori_pentru_db = []
+    for username, parola_clara, rol in utilizatori_raw:
+        utilizatori_pentru_db.append((username, hash_password(parola_clara), rol))
+
+    cursor.executemany("INSERT IGNORE INTO USERS (username, password_hash, role) VALUES (%s, %s, %s)", 
+                       utilizatori_pentru_db)
+    cursor.execute("SELECT id FROM USERS WHERE username = 'medic'")
+    return cursor.fetchone()[0]
 
+def seed_chunk(cursor, chunk, medic_id, prefix='UCI'):
     """
-    Descarca setul de date ILPD de la sursa externa si 
-    elimina intrarile incomplete pentru a asigura calitatea datelor importate
+    Insereaza un lot de pacienti si predictiile lor istorice cu un numar constant de interogari:
+    un INSERT multi-rand, un SELECT pentru toate id-urile, un SELECT pentru predictiile existente
+    si un INSERT multi-rand pentru predictiile lipsa
+    Returneaza: numarul de predictii noi inserate
     """
-    df = pd.read_csv(url, names=column_names, header=None)
-    df = df.dropna()
+    cnps = [f"{prefix}{int(index):010d}" for index in chunk.index]
+    genders = chunk['Gender'].to_numpy()
+    cursor.executemany(INSERT_PATIENTS, [
+        (cnp, f"Pacient_{prefix}_{int(index)}", 'Male' if g == 1 else 'Female', '1970-01-01')
+        for cnp, index, g in zip(cnps, chunk.index, genders)])
 
-    db_config = {
-        'host': '127.0.0.1',
-        'port': 3309,
-        'user': 'user',
-        'password': 'user',
-        'database': 'liver_disease'
-    }
+    placeholders = ", ".join(["%s"] * len(cnps))
+    cursor.execute(f"SELECT cnp_internal_id, id FROM PATIENTS WHERE cnp_internal_id IN ({placeholders})", cnps)
+    ids = dict(cursor.fetchall())
 
-    try:
-        conn = mysql.connector.connect(**db_config)
-        cursor = conn.cursor()
-
-        """
-        Defineste utilizatorii impliciti medic sau admin,
-        genereaza hashuri securizate pentru parole folosind bcrypt inainte de inserarea in baza de date
-        """
-        utilizatori_raw = [
-            ('medic', 'medic', 'MEDIC'),
-            ('admin', 'admin', 'ADMIN')
-        ]
-        
-        utilizatori_pentru_db = []
-        for username, parola_clara, rol in utilizatori_raw:
-            salt = bcrypt.gensalt()
-            hashed_parola = bcrypt.hashpw(parola_clara.encode('utf-8'), salt)
-            utilizatori_pentru_db.append((username, hashed_parola.decode('utf-8'), rol))
+    patient_ids = [ids[cnp] for cnp in cnps]
+    cursor.execute(f"SELECT patient_id FROM PREDICTIONS WHERE user_id = %s AND patient_id IN ({placeholders})",
+                   [medic_id] + patient_ids)
+    existing = {row[0] for row in cursor.fetchall()}
 
-        cursor.executemany("INSERT IGNORE INTO USERS (username, password_hash, role) VALUES (%s, %s, %s)", 
-                           utilizatori_pentru_db)
-        
-        """
-        Itereaza prin setul de date pentru a crea pacienti 
-        si asociaza datele medicale existente sub forma de predictii istorice validate de sistem
-        """
-        cursor.execute("SELECT id FROM USERS WHERE username = 'medic'")
-        medic_id = cursor.fetchone()[0]
+    rows = []
+    for pid, row in zip(patient_ids, chunk.itertuples(index=False)):
+        if pid in existing: continue
+        existing.add(pid)
+        rows.append((
+            pid, medic_id, int(row.Dataset), 1.0,
+            int(row.Age), int(row.Gender), float(row.Total_Bilirubin), float(row.Direct_Bilirubin),
+            int(row.Alkaline_Phosphotase), int(row.Alamine_Aminotransferase),
+            int(row.Aspartate_Aminotransferase), float(row.Total_Proteins),
+            float(row.Albumin), float(row.Albumin_and_Globulin_Ratio)
+        ))
+    if rows: cursor.executemany(INSERT_PREDICTIONS, rows)
+    return len(rows)
 
-        for index, row in df.iterrows():
-            cnp_fictiv = f"UCI{index:010d}"
-            
-            cursor.execute("""
-                INSERT IGNORE INTO PATIENTS (cnp_internal_id, full_name, gender, birth_date)
-                VALUES (%s, %s, %s, %s)
-            """, (cnp_fictiv, f"Pacient_UCI_{index}", row['Gender'], '1970-01-01'))
+def seed_frame(conn, df, batch_size=None, progress=print, prefix='UCI'):
+    """
+    Populeaza baza de date in tranzactii de cate batch_size pacienti, raportand progresul
+    df: setul codificat numeric, cu numele lungi ale coloanelor (LONG_NAMES)
+    prefix: prefixul CNP-ului fictiv, pentru ca exporturile diferite sa nu se suprapuna
+    Returneaza: numarul total de predictii inserate
+    """
+    batch_size = batch_size or seeder_config['batch_size']
+    cursor = conn.cursor()
+    medic_id = seed_users(cursor)
+    conn.commit()
 
-            cursor.execute("SELECT id FROM PATIENTS WHERE cnp_internal_id = %s", (cnp_fictiv,))
-            patient_id = cursor.fetchone()[0]
+    start, inserted = time.perf_counter(), 0
+    for offset in range(0, len(df), batch_size):
+        inserted += seed_chunk(cursor, df.iloc[offset:offset + batch_size], medic_id, prefix)
+        conn.commit()
+        done = min(offset + batch_size, len(df))
+        elapsed = time.perf_counter() - start
+        progress(f"{done}/{len(df)} pacienti procesati ({done / elapsed if elapsed else 0:.0f} randuri/s)")
+    cursor.close()
+    return inserted
 
-            cursor.execute("SELECT id FROM PREDICTIONS WHERE patient_id = %s AND user_id = %s", (patient_id, medic_id))
-            if cursor.fetchone() is None:
-                gender_val = 1 if row['Gender'] == 'Male' else 0
-                cursor.execute("""
-                    INSERT INTO PREDICTIONS (
-                        patient_id, user_id, prediction_result, confidence_score,
-                        age, gender_val, total_bilirubin, direct_bilirubin,
-                        alkaline_phosphotase, alamine_aminotransferase,
-                        aspartate_aminotransferase, total_proteins,
-                        albumin, albumin_and_globulin_ratio
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
-                    patient_id, medic_id, int(row['Dataset']), 1.0,
-                    int(row['Age']), gender_val, row['Total_Bilirubin'], row['Direct_Bilirubin'],
-                    int(row['Alkaline_Phosphotase']), int(row['Alamine_Aminotransferase']),
-                    int(row['Aspartate_Aminotransferase']), row['Total_Proteins'],
-                    row['Albumin'], row['Albumin_and_Globulin_Ratio']
-                ))
+def run_complete_seeder(csv_path=None, batch_size=None, prefix='UCI', backend=None):
+    """
+    Executa popularea initiala a bazei de date cu utilizatori
+      default si date istorice preluate din setul de date ILPD
+    csv_path: optional, un export (ex. sintetic) cu header-ul din dataset.COLUMNS, deja codificat
+    backend: 'mariadb' sau 'sqlite' (implicit storage_config)
+    """
+    """
+    Preia setul de date ILPD din cache-ul local (descarcat o singura data),
+    deja curatat de intrarile incomplete si codificat numeric
+    """
+    df = pd.read_csv(csv_path, usecols=COLUMNS) if csv_path else load_dataset()
+    df = df.rename(columns=LONG_NAMES)
 
-        conn.commit()
-        print("Seeding finalizat cu succes. Parolele au fost hash-uite cu bcrypt.")
+    try:
+        conn = connect(backend)
+        inserted = seed_frame(conn, df, batch_size, prefix=prefix)
+        print(f"Seeding finalizat cu succes ({inserted} predictii noi). Parolele au fost hash-uite cu bcrypt.")
 
     except Exception as e:
         print(f"Eroare: {e}")
@@ -118,8 +151,13 @@ def run_complete_seeder():
         Inchide conexiunea la baza de date si elibereaza resursele utilizate
         """
         if 'conn' in locals() and conn.is_connected():
-            cursor.close()
             conn.close()
 
 if __name__ == "__main__":
-    run_complete_seeder()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Populeaza baza de date cu setul ILPD")
+    parser.add_argument("--csv", help="export CSV (coloanele din dataset.COLUMNS) in locul setului ILPD")
+    parser.add_argument("--batch-size", type=int, default=seeder_config['batch_size'])
+    parser.add_argument("--prefix", default="UCI", help="prefixul CNP-urilor fictive (max. 10 caractere)")
+    parser.add_argument("--backend", choices=["mariadb", "sqlite"], default=storage_config['backend'])
+    args = parser.parse_args(sys.argv[1:])
+    run_complete_seeder(args.csv, args.batch_size, args.prefix, args.backend)
@@ -0,0 +1,292 @@
+##########################################################################
+#                                                                        #
+#  Copyright:   (c) 2026, Proiect MPS                                    #
+#  Autori:      Albu A. Sorin (R.Moldova) 1409A                          #
+#               Glavan P. Pavel (R.Moldova) 1409A                        #
+#               Duda I.I. Andrei-Ionuț 1409A                             #
+#               Jireadă C. Teodor 1409A                                  #
+#               Popovici I.L. Andrei 1409A                               #
+#               Noroc D. Sorin (R.Moldova) 1409A                         #
+#               Timofte C. Constantin 1409A                              #
+#               Matei I. Ion (R.Moldova) 1410B                           #
+#                                                                        #
+#  Descriere:   Sistem Expert pentru Predictia Bolilor Hepatice          #
+#               Utilizand algoritmii SVM si Multilayer Perceptron (MLP)  #
+#               Bazat pe setul de date ILPD (Indian Liver Patient)       #
+#                                                                        #
+#  Acest cod si informatiile sunt oferite "ca atare" fara nicio garantie #
+#  de orice fel, exprimata sau implicita. Acest proiect este realizat    #
+#  in scop didactic pentru disciplina Managementul Proiectelor Software. #
+#                                                                        #
+##########################################################################
+import os
+import json
+import time
+import queue
+import logging
+import argparse
+import threading
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import numpy as np
+from utils import validate_patient_batch
+from auth import AuthError
+
+log = logging.getLogger(__name__)
+
+service_config = {
+    'host': '127.0.0.1',
+    'port': 8765,
+    # Fereastra (ms) in care cererile individuale concurente sunt grupate intr-un singur lot
+    'window_ms': 5,
+    'max_batch': 64,
+    # Timpul maxim (s) cat o cerere asteapta rezultatul lotului; peste el raspunsul este 503
+    'timeout_s': float(os.environ.get("ILPD_SERVICE_TIMEOUT_S", "10")),
+    # Predictiile si metricile cer antetul "Authorization: Bearer <token>" obtinut de la /login;
+    # ILPD_SERVICE_AUTH=0 (sau --no-auth) il dezactiveaza, de ex. pentru masuratori locale fara baza de date
+    'require_auth': os.environ.get("ILPD_SERVICE_AUTH", "1") == "1"
+}
+
+class ServiceUnavailable(Exception):
+    """
+    Lotul de predictie nu a raspuns la timp (firul de grupare blocat sau oprit)
+    """
+
+class LatencyStats:
+    """
+    Pastreaza ultimele latente masurate pe fiecare endpoint si calculeaza p50/p99
+    """
+    def __init__(self, keep=10000):
+        self._samples = {}
+        self._keep = keep
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        with self._lock:
+            self._samples.setdefault(name, deque(maxlen=self._keep)).append(seconds)
+
+    def summary(self):
+        with self._lock:
+            return {name: {'count': len(s),
+                           'p50_ms': float(np.percentile(s, 50)) * 1000,
+                           'p99_ms': float(np.percentile(s, 99)) * 1000}
+                    for name, s in self._samples.items() if s}
+
+class MicroBatcher:
+    """
+    Coalizeaza cererile de predictie pentru un singur pacient in loturi mici
+    Un fir dedicat asteapta cel mult window_ms dupa prima cerere sau pana la max_batch cereri
+    """
+    def __init__(self, predict_fn, window_ms=None, max_batch=None):
+        self.predict_fn = predict_fn
+        self.window = (service_config['window_ms'] if window_ms is None else window_ms) / 1000.0
+        self.max_batch = max_batch or service_config['max_batch']
+        self.batch_sizes = deque(maxlen=10000)
+        self._sizes_lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, row, split, algo):
+        """
+        Adauga un rand in coada si returneaza un Future cu (eticheta, probabilitate)
+        """
+        fut = Future()
+        self._queue.put((row, split, algo, fut))
+        return fut
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def sizes(self):
+        """
+        Copie a dimensiunilor ultimelor loturi (deque-ul este modificat de firul de grupare)
+        """
+        with self._sizes_lock: return list(self.batch_sizes)
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None: return
+            batch = [first]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0: break
+                try: item = self._queue.get(timeout=remaining)
+                except queue.Empty: break
+                if item is None:
+                    self._queue.put(None)
+                    break
+                batch.append(item)
+            self._dispatch(batch)
+
+    def _dispatch(self, batch):
+        """
+        Grupeaza lotul pe (split, algoritm) si ruleaza o singura predictie per grup
+        """
+        groups = {}
+        for row, split, algo, fut in batch: groups.setdefault((split, algo), []).append((row, fut))
+        for (split, algo), items in groups.items():
+            with self._sizes_lock: self.batch_sizes.append(len(items))
+            try:
+                labels, probs = self.predict_fn(np.array([row for row, _ in items], dtype=np.float64), split, algo)
+                for (_, fut), label, prob in zip(items, labels, probs):
+                    fut.set_result((int(label), float(prob)))
+            except Exception as e:
+                for _, fut in items: fut.set_exception(e)
+
+class PredictionService:
+    """
+    Logica serviciului independenta de HTTP: valideaza cererile si le directioneaza catre MLHandler
+    """
+    def __init__(self, ml_handler, window_ms=None, max_batch=None, auth=None):
+        self.ml_handler = ml_handler
+        # AuthService; None inseamna serviciu deschis (doar pe 127.0.0.1)
+        self.auth = auth
+        self.stats = LatencyStats()
+        self.batcher = MicroBatcher(ml_handler.predict_batch, window_ms, max_batch)
+
+    def _check_model(self, payload):
+        split, algo = payload.get('split', 0.20), payload.get('algo', 'SVM')
+        if split not in self.ml_handler.models_data: raise ValueError(f"Split necunoscut: {split}")
+        if algo not in ('SVM', 'MLP'): raise ValueError(f"Algoritm necunoscut: {algo}")
+        return split, algo
+
+    def predict(self, payload):
+        """
+        Cerere pentru un singur pacient: {"features": [10 valori], "split": 0.2, "algo": "SVM"}
+        """
+        split, algo = self._check_model(payload)
+        row = np.asarray(payload['features'], dtype=np.float64).reshape(1, -1)
+        valid, errors = validate_patient_batch(row)
+        if errors: raise ValueError(errors[0][1])
+        try: label, prob = self.batcher.submit(row[0], split, algo).result(timeout=service_config['timeout_s'])
+        except FutureTimeout: raise ServiceUnavailable("Predictia nu a raspuns la timp, incercati din nou.")
+        return {'label': label, 'probability': prob, 'split': split, 'algo': algo}
+
+    def predict_batch(self, payload):
+        """
+        Cerere pentru mai multi pacienti: {"rows": [[10 valori], ...], "split": 0.2, "algo": "MLP"}
+        """
+        split, algo = self._check_model(payload)
+        # Versiunea este citita odata cu modelele folosite, deci o inlocuire concurenta nu poate amesteca etichetele
+        labels, probs, version = self.ml_handler.predict_versioned(np.asarray(payload['rows'], dtype=np.float64), split, algo)
+        return {'labels': labels.tolist(), 'probabilities': probs.tolist(), 'split': split, 'algo': algo,
+                'model_version': version}
+
+    def login(self, payload):
+        """
+        {"username": ..., "password": ...} -> token de sesiune; bcrypt ruleaza o singura data, aici
+        """
+        if self.auth is None: raise ValueError("Autentificarea nu este activa pe acest serviciu.")
+        session = self.auth.login(str(payload['username']), str(payload['password']))
+        return {'token': session.token, 'expires': session.expires, 'role': session.role}
+
+    def authorize(self, header):
+        """
+        Verifica token-ul din antetul Authorization (doar HMAC, fara baza de date sau bcrypt)
+        """
+        if self.auth is None: return None
+        scheme, _, token = (header or "").partition(" ")
+        if scheme != "Bearer": raise AuthError("Lipseste antetul Authorization: Bearer <token>.")
+        return self.auth.verify_token(token)
+
+    def health(self):
+        return {'status': 'ok', 'splits': sorted(self.ml_handler.models_data)}
+
+    def metrics(self):
+        sizes = self.batcher.sizes()
+        return {'latency': self.stats.summary(),
+                'batches': len(sizes), 'mean_batch_size': float(np.mean(sizes)) if sizes else 0.0,
+                'prediction_cache': self.ml_handler.predictions.stats()}
+
+def make_handler(service):
+    """
+    Construieste clasa de request handler legata de instanta serviciului
+    """
+    routes = {('GET', '/health'): service.health, ('GET', '/metrics'): service.metrics,
+              ('POST', '/predict'): service.predict, ('POST', '/predict_batch'): service.predict_batch,
+              ('POST', '/login'): service.login}
+    protected = {'/predict', '/predict_batch', '/metrics'}
+
+    class Handler(BaseHTTPRequestHandler):
+        def _handle(self, method):
+            start = time.perf_counter()
+            route = routes.get((method, self.path))
+            if route is None: return self._reply(404, {'error': f"Ruta inexistenta: {self.path}"})
+            try:
+                if self.path in protected: service.authorize(self.headers.get('Authorization'))
+                if method == 'POST':
+                    length = int(self.headers.get('Content-Length', 0))
+                    result = route(json.loads(self.rfile.read(length) or b"{}"))
+                else:
+                    result = route()
+                self._reply(200, result)
+            except AuthError as e:
+                self._reply(401, {'error': str(e)})
+            except ServiceUnavailable as e:
+                self._reply(503, {'error': str(e)})
+            except (ValueError, KeyError, TypeError) as e:
+                self._reply(400, {'error': str(e)})
+            except Exception as e:
+                log.exception("Eroare la %s", self.path)
+                self._reply(500, {'error': str(e)})
+            finally:
+                service.stats.record(self.path, time.perf_counter() - start)
+
+        def _reply(self, code, body):
+            data = json.dumps(body).encode('utf-8')
+            self.send_response(code)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self): self._handle('GET')
+
+        def do_POST(self): self._handle('POST')
+
+        def log_message(self, fmt, *args): log.debug(fmt, *args)
+
+    return Handler
+
+def create_server(service, host=None, port=None):
+    """
+    Creeaza serverul HTTP (fiecare conexiune pe un fir propriu); port=0 alege un port liber
+    """
+    host = host or service_config['host']
+    port = service_config['port'] if port is None else port
+    return ThreadingHTTPServer((host, port), make_handler(service))
+
+if __name__ == "__main__":
+    from ml_logic import MLHandler
+
+    parser = argparse.ArgumentParser(description="Serviciu local de predictie ILPD (HTTP/JSON)")
+    parser.add_argument("--host", default=service_config['host'])
+    parser.add_argument("--port", type=int, default=service_config['port'])
+    parser.add_argument("--window-ms", type=float, default=service_config['window_ms'])
+    parser.add_argument("--max-batch", type=int, default=service_config['max_batch'])
+    parser.add_argument("--no-auth", dest="auth", action="store_false", default=service_config['require_auth'],
+                        help="serviciu deschis, fara token de sesiune (implicit se cere POST /login)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s: %(message)s")
+
+    # Modelele sunt incarcate o singura data si raman calde pe toata durata procesului
+    handler = MLHandler([0.20, 0.30, 0.40, 0.50])
+    models = handler.initialize_ml_logic()
+    for size in models:
+        for name in ('SCALER', 'SVM', 'MLP'): models[size][name]
+
+    auth = None
+    if args.auth:
+        from auth import AuthService
+        from database import open_database
+        auth = AuthService(open_database())
+    server = create_server(PredictionService(handler, args.window_ms, args.max_batch, auth), args.host, args.port)
+    log.info("Serviciu pornit pe http://%s:%d", args.host, server.server_address[1])
+    try: server.serve_forever()
+    except KeyboardInterrupt: pass
+    finally: server.server_close()
@@ -0,0 +1,152 @@
+##########################################################################
+#                                                                        #
+#  Copyright:   (c) 2026, Proiect MPS                                    #
+#  Autori:      Albu A. Sorin (R.Moldova) 1409A                          #
+#               Glavan P. Pavel (R.Moldova) 1409A                        #
+#               Duda I.I. Andrei-Ionuț 1409A                             #
+#               Jireadă C. Teodor 1409A                                  #
+#               Popovici I.L. Andrei 1409A                               #
+#               Noroc D. Sorin (R.Moldova) 1409A                         #
+#               Timofte C. Constantin 1409A                              #
+#               Matei I. Ion (R.Moldova) 1410B                           #
+#                                                                        #
+#  Descriere:   Sistem Expert pentru Predictia Bolilor Hepatice          #
+#               Utilizand algoritmii SVM si Multilayer Perceptron (MLP)  #
+#               Bazat pe setul de date ILPD (Indian Liver Patient)       #
+#                                                                        #
+#  Acest cod si informatiile sunt oferite "ca atare" fara nicio garantie #
+#  de orice fel, exprimata sau implicita. Acest proiect este realizat    #
+#  in scop didactic pentru disciplina Managementul Proiectelor Software. #
+#                                                                        #
+##########################################################################
+import sqlite3
+from functools import lru_cache
+from database import Database, QUERIES, pool_config
+
+# Schema MariaDB (db_init/migrations V001-V005) tradusa pentru SQLite, cu aceiasi indecsi
+# Orice migrare noua pentru MariaDB trebuie reflectata si aici
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS USERS (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT NOT NULL UNIQUE,
+    password_hash TEXT NOT NULL,
+    role TEXT NOT NULL CHECK (role IN ('MEDIC', 'ADMIN')));
+CREATE TABLE IF NOT EXISTS PATIENTS (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    cnp_internal_id TEXT NOT NULL UNIQUE,
+    full_name TEXT NOT NULL,
+    gender TEXT NOT NULL,
+    birth_date TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS PREDICTIONS (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    patient_id INTEGER NOT NULL REFERENCES PATIENTS(id),
+    user_id INTEGER NOT NULL REFERENCES USERS(id),
+    prediction_result INTEGER,
+    confidence_score REAL,
+    age INTEGER,
+    gender_val INTEGER,
+    total_bilirubin REAL,
+    direct_bilirubin REAL,
+    alkaline_phosphotase INTEGER,
+    alamine_aminotransferase INTEGER,
+    aspartate_aminotransferase INTEGER,
+    total_proteins REAL,
+    albumin REAL,
+    albumin_and_globulin_ratio REAL,
+    date_created TEXT DEFAULT CURRENT_TIMESTAMP,
+    confirmed_result INTEGER,
+    model_version TEXT,
+    journal_id TEXT);
+CREATE INDEX IF NOT EXISTS idx_predictions_patient_user ON PREDICTIONS (patient_id, user_id);
+CREATE INDEX IF NOT EXISTS idx_predictions_date ON PREDICTIONS (date_created);
+CREATE INDEX IF NOT EXISTS idx_predictions_user_date ON PREDICTIONS (user_id, date_created);
+CREATE INDEX IF NOT EXISTS idx_predictions_confirmed ON PREDICTIONS (confirmed_result, id);
+"""
+
+# Coloanele adaugate dupa prima versiune a schemei SQLite; fisierele mai vechi le primesc la deschidere
+SQLITE_COLUMNS = [('PREDICTIONS', 'journal_id', 'TEXT')]
+
+SQLITE_INDEXES = """
+CREATE UNIQUE INDEX IF NOT EXISTS uq_predictions_journal ON PREDICTIONS (journal_id);
+"""
+
+# Interogarile care nu au echivalent direct in SQLite
+SQLITE_QUERIES = dict(QUERIES, **{
+    # Fara statistici InnoDB: cel mai mare id este la fel de ieftin (cautare in cheia primara)
+    'history_estimate': "SELECT MAX(id) FROM PREDICTIONS",
+    # LAST_INSERT_ID(expr) nu exista; RETURNING intoarce id-ul si cand randul exista deja
+    'upsert_patient': "INSERT INTO PATIENTS (cnp_internal_id, full_name, gender, birth_date) VALUES (%s,%s,%s,%s) "
+                      "ON CONFLICT (cnp_internal_id) DO UPDATE SET cnp_internal_id=excluded.cnp_internal_id RETURNING id",
+    'journal_prediction': QUERIES['journal_prediction'].split(" ON DUPLICATE KEY")[0] + " ON CONFLICT (journal_id) DO NOTHING",
+})
+
+@lru_cache(maxsize=256)
+def translate(sql):
+    """
+    Dialectul MariaDB al aplicatiei -> SQLite: parametrii %s devin ? si INSERT IGNORE devine INSERT OR IGNORE
+    """
+    return sql.replace("%s", "?").replace("INSERT IGNORE", "INSERT OR IGNORE")
+
+class _Cursor:
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def execute(self, sql, params=()): self.cursor.execute(translate(sql), tuple(params))
+
+    def executemany(self, sql, rows): self.cursor.executemany(translate(sql), list(rows))
+
+    def fetchall(self): return self.cursor.fetchall()
+
+    def fetchone(self): return self.cursor.fetchone()
+
+    @property
+    def lastrowid(self): return self.cursor.lastrowid
+
+    @property
+    def rowcount(self): return self.cursor.rowcount
+
+    def close(self): self.cursor.close()
+
+class SqliteConnection:
+    """
+    Conexiune la fisierul SQLite cu interfata conexiunii mysql folosita de Database, seeder si generatorul sintetic
+    La deschidere activeaza WAL (cititorii nu blocheaza scriitorul) si cheile straine, apoi creeaza schema
+    """
+    def __init__(self, path):
+        self.raw = sqlite3.connect(path, timeout=pool_config['timeout'], check_same_thread=False)
+        self.raw.execute("PRAGMA journal_mode=WAL")
+        # In modul WAL, NORMAL sincronizeaza doar la checkpoint: o tranzactie confirmata ramane consistenta
+        self.raw.execute("PRAGMA synchronous=NORMAL")
+        self.raw.execute("PRAGMA foreign_keys=ON")
+        self.raw.executescript(SQLITE_SCHEMA)
+        for table, column, kind in SQLITE_COLUMNS:
+            if column not in {row[1] for row in self.raw.execute(f"PRAGMA table_info({table})")}:
+                self.raw.execute(f"ALTER TABLE {table} ADD COLUMN {column} {kind}")
+        self.raw.executescript(SQLITE_INDEXES)
+
+    def cursor(self, prepared=False):
+        # SQLite pastreaza singur instructiunile pregatite in cache-ul conexiunii
+        return _Cursor(self.raw.cursor())
+
+    def is_connected(self): return True
+
+    def commit(self): self.raw.commit()
+
+    def rollback(self): self.raw.rollback()
+
+    def close(self): self.raw.close()
+
+class SqliteDatabase(Database):
+    """
+    Aceleasi operatii ca Database (MariaDB), peste un fisier SQLite local, fara server de baze de date
+    """
+    queries = SQLITE_QUERIES
+
+    def __init__(self, path, pool_size=None):
+        super().__init__({'path': path}, pool_size)
+
+    def _connect(self):
+        return SqliteConnection(self.config['path'])
+
+    def upsert_patient(self, conn, patient):
+        return self.execute(conn, 'upsert_patient', tuple(patient), fetch='one')[0]
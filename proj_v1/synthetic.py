@@ -0,0 +1,199 @@
+##########################################################################
+#                                                                        #
+#  Copyright:   (c) 2026, Proiect MPS                                    #
+#  Autori:      Albu A. Sorin (R.Moldova) 1409A                          #
+#               Glavan P. Pavel (R.Moldova) 1409A                        #
+#               Duda I.I. Andrei-Ionuț 1409A                             #
+#               Jireadă C. Teodor 1409A                                  #
+#               Popovici I.L. Andrei 1409A                               #
+#               Noroc D. Sorin (R.Moldova) 1409A                         #
+#               Timofte C. Constantin 1409A                              #
+#               Matei I. Ion (R.Moldova) 1410B                           #
+#                                                                        #
+#  Descriere:   Sistem Expert pentru Predictia Bolilor Hepatice          #
+#               Utilizand algoritmii SVM si Multilayer Perceptron (MLP)  #
+#               Bazat pe setul de date ILPD (Indian Liver Patient)       #
+#                                                                        #
+#  Acest cod si informatiile sunt oferite "ca atare" fara nicio garantie #
+#  de orice fel, exprimata sau implicita. Acest proiect este realizat    #
+#  in scop didactic pentru disciplina Managementul Proiectelor Software. #
+#                                                                        #
+##########################################################################
+import os
+import sys
+import argparse
+from lazy import lazy_import
+from dataset import load_dataset, COLUMNS, FEATURES, LONG_NAMES
+from utils import validate_patient_batch
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+synthetic_config = {
+    'seed': 42,
+    # Randuri generate si scrise deodata; memoria folosita nu depinde de numarul total de randuri
+    'chunk_rows': 100000,
+    # Prefixul CNP-urilor fictive la scrierea in baza de date (vezi seeder.seed_chunk)
+    'prefix': 'SYN'
+}
+
+# Coloanele intregi in ILPD si numarul de zecimale pastrate pentru celelalte
+ROUNDING = {'Age': 0, 'Gender': 0, 'TB': 1, 'DB': 1, 'Alk': 0, 'Sgpt': 0, 'Sgot': 0, 'TP': 1, 'ALB': 1, 'AG': 2}
+
+# DB este modelata prin raportul DB/TB din [0, 1], astfel incat DB <= TB rezulta din constructie
+MODEL_COLUMNS = [c if c != 'DB' else 'DB_ratio' for c in FEATURES]
+
+def _normal_scores(values):
+    """
+    Transforma fiecare coloana in scoruri normale prin ranguri (egalitatile primesc rangul mediu)
+    """
+    from scipy.special import ndtri
+    ranks = pd.DataFrame(values).rank(method='average').to_numpy()
+    return ndtri(ranks / (values.shape[0] + 1))
+
+class CopulaModel:
+    """
+    Copula gaussiana ajustata separat pe fiecare clasa (Dataset 1 = boala, 0 = sanatos):
+    distributiile marginale sunt cuantilele empirice ale fiecarei coloane, iar dependentele
+    sunt date de matricea de corelatie a scorurilor normale
+    """
+    def __init__(self, classes):
+        # {eticheta: {'prior': p, 'sorted': matrice n x k cu fiecare coloana sortata, 'chol': factor Cholesky}}
+        self.classes = classes
+
+    @classmethod
+    def fit(cls, df):
+        """
+        df: setul codificat numeric cu coloanele dataset.COLUMNS (ex. load_dataset())
+        """
+        df = df[COLUMNS].dropna()
+        data = df[FEATURES].to_numpy(dtype=np.float64, copy=True)
+        tb, db = data[:, FEATURES.index('TB')], data[:, FEATURES.index('DB')]
+        data[:, FEATURES.index('DB')] = np.clip(np.divide(db, tb, out=np.zeros_like(db), where=tb > 0), 0, 1)
+
+        classes = {}
+        for label in sorted(df['Dataset'].unique()):
+            rows = data[(df['Dataset'] == label).to_numpy()]
+            if rows.shape[0] < 2: raise ValueError(f"Clasa {label} are prea putine randuri pentru ajustare.")
+            corr = np.nan_to_num(np.corrcoef(_normal_scores(rows), rowvar=False))
+            np.fill_diagonal(corr, 1.0)
+            # Valorile proprii negative (din rotunjiri sau coloane constante) sunt taiate, ca Cholesky sa existe
+            w, v = np.linalg.eigh(corr)
+            corr = (v * np.maximum(w, 1e-9)) @ v.T
+            d = np.sqrt(np.diag(corr))
+            classes[int(label)] = {'prior': rows.shape[0] / data.shape[0], 'sorted': np.sort(rows, axis=0),
+                                   'chol': np.linalg.cholesky(corr / np.outer(d, d))}
+        return cls(classes)
+
+    def _sample_class(self, params, n, rng):
+        from scipy.special import ndtr
+        u = ndtr(rng.standard_normal((n, params['chol'].shape[0])) @ params['chol'].T)
+        ranks = params['sorted']
+        grid = (np.arange(ranks.shape[0]) + 0.5) / ranks.shape[0]
+        # Inversa cuantilelor empirice (interpolata), deci valorile raman in intervalul observat
+        return np.column_stack([np.interp(u[:, j], grid, ranks[:, j]) for j in range(ranks.shape[1])])
+
+    def sample(self, n, rng):
+        """
+        Returneaza: DataFrame cu n randuri noi in formatul dataset.COLUMNS, valide pentru validate_patient_batch
+        """
+        labels = sorted(self.classes)
+        counts = rng.multinomial(n, [self.classes[l]['prior'] for l in labels])
+        X = np.vstack([self._sample_class(self.classes[l], c, rng) for l, c in zip(labels, counts)])
+        y = np.repeat(labels, counts)
+
+        i_tb, i_db = FEATURES.index('TB'), FEATURES.index('DB')
+        X[:, i_db] *= X[:, i_tb]
+        for j, name in enumerate(FEATURES): X[:, j] = np.round(X[:, j], ROUNDING[name])
+        # Rotunjirea poate urca DB cu o zecimala peste TB
+        X[:, i_db] = np.minimum(X[:, i_db], X[:, i_tb])
+
+        order = rng.permutation(n)
+        df = pd.DataFrame(X[order], columns=FEATURES)
+        df['Dataset'] = y[order]
+        return df
+
+def generate(model, rows, seed=None, chunk_rows=None):
+    """
+    Genereaza `rows` randuri in bucati de chunk_rows (aceeasi samanta si marime de bucata => aceleasi randuri)
+    Fiecare bucata are indexul global al randurilor, folosit de seeder pentru CNP-urile fictive
+    """
+    chunk_rows = chunk_rows or synthetic_config['chunk_rows']
+    rng = np.random.default_rng(synthetic_config['seed'] if seed is None else seed)
+    for offset in range(0, rows, chunk_rows):
+        chunk = model.sample(min(chunk_rows, rows - offset), rng)
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        valid, errors = validate_patient_batch(chunk[FEATURES].to_numpy())
+        if errors: raise ValueError(f"Rand generat invalid ({errors[0][0] + offset}): {errors[0][1]}")
+        yield chunk
+
+def write_csv(chunks, path):
+    """
+    Scrie bucatile intr-un CSV cu header-ul dataset.COLUMNS (formatul acceptat de seeder.py --csv)
+    """
+    tmp, total = path + ".tmp", 0
+    with open(tmp, 'w', encoding='utf-8', newline='') as f:
+        for chunk in chunks:
+            chunk.to_csv(f, index=False, header=total == 0)
+            total += len(chunk)
+    os.replace(tmp, path)
+    return total
+
+def write_npy(chunks, path, rows):
+    """
+    Scrie matricea rows x 11 (coloanele dataset.COLUMNS) direct pe disc, fara a o tine in memorie
+    """
+    tmp = path + ".tmp"
+    out = np.lib.format.open_memmap(tmp, mode='w+', dtype=np.float64, shape=(rows, len(COLUMNS)))
+    for chunk in chunks: out[chunk.index[0]:chunk.index[-1] + 1] = chunk[COLUMNS].to_numpy()
+    out.flush(); del out
+    os.replace(tmp, path)
+    return rows
+
+def write_db(chunks, conn, prefix=None, progress=print):
+    """
+    Insereaza pacientii si predictiile in PATIENTS/PREDICTIONS cu loturile seeder-ului
+    Returneaza: numarul de predictii noi
+    """
+    from seeder import seed_users, seed_chunk, seeder_config
+    prefix = prefix or synthetic_config['prefix']
+    cursor = conn.cursor()
+    medic_id = seed_users(cursor)
+    conn.commit()
+    inserted, batch = 0, seeder_config['batch_size']
+    for chunk in chunks:
+        frame = chunk.rename(columns=LONG_NAMES)
+        for start in range(0, len(frame), batch):
+            inserted += seed_chunk(cursor, frame.iloc[start:start + batch], medic_id, prefix)
+            conn.commit()
+        progress(f"{chunk.index[-1] + 1} randuri generate, {inserted} predictii inserate")
+    cursor.close()
+    return inserted
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generator de date sintetice ILPD (copula gaussiana)")
+    parser.add_argument("--rows", type=int, required=True)
+    parser.add_argument("--out", help="fisier .csv sau .npy")
+    parser.add_argument("--db", action="store_true", help="scrie direct in PATIENTS/PREDICTIONS")
+    parser.add_argument("--backend", choices=["mariadb", "sqlite"], help="baza de date pentru --db (implicit storage_config)")
+    parser.add_argument("--source", help="CSV sursa (coloanele dataset.COLUMNS) in locul setului ILPD")
+    parser.add_argument("--seed", type=int, default=synthetic_config['seed'])
+    parser.add_argument("--chunk-rows", type=int, default=synthetic_config['chunk_rows'])
+    parser.add_argument("--prefix", default=synthetic_config['prefix'], help="prefixul CNP-urilor fictive (max. 10 caractere)")
+    args = parser.parse_args()
+    if bool(args.out) == args.db: parser.error("Alegeti exact o destinatie: --out sau --db")
+    try:
+        source = pd.read_csv(args.source, usecols=COLUMNS) if args.source else load_dataset()
+        chunks = generate(CopulaModel.fit(source), args.rows, args.seed, args.chunk_rows)
+        if args.db:
+            from database import connect
+            conn = connect(args.backend)
+            try: print(f"{write_db(chunks, conn, args.prefix)} predictii sintetice inserate.")
+            finally: conn.close()
+        elif args.out.endswith(".npy"):
+            print(f"{write_npy(chunks, args.out, args.rows)} randuri scrise in {args.out}")
+        else:
+            print(f"{write_csv(chunks, args.out)} randuri scrise in {args.out}")
+    except Exception as e:
+        print(f"Eroare: {e}")
+        sys.exit(1)
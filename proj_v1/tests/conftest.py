@@ -0,0 +1,27 @@
+import sys
+import os
+import pytest
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ml_logic import MLHandler, fit_model
+
+@pytest.fixture
+def handler(tmp_path, monkeypatch):
+    """Handler cu un split antrenat pe date sintetice (versiunile v1 si v2), intr-un director temporar."""
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "models").mkdir()
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(np.abs(rng.normal(size=(80, 10))) + 1, columns=['Age', 'Gender', 'TB', 'DB', 'Alk', 'Sgpt', 'Sgot', 'TP', 'ALB', 'AG'])
+    X['Gender'] = rng.integers(0, 2, 80); X['DB'] = X['TB'] / 2
+    Y = pd.Series((X['TB'] > X['TB'].median()).astype(int))
+    h = MLHandler([0.25])
+    h.refresh_evaluation = lambda: None
+    for seed in (1, 2):
+        _, _, svm, sc, _ = fit_model(X, Y, 0.25, 'SVM', seed)
+        _, _, mlp, _, _ = fit_model(X, Y, 0.25, 'MLP', seed)
+        h.save_split(0.25, {'SVM': svm, 'MLP': mlp, 'SCALER': sc}, source='test', seed=seed)
+    return h, X.to_numpy()
@@ -0,0 +1,87 @@
+import sys
+import os
+import threading
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import auth
+from auth import AuthService, AuthError, hash_password, hash_cost
+from sqlite_db import SqliteDatabase
+
+@pytest.fixture
+def db(tmp_path):
+    store = SqliteDatabase(str(tmp_path / "auth.db"))
+    yield store
+    store.close()
+
+def test_login_issues_verifiable_token(db):
+    """Login-ul corect emite un token verificabil fara bcrypt; parola sau utilizatorul gresit sunt respinse."""
+
+    service = AuthService(db, rounds=4, secret="cheie")
+    uid = service.create_user('medic', 'parola')
+    assert hash_cost(db.find_user('medic')[1]) == 4
+
+    session = service.login('medic', 'parola')
+    assert (session.user_id, session.role) == (uid, 'MEDIC')
+    assert service.verify_token(session.token) == (uid, 'MEDIC')
+    assert AuthService(db, rounds=4, secret="cheie").verify_token(session.token) == (uid, 'MEDIC')
+
+    with pytest.raises(AuthError) as wrong: service.login('medic', 'gresit')
+    with pytest.raises(AuthError) as unknown: service.login('altcineva', 'parola')
+    assert str(wrong.value) == str(unknown.value) == "Utilizator sau parola incorecta!"
+
+
+def test_bcrypt_runs_on_the_auth_pool(db, monkeypatch):
+    """Verificarea parolei ruleaza pe firele dedicate, nu pe firul apelantului."""
+
+    service = AuthService(db, rounds=4)
+    service.create_user('medic', 'parola')
+    threads, original = [], auth.bcrypt.checkpw
+    monkeypatch.setattr(auth.bcrypt, 'checkpw', lambda *a: threads.append(threading.current_thread().name) or original(*a))
+    service.login('medic', 'parola')
+    assert threads and threads[0].startswith("auth")
+
+    # Un utilizator inexistent trece prin aceeasi verificare bcrypt (fara diferenta de timp fata de o parola gresita)
+    with pytest.raises(AuthError): service.login('altcineva', 'parola')
+    assert len(threads) == 2 and hash_cost(service._dummy_hash.result()) == 4
+
+def test_login_rehashes_when_cost_changes(db):
+    """Un hash cu alt cost decat cel configurat este refacut transparent la login."""
+
+    db.create_user('medic', hash_password('parola', rounds=4), 'ADMIN')
+    AuthService(db, rounds=5).login('medic', 'parola')
+    stored = db.find_user('medic')[1]
+    assert hash_cost(stored) == 5
+    # Noul hash functioneaza, iar un login cu acelasi cost nu il mai schimba
+    AuthService(db, rounds=5).login('medic', 'parola')
+    assert db.find_user('medic')[1] == stored
+
+def test_tampered_or_expired_tokens_are_rejected(db, monkeypatch):
+    """Orice modificare a token-ului, alta cheie sau expirarea il invalideaza; rolul poate fi impus."""
+
+    service = AuthService(db, rounds=4, ttl=60)
+    session = service.issue_token(7, 'MEDIC')
+    forged = session.token.replace(".MEDIC.", ".ADMIN.")
+    for token in (forged, session.token + "x", "gunoi", None):
+        with pytest.raises(AuthError): service.verify_token(token)
+    with pytest.raises(AuthError): AuthService(db, rounds=4).verify_token(session.token)
+    with pytest.raises(AuthError, match="ADMIN"): service.require(session.token, 'ADMIN')
+    assert service.require(session.token, 'MEDIC') == (7, 'MEDIC')
+
+    now = auth.time.time()
+    monkeypatch.setattr(auth.time, 'time', lambda: now + 61)
+    with pytest.raises(AuthError, match="expirat"): service.verify_token(session.token)
+
+def test_refresh_extends_a_live_session_only(db, monkeypatch):
+    """O sesiune valida este prelungita cu inca un ttl; una expirata nu mai poate fi reinnoita."""
+
+    service = AuthService(db, rounds=4, ttl=60)
+    session = service.issue_token(7, 'ADMIN')
+    now = auth.time.time()
+    monkeypatch.setattr(auth.time, 'time', lambda: now + 50)
+    renewed = service.refresh(session.token)
+    assert (renewed.user_id, renewed.role) == (7, 'ADMIN') and renewed.expires > session.expires
+    monkeypatch.setattr(auth.time, 'time', lambda: now + 100)
+    assert service.verify_token(renewed.token) == (7, 'ADMIN')
+    with pytest.raises(AuthError, match="expirat"): service.refresh(session.token)
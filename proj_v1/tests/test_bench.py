@@ -0,0 +1,64 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bench
+from bench import fixture_rows, compare, metric
+from sqlite_db import SqliteConnection, SqliteDatabase
+from dataset import LONG_NAMES
+from seeder import seed_chunk
+
+def report(**values):
+    return {'results': {name: metric(v, 'ms' if better == 'lower' else 'rows/s', better)
+                        for name, (v, better) in values.items()}}
+
+def test_compare_flags_regressions_in_both_directions():
+    """Latenta mai mare si debitul mai mic peste toleranta sunt regresii; abaterile mici sunt ok."""
+
+    baseline = report(lat=(10.0, 'lower'), rate=(1000.0, 'higher'), stable=(5.0, 'lower'))
+    current = report(lat=(13.0, 'lower'), rate=(700.0, 'higher'), stable=(5.5, 'lower'), extra=(1.0, 'lower'))
+    status = {r['name']: r['status'] for r in compare(current, baseline, tolerance=0.2)}
+    assert status == {'lat': 'regresie', 'rate': 'regresie', 'stable': 'ok', 'extra': 'nou'}
+
+    faster = report(lat=(5.0, 'lower'), rate=(2000.0, 'higher'))
+    assert {r['status'] for r in compare(faster, baseline, tolerance=0.2)} == {'imbunatatire'}
+
+def test_fixture_is_reproducible_and_valid():
+    """Setul generat este identic intre rulari, are ambele clase si respecta DB <= TB."""
+
+    a, b = fixture_rows(300), fixture_rows(300)
+    assert a.equals(b)
+    assert set(a['Dataset']) == {0, 1}
+    assert (a['DB'] <= a['TB']).all() and a['Age'].between(0, 120).all()
+
+def test_sqlite_runs_seeder_and_history_queries(tmp_path):
+    """Seeder-ul si paginarea din Database ruleaza nemodificate peste baza locala SQLite."""
+
+    path = str(tmp_path / "bench.db")
+    conn = SqliteConnection(path)
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO USERS (username, password_hash, role) VALUES (%s, %s, %s)", ('medic', 'x', 'MEDIC'))
+    df = fixture_rows(250).rename(columns=LONG_NAMES)
+    assert seed_chunk(cursor, df, cursor.lastrowid, prefix='T') == 250
+    # A doua rulare pe acelasi lot nu dubleaza nimic (INSERT IGNORE + verificarea predictiilor existente)
+    assert seed_chunk(cursor, df, 1, prefix='T') == 0
+    conn.commit()
+
+    db = SqliteDatabase(path, pool_size=1)
+    first = db.fetch_history_page(100)
+    assert len(first) == 100 and first[0][0] == 250
+    older = db.fetch_history_page(100, before_id=first[-1][0])
+    assert [row[0] for row in older] == list(range(150, 50, -1))
+    newer = db.fetch_history_page(10, after_id=240)
+    assert [row[0] for row in newer] == list(range(250, 240, -1))
+    assert db.timings()['history_first']['count'] == 1
+
+def test_history_section_reports_every_volume(tmp_path, monkeypatch):
+    """Sectiunea de istoric masoara cele trei pagini la fiecare volum cerut."""
+
+    monkeypatch.chdir(tmp_path)
+    cfg = dict(bench.bench_config, history_rows=[500, 2000], repeat=1)
+    results = bench.bench_history(cfg)
+    assert set(results) == {f"history.{name}.{n}" for name in ('first', 'older', 'newer') for n in (500, 2000)}
+    assert all(r['unit'] == 'ms' and r['value'] >= 0 for r in results.values())
@@ -0,0 +1,66 @@
+import sys
+import os
+import pytest
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bundle import write_bundle, read_bundle, BundleError, ALIGN
+from ml_logic import MLHandler, fit_model
+
+@pytest.fixture(scope="module")
+def trained():
+    """Antreneaza un SVM si un MLP mici pe date sintetice (o singura data pe modul)."""
+
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(80, 10)), columns=['Age', 'Gender', 'TB', 'DB', 'Alk', 'Sgpt', 'Sgot', 'TP', 'ALB', 'AG'])
+    Y = pd.Series((X['TB'] + X['Alk'] > 0).astype(int))
+    _, _, svm, sc, _ = fit_model(X, Y, 0.25, 'SVM', 42)
+    _, _, mlp, _, _ = fit_model(X, Y, 0.25, 'MLP', 42)
+    return svm, mlp, sc
+
+def test_bundle_roundtrip(trained, tmp_path):
+    """Testeaza ca tablourile citite sunt identice, mapate in memorie si aliniate."""
+
+    svm, mlp, sc = trained
+    path = write_bundle(str(tmp_path / "bundle_25.bin"), svm, mlp, sc, {'split': 0.25})
+    b = read_bundle(path)
+
+    assert b.meta['split'] == 0.25
+    assert b.meta['svm']['gamma'] == svm._gamma
+    assert b.meta['mlp']['layers'] == 3 and b.meta['mlp']['out_activation'] == 'logistic'
+    np.testing.assert_array_equal(b['svm_support_vectors'], svm.support_vectors_)
+    np.testing.assert_array_equal(b['svm_dual_coef'], svm.dual_coef_)
+    np.testing.assert_array_equal(b['scaler_scale'], sc.scale_)
+    for (W, c), W0, c0 in zip(b.mlp_layers(), mlp.coefs_, mlp.intercepts_):
+        np.testing.assert_array_equal(W, W0); np.testing.assert_array_equal(c, c0)
+
+    # Datele nu sunt copiate: fiecare tablou este o vedere read-only peste fisierul mapat
+    for arr in b.arrays.values():
+        assert isinstance(arr.base, np.memmap) or isinstance(arr, np.memmap)
+        assert not arr.flags.writeable
+        assert arr.ctypes.data % ALIGN == 0
+
+def test_bundle_rejects_invalid_file(tmp_path):
+    """Testeaza respingerea fisierelor care nu sunt pachete."""
+
+    path = tmp_path / "bad.bin"
+    path.write_bytes(b"not a bundle at all")
+    with pytest.raises(BundleError):
+        read_bundle(str(path))
+
+def test_handler_exports_stale_bundle(trained, tmp_path, monkeypatch):
+    """Testeaza ca pachetul lipsa este exportat din modelele inregistrate la prima cerere."""
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "models").mkdir()
+    svm, mlp, sc = trained
+    handler = MLHandler([0.20])
+    handler.models_data.register(0.20, MLHandler.artifact_paths(0.20), {'SVM': svm, 'MLP': mlp, 'SCALER': sc},
+                                 MLHandler.bundle_path(0.20))
+
+    b = handler.models_data.get_bundle(0.20)
+    assert os.path.exists(MLHandler.bundle_path(0.20))
+    assert handler.models_data.get_bundle(0.20) is b
+    np.testing.assert_array_equal(b['scaler_mean'], sc.mean_)
@@ -1,8 +1,10 @@
 import sys
 import os
+import pytest
+from unittest.mock import MagicMock, patch
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from database import db_config
+from database import db_config, Database, HistoryPager, QUERIES
 
 def test_db_config_structure():
     """Verifica daca dictionarul de configurare DB are cheile necesare."""
@@ -10,3 +12,97 @@ def test_db_config_structure():
     for key in required_keys:
         assert key in db_config
         assert db_config[key] is not None
+
+@patch('database.mysql.connector.connect')
+def test_pool_reuses_connection_and_prepared_cursors(mock_connect):
+    """Doua operatii consecutive folosesc aceeasi conexiune si acelasi cursor pregatit."""
+    raw = MagicMock()
+    raw.is_connected.return_value = True
+    cursor = raw.cursor.return_value
+    cursor.fetchall.return_value = [(7, b'$2b$12$hash', 'MEDIC')]
+    mock_connect.return_value = raw
+
+    db = Database(db_config, pool_size=2)
+    assert db.find_user('medic') == (7, '$2b$12$hash', 'MEDIC')
+    assert db.find_user('medic') == (7, '$2b$12$hash', 'MEDIC')
+
+    assert mock_connect.call_count == 1
+    raw.cursor.assert_called_once_with(prepared=True)
+    cursor.execute.assert_called_with(QUERIES['find_user'], ('medic',))
+    assert raw.commit.call_count == 2
+    assert db.timings()['find_user']['count'] == 2
+
+@patch('database.mysql.connector.connect')
+def test_failed_transaction_is_rolled_back(mock_connect):
+    """O eroare in timpul salvarii anuleaza tranzactia si este propagata apelantului."""
+    raw = MagicMock()
+    raw.cursor.return_value.executemany.side_effect = RuntimeError("db down")
+    mock_connect.return_value = raw
+
+    db = Database(db_config)
+    with pytest.raises(RuntimeError):
+        db.save_journal_batch([journal_entry('1', 1, 0.9, 'SVM-20-v1')])
+    raw.rollback.assert_called_once()
+    raw.commit.assert_not_called()
+
+class FakeHistoryDB:
+    """Simuleaza paginarea dupa cheie peste 1000 de predictii (id 1..1000)."""
+    def __init__(self, n=1000):
+        self.ids = list(range(n, 0, -1))
+        self.calls = []
+
+    def fetch_history_page(self, limit, before_id=None, after_id=None):
+        self.calls.append((limit, before_id, after_id))
+        if after_id is not None:
+            ids = sorted(i for i in self.ids if i > after_id)[:limit][::-1]
+        else:
+            ids = [i for i in self.ids if before_id is None or i < before_id][:limit]
+        return [(i, f"P{i}", "CNP", 1, 0.5) for i in ids]
+
+def test_history_pager_keeps_a_bounded_window():
+    """Derularea in jos aduce pagini noi si elimina paginile de sus; derularea in sus le reincarca."""
+    db = FakeHistoryDB()
+    pager = HistoryPager(db, page_size=100, max_pages=3)
+
+    assert [r[0] for r in pager.reset()][:2] == [1000, 999]
+    for _ in range(4): pager.older()
+    ids = [r[0] for r in pager.rows()]
+    assert len(ids) == 300 and ids[0] == 800 and ids[-1] == 501
+    assert not pager.at_newest
+    assert db.calls[-1] == (100, 601, None)
+
+    added, dropped = pager.newer()
+    assert [r[0] for r in added][:1] == [900] and [r[0] for r in added][-1] == 801
+    assert dropped[-1][0] == 501
+    ids = [r[0] for r in pager.rows()]
+    assert ids == list(range(900, 600, -1))
+
+    while not pager.at_oldest: pager.older()
+    assert pager.rows()[-1][0] == 1
+    assert pager.older() == ([], [])
+
+def journal_entry(cnp, result, confidence, version):
+    return {'journal_id': f"j{cnp}{version}", 'patient': (cnp, 'Ion', 'M', '1970-01-01'), 'user_id': 3,
+            'result': result, 'confidence': confidence, 'clin': [50, 1] + [1.0] * 8, 'model_version': version}
+
+@patch('database.mysql.connector.connect')
+def test_journal_batch_uses_one_upsert_per_patient_and_one_batched_insert(mock_connect):
+    """Un lot din jurnal face un upsert per pacient distinct (fara SELECT) si un singur executemany, intr-o tranzactie."""
+    raw = MagicMock()
+    prepared, plain = MagicMock(), MagicMock()
+    raw.cursor.side_effect = lambda **kw: prepared if kw.get('prepared') else plain
+    prepared.lastrowid = 5
+    plain.rowcount = 3
+    mock_connect.return_value = raw
+
+    db = Database(db_config)
+    entries = [journal_entry('1', 1, 0.9, 'SVM-20-v1'), journal_entry('1', 0, 0.4, 'MLP-20-v1'), journal_entry('2', 1, 0.8, 'SVM-20-v1')]
+    assert db.save_journal_batch(entries) == 3
+
+    assert [c[0][0] for c in prepared.execute.call_args_list] == [QUERIES['upsert_patient']] * 2
+    query, rows = plain.executemany.call_args[0]
+    assert query == QUERIES['journal_prediction']
+    assert rows[0] == (5, 3, 1, 0.9, 50, 1, *[1.0] * 8, 'SVM-20-v1', 'j1SVM-20-v1')
+    assert len(rows) == 3
+    plain.execute.assert_not_called()
+    raw.commit.assert_called_once()
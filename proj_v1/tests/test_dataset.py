@@ -0,0 +1,75 @@
+import sys
+import os
+import pytest
+import numpy as np
+import pandas as pd
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dataset
+from dataset import load_dataset, dataset_hash, DatasetError
+
+@pytest.fixture
+def raw_csv():
+    """Imita fisierul brut ILPD (fara header, etichete text)."""
+    return pd.DataFrame([
+        [65, 'Female', 0.7, 0.1, 187, 16, 18, 6.8, 3.3, 0.9, 1],
+        [62, 'Male', 10.9, 5.5, 699, 64, 100, 7.5, 3.2, 0.74, 1],
+        [58, 'Male', 1.0, 0.4, 182, 14, 20, 6.8, 3.4, 1.0, 2],
+        [72, 'Male', 3.9, 2.0, 195, 27, 59, 7.3, 2.4, None, 1],
+    ], columns=dataset.COLUMNS)
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Izoleaza cache-ul pe disc si in memorie pentru fiecare test."""
+    monkeypatch.setitem(dataset.dataset_config, 'cache_dir', str(tmp_path))
+    monkeypatch.setitem(dataset.dataset_config, 'offline', False)
+    monkeypatch.setitem(dataset.dataset_config, 'sha256', None)
+    dataset._loaded.clear()
+    yield tmp_path
+    dataset._loaded.clear()
+
+def test_fetch_once_then_cache(cache_dir, raw_csv):
+    """Prima incarcare descarca si codifica setul, urmatoarele il servesc din cache."""
+    with patch('dataset.pd.read_csv', return_value=raw_csv) as mock_read:
+        df = load_dataset()
+        assert mock_read.call_count == 1
+        assert list(df.columns) == dataset.COLUMNS
+        assert len(df) == 3
+        assert df['Gender'].tolist() == [0, 1, 1]
+        assert df['Dataset'].tolist() == [1, 1, 0]
+        assert df.index.tolist() == [0, 1, 2]
+
+        dataset._loaded.clear()
+        df2 = load_dataset(offline=True)
+        assert mock_read.call_count == 1
+        pd.testing.assert_frame_equal(df, df2)
+
+def test_offline_without_cache(cache_dir):
+    """In mod offline, lipsa cache-ului este raportata explicit."""
+    with pytest.raises(DatasetError):
+        load_dataset(offline=True)
+
+def test_corrupt_cache_is_refetched(cache_dir, raw_csv):
+    """Un fisier din cache modificat nu trece verificarea sumei de control."""
+    with patch('dataset.pd.read_csv', return_value=raw_csv):
+        load_dataset()
+    sha = dataset_hash()
+    npy = os.path.join(cache_dir, f"ilpd-{sha[:16]}.npy")
+    np.save(npy, np.zeros((3, 12)))
+    dataset._loaded.clear()
+
+    with pytest.raises(DatasetError):
+        load_dataset(offline=True)
+    with patch('dataset.pd.read_csv', return_value=raw_csv) as mock_read:
+        load_dataset()
+        assert mock_read.called
+    assert dataset_hash() == sha
+
+def test_pinned_checksum_mismatch(cache_dir, raw_csv, monkeypatch):
+    """Un continut diferit de suma de control fixata in configuratie este respins."""
+    monkeypatch.setitem(dataset.dataset_config, 'sha256', "0" * 64)
+    with patch('dataset.pd.read_csv', return_value=raw_csv):
+        with pytest.raises(DatasetError):
+            load_dataset()
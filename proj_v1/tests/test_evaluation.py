@@ -0,0 +1,59 @@
+import sys
+import os
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from evaluation import EvaluationCache, report_key, compute_report, format_report
+
+@pytest.fixture
+def artifacts(tmp_path):
+    paths = {}
+    for sz in (0.2, 0.3):
+        paths[sz] = {}
+        for name in ('SVM', 'MLP', 'SC'):
+            p = tmp_path / f"{name}_{sz}.pkl"; p.write_bytes(f"{name}{sz}".encode())
+            paths[sz][name] = str(p)
+    return paths
+
+def test_key_changes_with_dataset_and_artifacts(artifacts):
+    base = report_key("a" * 64, artifacts)
+    assert report_key("a" * 64, artifacts) == base
+    assert report_key("b" * 64, artifacts) != base
+    with open(artifacts[0.3]['MLP'], 'wb') as f: f.write(b"re-antrenat")
+    assert report_key("a" * 64, artifacts) != base
+
+def fake_models():
+    model = MagicMock(); model.predict.side_effect = lambda X: (X[:, 0] > 0).astype(int)
+    scaler = MagicMock(); scaler.transform.side_effect = lambda X: X.to_numpy() - 45
+    return {sz: {'SVM': model, 'MLP': model, 'SCALER': scaler} for sz in (0.2, 0.3)}
+
+def test_compute_report_metrics():
+    df = pd.DataFrame({'Age': [30, 50, 60, 40], 'TB': [1.0, 2.0, 3.0, 4.0], 'Dataset': [0, 1, 0, 1]})
+    report = compute_report(df, fake_models(), [0.2, 0.3])
+    assert report['describe']['Age']['mean'] == 45
+    svm = report['models'][0]
+    assert (svm['split'], svm['model']) == (0.2, 'SVM')
+    assert svm['confusion'] == [[1, 1], [1, 1]] and svm['accuracy'] == 0.5
+    assert "C. MATRICE DE CONFUZIE" in format_report(report)
+
+def test_cache_serves_until_artifacts_change(tmp_path, artifacts):
+    handler = MagicMock(test_sizes=[0.2, 0.3])
+    handler.artifact_paths.side_effect = lambda sz: artifacts[sz]
+    cache = EvaluationCache(str(tmp_path / "eval"))
+    with patch('evaluation.dataset_hash', return_value="a" * 64), \
+         patch('evaluation.load_dataset', return_value=pd.DataFrame({'Age': [30, 60], 'Dataset': [0, 1]})), \
+         patch('evaluation.compute_report', side_effect=lambda *a: {'n': len(os.listdir(tmp_path))}) as compute:
+        first = cache.get_or_compute(handler)
+        assert cache.get_or_compute(handler) == first
+        # Un proces nou gaseste raportul pe disc
+        assert EvaluationCache(str(tmp_path / "eval")).get_or_compute(handler) == first
+        assert compute.call_count == 1
+
+        with open(artifacts[0.2]['SVM'], 'wb') as f: f.write(b"model nou")
+        cache.get_or_compute(handler)
+        assert compute.call_count == 2
+        # Raportul vechi este sters de pe disc
+        assert len(os.listdir(tmp_path / "eval")) == 1
@@ -0,0 +1,114 @@
+import sys
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gui_frames import PatientFormFrame, HistoryFrame
+
+class FakeForm:
+    """Formularul fara Tk: after() doar retine callback-urile programate, butoanele sunt mock-uri."""
+
+    LOADING_TEXT = PatientFormFrame.LOADING_TEXT
+
+    def __init__(self):
+        self.controller = MagicMock(models_ready=threading.Event(), models_error=None)
+        self.run_btn, self.compare_btn, self.csv_btn = MagicMock(), MagicMock(), MagicMock()
+        self.models_job = None
+        self.jobs = {}
+
+    def after(self, ms, fn):
+        job = f"after#{len(self.jobs)}"
+        self.jobs[job] = fn
+        return job
+
+    def after_cancel(self, job): self.jobs.pop(job, None)
+
+    def button_texts(self): return PatientFormFrame.button_texts(self)
+
+    def refresh(self): PatientFormFrame.refresh(self)
+
+    def fire(self):
+        job, fn = self.jobs.popitem()
+        fn()
+
+@patch('gui_frames.messagebox')
+def test_model_gating_keeps_one_pending_check(messagebox):
+    """Navigarile repetate in timpul incarcarii lasa o singura verificare programata; esecul este raportat o data."""
+
+    form = FakeForm()
+    for _ in range(3): form.refresh()
+    assert len(form.jobs) == 1
+    form.run_btn.configure.assert_called_with(state="disabled", text=PatientFormFrame.LOADING_TEXT)
+
+    form.controller.models_error = "modele lipsa"
+    form.fire()
+    assert form.jobs == {} and messagebox.showerror.call_count == 1
+    form.run_btn.configure.assert_called_with(state="disabled", text="Modele indisponibile")
+
+@patch('gui_frames.messagebox')
+def test_model_gating_enables_buttons_when_ready(messagebox):
+    """Cand modelele sunt gata, butoanele revin la textul lor si verificarea periodica se opreste."""
+
+    form = FakeForm()
+    form.refresh()
+    form.run_btn.cget.return_value = PatientFormFrame.LOADING_TEXT
+    form.controller.models_ready.set()
+    form.fire()
+    assert form.jobs == {}
+    form.run_btn.configure.assert_called_with(state="normal", text="Ruleaza Predictie")
+    messagebox.showerror.assert_not_called()
+
+class SyncTasks:
+    """TaskRunner sincron: ruleaza functia imediat si livreaza rezultatul/eroarea callback-ului."""
+
+    def submit(self, fn, *args, on_done=None, on_error=None, busy=None):
+        try: result = fn(*args)
+        except Exception as e: return on_error(e)
+        on_done(result)
+
+class FakeHistory:
+    """Istoricul fara Tk: tabelul si eticheta sunt mock-uri, metodele reale ale HistoryFrame."""
+
+    def __init__(self, db):
+        self.controller = MagicMock(db=db, tasks=SyncTasks())
+        self.tree, self.count_lbl = MagicMock(), MagicMock()
+        self.tree.get_children.return_value = []
+        self.pager, self.loading, self.total_estimate = None, False, None
+
+    def __getattr__(self, name):
+        return getattr(HistoryFrame, name).__get__(self)
+
+@patch('gui_frames.messagebox')
+def test_history_database_error_is_reported_not_raised(messagebox):
+    """O baza de date indisponibila la deschiderea istoricului afiseaza un dialog si lasa fereastra utilizabila."""
+
+    db = MagicMock()
+    db.fetch_history_page.side_effect = RuntimeError("conexiune refuzata")
+    frame = FakeHistory(db)
+    HistoryFrame.refresh(frame)
+    messagebox.showerror.assert_called_once_with("Eroare DB", "conexiune refuzata")
+    assert frame.loading is False and frame.pager is None
+    frame.count_lbl.configure.assert_called_with(text="Istoricul nu a putut fi incarcat.")
+
+    # Derularea fara pager nu mai porneste alte interogari
+    HistoryFrame.load_page(frame, True)
+    assert db.fetch_history_page.call_count == 1
+
+@patch('gui_frames.messagebox')
+def test_history_page_error_releases_loading(messagebox):
+    """Esecul unei pagini ulterioare este raportat si nu blocheaza derularile urmatoare."""
+
+    db = MagicMock()
+    db.fetch_history_page.return_value = [(i, f"r{i}") for i in range(200, 0, -1)]
+    db.estimate_history_count.return_value = 400
+    frame = FakeHistory(db)
+    HistoryFrame.refresh(frame)
+    assert frame.pager is not None and frame.total_estimate == 400
+    assert frame.tree.insert.call_count == 200
+
+    db.fetch_history_page.side_effect = RuntimeError("timeout")
+    HistoryFrame.load_page(frame, True)
+    messagebox.showerror.assert_called_once_with("Eroare DB", "timeout")
+    assert frame.loading is False
@@ -0,0 +1,109 @@
+import sys
+import os
+import warnings
+import pytest
+import numpy as np
+import joblib
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bundle import write_bundle, read_bundle
+from inference import compile_bundle
+from ml_logic import MLHandler
+
+MODELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models")
+
+def load_split(suffix):
+    """Incarca artefactele livrate cu proiectul (avertismentele de versiune sklearn sunt ignorate)."""
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return [joblib.load(os.path.join(MODELS_DIR, f"{name}_{suffix}.pkl")) for name in ('svm', 'mlp', 'scaler')]
+
+def patients(sc, n, seed=1):
+    """Pacienti aleatori in jurul mediei de antrenare, inclusiv valori departe de ea."""
+
+    rng = np.random.default_rng(seed)
+    X = sc.mean_ + rng.standard_normal((n, sc.mean_.shape[0])) * sc.scale_ * 3
+    X[:, 1] = rng.integers(0, 2, n)
+    return X
+
+@pytest.mark.parametrize("suffix", [20, 30, 40, 50])
+def test_engine_matches_sklearn(suffix, tmp_path):
+    """Testeaza ca motorul numpy reproduce predict_proba si eticheta sklearn pe modelele livrate."""
+
+    svm, mlp, sc = load_split(suffix)
+    engine = compile_bundle(read_bundle(write_bundle(str(tmp_path / "b.bin"), svm, mlp, sc)))
+    X = patients(sc, 3000)
+    Xs = sc.transform(X)
+
+    np.testing.assert_allclose(engine.svm_decision(X), svm.decision_function(Xs), rtol=0, atol=1e-10)
+    for algo, model in (('SVM', svm), ('MLP', mlp)):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            proba = model.predict_proba(Xs)
+        labels, p1 = engine.predict(X, algo)
+        np.testing.assert_allclose(p1, proba[:, 1], rtol=0, atol=1e-10)
+        np.testing.assert_array_equal(labels, model.classes_[np.argmax(proba, axis=1)])
+
+def test_engine_single_row_and_chunking(tmp_path, monkeypatch):
+    """Testeaza un singur pacient (vector 1D) si evaluarea pe bucati a nucleului RBF."""
+
+    svm, mlp, sc = load_split(20)
+    engine = compile_bundle(read_bundle(write_bundle(str(tmp_path / "b.bin"), svm, mlp, sc)))
+    X = patients(sc, 50)
+    full = engine.svm_decision(X)
+    monkeypatch.setitem(__import__('inference').inference_config, 'chunk_rows', 7)
+    np.testing.assert_allclose(engine.svm_decision(X), full, rtol=0, atol=1e-12)
+
+    label, p1 = engine.predict(X[0], 'MLP')
+    assert label.shape == p1.shape == (1,)
+
+def test_predict_batch_uses_engine(tmp_path, monkeypatch):
+    """Testeaza ca predict_batch trece prin motorul compilat cand pachetul exista."""
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "models").mkdir()
+    svm, mlp, sc = load_split(30)
+    handler = MLHandler([0.30])
+    handler.models_data.register(0.30, MLHandler.artifact_paths(0.30), {'SVM': svm, 'MLP': mlp, 'SCALER': sc},
+                                 MLHandler.bundle_path(0.30))
+    # Pacienti valid clinic: varsta in [0, 120], valori pozitive, DB <= TB
+    X = np.abs(patients(sc, 40))
+    X[:, 0] = np.clip(X[:, 0], 1, 120)
+    X[:, 3] = np.minimum(X[:, 3], X[:, 2])
+
+    labels, p1 = handler.predict_batch(X, 0.30, 'SVM')
+    assert handler.engine(0.30) is handler.engine(0.30)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        np.testing.assert_allclose(p1, svm.predict_proba(sc.transform(X))[:, 1], rtol=0, atol=1e-10)
+    assert labels.dtype.kind == 'i'
+
+def test_predict_all_shares_scaling(tmp_path, monkeypatch):
+    """Compararea tuturor modelelor scaleaza o data per scaler si reproduce predictiile individuale."""
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "models").mkdir()
+    handler = MLHandler([0.20, 0.30])
+    for size, suffix in ((0.20, 20), (0.30, 30)):
+        svm, mlp, sc = load_split(suffix)
+        handler.models_data.register(size, MLHandler.artifact_paths(size), {'SVM': svm, 'MLP': mlp, 'SCALER': sc},
+                                     MLHandler.bundle_path(size))
+    X = np.abs(patients(sc, 5))
+    X[:, 0] = np.clip(X[:, 0], 1, 120)
+    X[:, 3] = np.minimum(X[:, 3], X[:, 2])
+
+    scale_calls = []
+    for size in (0.20, 0.30):
+        engine = handler.engine(size)
+        monkeypatch.setattr(engine, 'scale', lambda X, f=engine.scale: scale_calls.append(1) or f(X))
+    results = handler.predict_all(X)
+
+    assert [(r['split'], r['algo']) for r in results] == [(0.20, 'SVM'), (0.20, 'MLP'), (0.30, 'SVM'), (0.30, 'MLP')]
+    assert len(scale_calls) == 2
+    for r in results:
+        labels, p1 = handler.predict_batch(X, r['split'], r['algo'])
+        np.testing.assert_allclose(r['probabilities'], p1, rtol=0, atol=1e-12)
+        np.testing.assert_array_equal(r['labels'], labels)
+        assert r['ms'] >= 0
@@ -0,0 +1,140 @@
+import sys
+import os
+import json
+import time
+import sqlite3
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import journal
+from journal import PredictionJournal
+from sqlite_db import SqliteDatabase
+from database import is_data_error
+
+CLIN = [50, 1, 0.9, 0.2, 150, 20, 25, 6.8, 3.3, 0.9]
+PATIENT = ('1234', 'Ion', 'M', '1970-01-01')
+
+@pytest.fixture
+def db(tmp_path):
+    store = SqliteDatabase(str(tmp_path / "journal.db"))
+    store.uid = store.create_user('medic', 'x')
+    yield store
+    store.close()
+
+def count(db):
+    return len(db.fetch_history_page(100))
+
+class FailingDb:
+    def save_journal_batch(self, entries): raise ConnectionError("MariaDB indisponibil")
+
+def test_flush_writes_batches_and_checkpoints(db, tmp_path):
+    """Predictiile ajung in baza de date in loturi; pacientul este inserat o singura data, fara SELECT separat."""
+
+    path = str(tmp_path / "j" / "predictions.jsonl")
+    j = PredictionJournal(db, path, batch_size=4, background=False)
+    ids = [j.append(PATIENT, db.uid, CLIN, i % 2, 0.5, 'SVM-20-v1') for i in range(9)]
+    assert len(set(ids)) == 9 and j.pending() == 9 and count(db) == 0
+
+    assert j.flush() == 9
+    assert count(db) == 9 and j.pending() == 0
+    assert db.timings()['journal_prediction']['count'] == 3
+    assert db.timings()['upsert_patient']['count'] == 3
+    assert 'patient_id' not in db.timings()
+    assert j.stats()['checkpoint'] == os.path.getsize(path)
+    j.close()
+
+def test_replay_after_restart_is_idempotent(db, tmp_path):
+    """Un jurnal trimis dar fara checkpoint (oprire brusca) este retrimis la pornire fara dubluri."""
+
+    path = str(tmp_path / "predictions.jsonl")
+    j = PredictionJournal(db, path, background=False)
+    j.append_many(PATIENT, db.uid, CLIN, [(1, 0.9, 'SVM-20-v1'), (0, 0.2, 'MLP-20-v1')])
+    j.flush()
+    j.close()
+    os.remove(path + ".offset")
+
+    j = PredictionJournal(db, path, background=False)
+    assert j.pending() == 2
+    j.flush()
+    assert count(db) == 2
+    j.close()
+
+def test_database_down_keeps_entries(db, tmp_path):
+    """Daca baza de date cade, predictiile raman in jurnal si sunt scrise la urmatoarea pornire."""
+
+    path = str(tmp_path / "predictions.jsonl")
+    j = PredictionJournal(FailingDb(), path, background=False)
+    j.append(PATIENT, db.uid, CLIN, 1, 0.9)
+    with pytest.raises(ConnectionError): j.flush()
+    j.close()
+    assert j.pending() == 1
+
+    j = PredictionJournal(db, path, background=False)
+    assert j.flush() == 1 and count(db) == 1
+    j.close()
+
+def test_torn_tail_is_truncated(db, tmp_path):
+    """O linie scrisa pe jumatate la sfarsitul jurnalului este eliminata la deschidere."""
+
+    path = str(tmp_path / "predictions.jsonl")
+    j = PredictionJournal(db, path, background=False)
+    j.append(PATIENT, db.uid, CLIN, 1, 0.9)
+    j.close()
+    good = os.path.getsize(path)
+    with open(path, 'ab') as f: f.write(b'{"journal_id": "abc", "pat')
+
+    j = PredictionJournal(db, path, background=False)
+    assert os.path.getsize(path) == good and j.pending() == 0
+    j.append(PATIENT, db.uid, CLIN, 0, 0.1)
+    assert j.flush() == 1 and count(db) == 2
+    j.close()
+
+def test_background_flush_and_compaction(db, tmp_path, monkeypatch):
+    """Firul de fundal scrie fara apel explicit; jurnalul complet scris este golit."""
+
+    monkeypatch.setitem(journal.journal_config, 'compact_bytes', 1)
+    path = str(tmp_path / "predictions.jsonl")
+    j = PredictionJournal(db, path, fsync='never', flush_interval=0.01)
+    j.append(PATIENT, db.uid, CLIN, 1, 0.9)
+    deadline = time.monotonic() + 5
+    while count(db) == 0 and time.monotonic() < deadline: time.sleep(0.01)
+    j.close()
+    assert count(db) == 1
+    assert os.path.getsize(path) == 0 and j.stats()['checkpoint'] == 0
+
+def test_fsync_policy(db, tmp_path, monkeypatch):
+    """'always' face fsync la fiecare scriere, 'never' deloc; politicile necunoscute sunt respinse."""
+
+    calls = []
+    monkeypatch.setattr(journal.os, 'fsync', lambda fd: calls.append(fd))
+    for policy, expected in (('always', 3), ('never', 0)):
+        calls.clear()
+        j = PredictionJournal(db, str(tmp_path / f"{policy}.jsonl"), fsync=policy, background=False)
+        for _ in range(3): j.append(PATIENT, db.uid, CLIN, 1, 0.9)
+        assert len(calls) == expected
+        j.close()
+    with pytest.raises(ValueError):
+        PredictionJournal(db, str(tmp_path / "x.jsonl"), fsync='uneori', background=False)
+
+def test_rejected_entry_does_not_block_the_rest(db, tmp_path):
+    """O intrare respinsa definitiv (utilizator inexistent) ajunge in <path>.dead; restul lotului este scris."""
+
+    path = str(tmp_path / "predictions.jsonl")
+    j = PredictionJournal(db, path, batch_size=8, background=False)
+    for i in range(5): j.append(PATIENT, db.uid if i != 2 else 10 ** 9, CLIN, 1, 0.5 + i / 10)
+    assert j.flush() == 4
+    assert count(db) == 4 and j.pending() == 0
+    stats = j.stats()
+    assert stats['rejected'] == 1 and "FOREIGN KEY" in stats['last_rejected']
+    with open(path + ".dead", encoding='utf-8') as f: dead = [json.loads(line) for line in f]
+    assert [d['entry']['user_id'] for d in dead] == [10 ** 9]
+    j.close()
+
+def test_data_errors_are_told_apart_from_connection_errors():
+    """Doar erorile de date sunt definitive; cele de conexiune se reincearca."""
+
+    assert is_data_error(sqlite3.IntegrityError("FOREIGN KEY constraint failed"))
+    assert is_data_error(KeyError('clin'))
+    assert not is_data_error(ConnectionError("MariaDB indisponibil"))
+    assert not is_data_error(sqlite3.OperationalError("database is locked"))
@@ -0,0 +1,83 @@
+import sys
+import os
+import pytest
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from migrate import discover, split_statements, migrate, explain_check, ensure_schema, pending, MigrationError, MIGRATIONS_DIR
+
+@pytest.fixture
+def migrations(tmp_path):
+    (tmp_path / "V2__indexes.sql").write_text("-- index\nCREATE INDEX IF NOT EXISTS i ON T (a);\n")
+    (tmp_path / "V10__later.sql").write_text("ALTER TABLE T ADD COLUMN IF NOT EXISTS c INT;")
+    (tmp_path / "V1__baseline.sql").write_text("CREATE TABLE IF NOT EXISTS T (a INT, b VARCHAR(5) DEFAULT ';');\nINSERT INTO T VALUES (1, 'x');")
+    (tmp_path / "README.txt").write_text("ignorat")
+    return tmp_path
+
+def fake_conn(applied):
+    conn = MagicMock()
+    cursor = conn.cursor.return_value
+    cursor.fetchall.return_value = list(applied.items())
+    return conn, cursor
+
+def test_discover_orders_by_numeric_version(migrations):
+    assert [(v, n) for v, n, _, _ in discover(str(migrations))] == [(1, 'baseline'), (2, 'indexes'), (10, 'later')]
+
+def test_split_statements_respects_strings_and_comments():
+    sql = "-- comentariu\nCREATE TABLE T (b VARCHAR(5) DEFAULT ';');\nINSERT INTO T VALUES ('a;b');"
+    assert split_statements(sql) == ["CREATE TABLE T (b VARCHAR(5) DEFAULT ';')", "INSERT INTO T VALUES ('a;b')"]
+
+def test_migrate_applies_only_pending_versions(migrations):
+    """Migrarile deja inregistrate sunt sarite, restul sunt aplicate in ordine si inregistrate."""
+    checksum = {v: c for v, _, _, c in discover(str(migrations))}
+    conn, cursor = fake_conn({1: checksum[1]})
+
+    assert migrate(conn, str(migrations)) == [2, 10]
+    executed = [c.args[0] for c in cursor.execute.call_args_list]
+    assert executed[2].startswith("CREATE INDEX IF NOT EXISTS i")
+    assert executed[4].startswith("ALTER TABLE T")
+    versions = [c.args[1][0] for c in cursor.execute.call_args_list if "INTO SCHEMA_VERSION" in c.args[0]]
+    assert versions == [2, 10]
+    assert conn.commit.call_count == 2
+
+def test_migrate_rejects_edited_migration(migrations):
+    conn, _ = fake_conn({1: "0" * 64})
+    with pytest.raises(MigrationError):
+        migrate(conn, str(migrations))
+
+def test_shipped_migrations_are_valid():
+    """Migrarile livrate sunt numerotate consecutiv si se pot imparti in instructiuni."""
+    found = discover(MIGRATIONS_DIR)
+    assert [v for v, _, _, _ in found] == list(range(1, len(found) + 1))
+    for _, _, path, _ in found:
+        with open(path, encoding='utf-8') as f: assert split_statements(f.read())
+
+def test_explain_check_flags_full_scans():
+    conn = MagicMock()
+    cursor = conn.cursor.return_value
+    cursor.fetchall.side_effect = [
+        [{'table': 'pr', 'type': 'range'}, {'table': 'p', 'type': 'eq_ref'}],
+        [{'table': 'PREDICTIONS', 'type': 'ALL'}],
+    ]
+    queries = {'ok': ("SELECT 1", ()), 'scan': ("SELECT 2", ())}
+    assert explain_check(conn, queries) == [('scan', 'PREDICTIONS')]
+
+def test_startup_check_applies_or_refuses(migrations):
+    """La pornire migrarile lipsa sunt aplicate; cu aplicarea automata oprita, o schema veche opreste pornirea."""
+    checksum = {v: c for v, _, _, c in discover(str(migrations))}
+    conn, cursor = fake_conn({1: checksum[1]})
+    assert pending(conn, str(migrations)) == [2, 10]
+
+    with patch('migrate.mysql') as mysql:
+        mysql.connector.connect.return_value = conn
+        with pytest.raises(MigrationError, match="V002, V010"):
+            ensure_schema(apply=False, directory=str(migrations))
+        conn.commit.assert_not_called()
+        assert ensure_schema(apply=True, directory=str(migrations)) == [2, 10]
+    assert conn.close.call_count == 2
+
+    conn, _ = fake_conn({v: c for v, c in checksum.items()})
+    with patch('migrate.mysql') as mysql:
+        mysql.connector.connect.return_value = conn
+        assert ensure_schema(apply=False, directory=str(migrations)) == []
@@ -7,7 +7,16 @@ from unittest.mock import MagicMock, patch
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from ml_logic import MLHandler
+import dataset
+from ml_logic import MLHandler, fit_model
+
+@pytest.fixture(autouse=True)
+def work_dir(tmp_path, monkeypatch):
+    """Ruleaza fiecare test intr-un director temporar, ca artefactele scrise (pachete, cache) sa nu ajunga in repo."""
+
+    (tmp_path / "models").mkdir()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
 
 @pytest.fixture
 def mock_data():
@@ -28,7 +37,7 @@ def mock_data():
     }
     return pd.DataFrame(data)
 
-@patch('ml_logic.pd.read_csv')
+@patch('dataset.pd.read_csv')
 @patch('ml_logic.os.makedirs')
 @patch('ml_logic.joblib.dump')
 @patch('ml_logic.joblib.load')
@@ -39,8 +48,9 @@ def test_initialize_ml_logic_training(mock_exists, mock_load, mock_dump, mock_ma
     # Simulam ca nu exista modele salvate
     mock_exists.return_value = False
     
-    # Simulam citirea datelor
+    # Simulam citirea datelor (fara cache-ul din memorie al altor teste)
     mock_read_csv.return_value = mock_data
+    dataset._loaded.clear()
     
     # Initializam handler
     test_sizes = [0.20]
@@ -83,3 +93,85 @@ def test_initialize_ml_logic_loading(mock_load, mock_exists):
     assert 0.20 in models
     assert models[0.20]['SVM'] == mock_svm
     assert models[0.20]['MLP'] == mock_mlp
+
+@patch('ml_logic.os.path.getsize')
+@patch('ml_logic.os.path.exists')
+@patch('ml_logic.joblib.load')
+def test_lazy_loading_with_memory_budget(mock_load, mock_exists, mock_getsize):
+    """Testeaza incarcarea la cerere si eliberarea LRU sub plafonul de memorie."""
+
+    mock_exists.return_value = True
+    mock_getsize.return_value = 100
+    mock_load.side_effect = lambda path: MagicMock(name=path)
+
+    handler = MLHandler([0.20, 0.30], max_bytes=250)
+    models = handler.initialize_ml_logic()
+
+    # Nimic nu este citit de pe disc inainte de prima cerere
+    assert mock_load.call_count == 0
+    assert set(models) == {0.20, 0.30}
+
+    svm = models[0.20]['SVM']
+    assert models[0.20]['SVM'] is svm
+    assert mock_load.call_count == 1
+
+    models[0.20]['SCALER']; models[0.30]['MLP']
+    assert models.memory_usage() == 200
+    # Al treilea artefact depaseste plafonul, deci cel mai vechi (SVM 0.20) este eliberat
+    assert (0.20, 'SVM') not in models.loaded_keys()
+    assert models.load_stats[(0.20, 'SVM')]['bytes'] == 100
+
+    models[0.20]['SVM']
+    assert mock_load.call_count == 4
+
+@patch('dataset.pd.read_csv')
+@patch('ml_logic.os.makedirs')
+@patch('ml_logic.joblib.dump')
+@patch('ml_logic.os.path.exists')
+def test_parallel_training_matches_sequential(mock_exists, mock_dump, mock_makedirs, mock_read_csv, mock_data):
+    """Testeaza ca antrenarea paralela produce aceleasi modele ca cea secventiala."""
+
+    mock_exists.return_value = False
+    mock_read_csv.return_value = mock_data
+    dataset._loaded.clear()
+
+    sequential = MLHandler([0.20, 0.30], workers=1)
+    parallel = MLHandler([0.20, 0.30], workers=2)
+    seq_models = sequential.initialize_ml_logic()
+    par_models = parallel.initialize_ml_logic()
+
+    # 3 fisiere per split pentru fiecare handler
+    assert mock_dump.call_count == 12
+    assert len(parallel.train_report) == 4
+    assert {(r['split'], r['model']) for r in parallel.train_report} == {
+        (0.20, 'SVM'), (0.20, 'MLP'), (0.30, 'SVM'), (0.30, 'MLP')}
+
+    X = dataset.load_dataset().drop('Dataset', axis=1)
+    for size in (0.20, 0.30):
+        X_s = seq_models[size]['SCALER'].transform(X)
+        np.testing.assert_allclose(X_s, par_models[size]['SCALER'].transform(X))
+        for name in ('SVM', 'MLP'):
+            np.testing.assert_allclose(seq_models[size][name].predict_proba(X_s),
+                                       par_models[size][name].predict_proba(X_s))
+
+def test_predict_batch(mock_data):
+    """Testeaza scorarea vectorizata: etichete coerente cu probabilitatile si respingerea randurilor invalide."""
+
+    df = mock_data.assign(Gender=mock_data['Gender'].map({'Female': 0, 'Male': 1}),
+                          Dataset=mock_data['Dataset'].map({1: 1, 2: 0}))
+    X = df.drop('Dataset', axis=1); Y = df['Dataset']
+    handler = MLHandler([0.20])
+    _, _, mlp, sc, _ = fit_model(X, Y, 0.20, 'MLP', 42)
+    handler.models_data.register(0.20, MLHandler.artifact_paths(0.20), {'MLP': mlp, 'SCALER': sc})
+
+    labels, probs = handler.predict_batch(mock_data, 0.20, 'MLP')
+    assert labels.shape == probs.shape == (10,)
+    np.testing.assert_allclose(probs, mlp.predict_proba(sc.transform(X))[:, 1])
+    assert (labels == (probs > 0.5)).all()
+
+    single_label, single_prob = handler.predict_batch(X.iloc[0].tolist(), 0.20, 'MLP')
+    assert single_label[0] == labels[0] and single_prob[0] == pytest.approx(probs[0])
+
+    bad = X.to_numpy().copy(); bad[3, 3] = bad[3, 2] + 1
+    with pytest.raises(ValueError, match="rand 3"):
+        handler.predict_batch(bad, 0.20, 'MLP')
@@ -0,0 +1,66 @@
+import sys
+import os
+import numpy as np
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prediction_cache import PredictionCache, canonical_rows
+
+def test_canonical_rows_normalize_noise_and_sign():
+    """Valorile egale dupa rotunjire (inclusiv -0.0) produc aceeasi cheie."""
+
+    R, keys = canonical_rows(np.array([[1.0, -0.0], [1.0 + 1e-12, 0.0], [1.1, 0.0]]))
+    assert keys[0] == keys[1] != keys[2]
+    assert R.flags['C_CONTIGUOUS']
+
+def test_lru_eviction_and_stats():
+    """Cache-ul ramane marginit; intrarea folosita recent supravietuieste evacuarii."""
+
+    cache = PredictionCache(max_entries=2)
+    cache.store(0.2, 'SVM', 'v1', [b'a', b'b'], [1, 0], [0.9, 0.1])
+    assert cache.lookup(0.2, 'SVM', 'v1', [b'a']) == [(1, 0.9)]
+    cache.store(0.2, 'SVM', 'v1', [b'c'], [1], [0.7])
+    assert cache.lookup(0.2, 'SVM', 'v1', [b'a', b'b', b'c']) == [(1, 0.9), None, (1, 0.7)]
+    # Aceeasi cheie sub alta versiune sau alt algoritm nu este un hit
+    assert cache.lookup(0.2, 'SVM', 'v2', [b'a']) == [None]
+    assert cache.lookup(0.2, 'MLP', 'v1', [b'a']) == [None]
+
+    stats = cache.stats()
+    assert stats['entries'] == 2 and stats['evictions'] == 1
+    assert stats['hits'] == 3 and stats['misses'] == 3 and stats['hit_rate'] == 0.5
+
+    cache.invalidate(0.2)
+    assert cache.stats()['entries'] == 0
+
+def test_duplicates_computed_once(handler):
+    """Duplicatele din lot si randurile deja vazute nu mai ajung la model; rezultatele raman identice."""
+
+    h, X = handler
+    batch = np.vstack([X[:5], X[:5], X[:5]])
+    # Modelul vede randurile canonice, deci rezultatul trebuie sa fie exact cel al randurilor rotunjite
+    expected = h.engine(0.25).predict(canonical_rows(batch)[0], 'MLP')[1]
+
+    with patch.object(h.engine(0.25), 'predict', wraps=h.engine(0.25).predict) as spy:
+        labels, proba, tag = h.predict_versioned(batch, 0.25, 'MLP')
+        assert spy.call_count == 1 and len(spy.call_args[0][0]) == 5
+        h.predict_versioned(X[:5], 0.25, 'MLP')
+        assert spy.call_count == 1
+
+    assert tag == 'MLP-25-v2'
+    np.testing.assert_allclose(proba, expected, atol=1e-12)
+    assert h.predictions.stats()['hits'] == 5
+
+def test_swap_invalidates_cached_results(handler):
+    """Dupa activarea altei versiuni rezultatele vin de la noul model, nu din cache."""
+
+    h, X = handler
+    _, p_v2, _ = h.predict_versioned(X, 0.25, 'SVM')
+    assert h.predictions.stats()['entries'] == len(np.unique(X, axis=0))
+
+    h.activate(0.25, 'v1')
+    assert h.predictions.stats()['entries'] == 0
+    _, p_v1, tag = h.predict_versioned(X, 0.25, 'SVM')
+    assert tag == 'SVM-25-v1'
+    assert not np.allclose(p_v1, p_v2)
+    np.testing.assert_allclose(p_v1, h.engine(0.25).predict(canonical_rows(X)[0], 'SVM')[1], atol=1e-12)
@@ -0,0 +1,53 @@
+import sys
+import os
+from unittest.mock import patch
+
+# Adaugam calea catre folderul parinte pentru a putea importa modulele
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lazy import LazyModule, lazy_import
+from profiling import parse_importtime, import_time_report, format_report, profiling_config
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      5000 |      52000 | ml_logic
+import time:      1500 |       9000 |   dataset
+"""
+
+def test_parse_importtime():
+    """
+    Verifica interpretarea liniilor -X importtime (antetul este ignorat)
+    """
+    rows = parse_importtime(SAMPLE)
+    assert [r['module'] for r in rows] == ['_io', 'ml_logic', 'dataset']
+    assert rows[1] == {'module': 'ml_logic', 'self_us': 5000, 'cumulative_us': 52000, 'depth': 0}
+    assert rows[2]['depth'] == 1
+    assert "ml_logic" in format_report(rows, ['pandas'])
+
+def test_lazy_module_defers_import():
+    """
+    Modulul real se incarca abia la primul acces; "a.b" leaga pachetul de nivel superior
+    """
+    mod = LazyModule('json.decoder')
+    assert 'neincarcat' in repr(mod)
+    assert mod.decoder.JSONDecodeError is sys.modules['json.decoder'].JSONDecodeError
+    assert lazy_import('json') is sys.modules['json']
+
+def test_lazy_module_supports_patch():
+    """
+    Testele existente fac patch prin atributele modulelor lazy (ex. dataset.pd.read_csv)
+    """
+    mod = LazyModule('json')
+    with patch.object(mod, 'dumps', return_value="x"):
+        assert mod.dumps({}) == "x"
+    assert mod.dumps({}) == "{}"
+
+def test_cold_import_budget():
+    """
+    Importul la rece al modulelor aplicatiei nu incarca sklearn/pandas/mysql si ramane in buget
+    """
+    modules = ['database', 'ml_logic', 'evaluation', 'utils', 'dataset', 'workers']
+    rows, heavy = import_time_report(modules)
+    assert heavy == []
+    total_ms = sum(r['cumulative_us'] for r in rows if r['module'] in modules and r['depth'] == 0) / 1000
+    assert total_ms < profiling_config['import_budget_ms'], f"Import la rece: {total_ms:.0f} ms"
@@ -5,7 +5,7 @@ import os
 # Adaugam calea catre folderul parinte pentru a putea importa modulele
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from proj_v1.utils import validate_patient_data
+from proj_v1.utils import validate_patient_data, validate_patient_batch
 
 class TestMedicalQA(unittest.TestCase):
     """
@@ -37,6 +37,21 @@ class TestMedicalQA(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertIn("Bilirubina Directă nu poate fi mai mare", msg)
 
+    def test_batch_matches_single(self):
+        """TC05: Validarea in lot respinge aceleasi randuri cu aceleasi mesaje"""
+        rows = [[30, 1, 0.9, 0.2, 200, 20, 25, 6.8, 3.3, 0.9],
+                [-5, 1, 0.9, 0.2, 200, 20, 25, 6.8, 3.3, 0.9],
+                [30, 0, float("nan"), 0.2, 200, 20, 25, 6.8, 3.3, 0.9],
+                [30, 1, 2.0, 5.0, 200, 20, 25, 6.8, 3.3, 0.9],
+                [30, 1, 0.9, 0.2, -200, 20, 25, 6.8, 3.3, 0.9]]
+        valid, errors = validate_patient_batch(rows)
+        self.assertEqual(valid.tolist(), [True, False, False, False, False])
+        self.assertEqual([r for r, _ in errors], [1, 2, 3, 4])
+        for row, msg in errors:
+            is_valid, single_msg = validate_patient_data(*["zece" if v != v else v for v in rows[row]])
+            self.assertFalse(is_valid)
+            self.assertEqual(msg, single_msg)
+
 if __name__ == '__main__':
     print("Rulare teste QA automate...")
     unittest.main()
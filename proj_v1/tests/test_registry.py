@@ -0,0 +1,104 @@
+import sys
+import os
+import pytest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import registry
+from registry import ModelRegistry, RegistryError
+from ml_logic import MLHandler
+
+def test_versions_are_recorded(handler):
+    """Fiecare salvare devine o versiune noua, cu amprente si detalii; fisierele din models/ sunt cea curenta."""
+
+    h, _ = handler
+    entries = h.registry.entries(0.25)
+    assert [e['version'] for e in entries] == ['v1', 'v2']
+    assert entries[1]['seed'] == 2 and entries[1]['source'] == 'test'
+    assert set(entries[1]['artifacts']) == {'SVM', 'MLP', 'SC'} and 'hyperparams' in entries[1]
+    assert h.models_data.version(0.25) == 'v2'
+    assert h.model_version(0.25, 'SVM') == 'SVM-25-v2'
+    assert h.registry.matches(0.25, MLHandler.artifact_paths(0.25))
+
+    # Un registru nou citit de pe disc vede aceeasi stare
+    assert ModelRegistry().current(0.25)['version'] == 'v2'
+    assert not any(name.endswith(".tmp") for name in os.listdir("models"))
+
+def test_hot_swap_to_archived_version(handler):
+    """Revenirea la v1 inlocuieste modelele servite; predictiile concurente raman consistente cu versiunea raportata."""
+
+    h, X = handler
+    _, p_v2, tag = h.predict_versioned(X, 0.25, 'MLP')
+    assert tag == 'MLP-25-v2'
+
+    entry = h.activate(0.25, 'v1')
+    assert entry['version'] == 'v1'
+    _, p_v1, tag = h.predict_versioned(X, 0.25, 'MLP')
+    assert tag == 'MLP-25-v1'
+    assert not np.allclose(p_v1, p_v2)
+
+    # In timpul comutarilor, fiecare rezultat corespunde exact versiunii raportate
+    expected = {'MLP-25-v1': p_v1, 'MLP-25-v2': p_v2}
+    with ThreadPoolExecutor(4) as pool:
+        swaps = pool.submit(lambda: [h.activate(0.25, v) for v in ('v2', 'v1', 'v2', 'v1')])
+        results = [pool.submit(h.predict_versioned, X, 0.25, 'MLP') for _ in range(20)]
+        swaps.result()
+    for job in results:
+        _, p, tag = job.result()
+        np.testing.assert_allclose(p, expected[tag])
+
+    with pytest.raises(RegistryError):
+        h.activate(0.25, 'v9')
+
+def test_foreign_files_are_adopted(handler):
+    """Fisierele modificate in afara aplicatiei sunt inregistrate ca versiune noua la pornire."""
+
+    h, _ = handler
+    h.activate(0.25, 'v1')
+    fresh = MLHandler([0.25])
+    fresh.initialize_ml_logic()
+    assert fresh.models_data.version(0.25) == 'v1'
+
+    with open(MLHandler.artifact_paths(0.25)['SC'], 'ab') as f: f.write(b"\0")
+    fresh = MLHandler([0.25])
+    fresh.initialize_ml_logic()
+    assert fresh.models_data.version(0.25) == 'v3'
+    assert fresh.registry.current(0.25)['source'] == 'import'
+
+def test_save_split_swaps_files_under_model_lock(handler, monkeypatch):
+    """Fisierele noi si versiunea lor sunt publicate sub lacatul modelelor, ca in activate()."""
+
+    h, _ = handler
+    held, original = [], h.registry.record
+
+    def record(*args, **kwargs):
+        with ThreadPoolExecutor(1) as pool: held.append(not pool.submit(h.models_data.lock.acquire, False).result())
+        return original(*args, **kwargs)
+    monkeypatch.setattr(h.registry, 'record', record)
+    models = h.models_data[0.25]
+    h.save_split(0.25, {'SVM': models['SVM'], 'MLP': models['MLP'], 'SCALER': models['SCALER']}, source='test')
+    assert held == [True] and h.models_data.version(0.25) == 'v3'
+
+def test_rollback_to_pruned_version_is_refused(handler, monkeypatch):
+    """Revenirea la o versiune a carei arhiva a fost stearsa este refuzata clar; modelele servite raman neschimbate."""
+
+    h, X = handler
+    monkeypatch.setitem(registry.registry_config, 'keep', 2)
+    models = h.models_data[0.25]
+    h.save_split(0.25, {'SVM': models['SVM'], 'MLP': models['MLP'], 'SCALER': models['SCALER']}, source='test')
+    assert h.registry._find(0.25, 'v1')['archive'] is None
+
+    with pytest.raises(RegistryError):
+        h.activate(0.25, 'v1')
+    assert h.models_data.version(0.25) == 'v3'
+    assert h.predict_versioned(X, 0.25, 'SVM')[2] == 'SVM-25-v3'
+
+def test_export_bundle_keeps_the_served_version(handler):
+    """Reexportul pachetului nu pierde eticheta versiunii (predictiile raman etichetate si cache-uite)."""
+
+    h, X = handler
+    h.export_bundle(0.25)
+    assert h.models_data.version(0.25) == 'v2'
+    assert h.predict_versioned(X, 0.25, 'MLP')[2] == 'MLP-25-v2'
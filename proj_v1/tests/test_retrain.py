@@ -0,0 +1,144 @@
+import sys
+import os
+import copy
+import pytest
+import numpy as np
+import pandas as pd
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import retrain
+from retrain import Retrainer, rescale_mlp, load_state, fetch_confirmed
+from ml_logic import MLHandler, fit_model
+
+COLUMNS = ['Age', 'Gender', 'TB', 'DB', 'Alk', 'Sgpt', 'Sgot', 'TP', 'ALB', 'AG']
+
+def patients(n, seed):
+    """Pacienti valizi clinic, cu eticheta dependenta de bilirubina."""
+
+    rng = np.random.default_rng(seed)
+    X = np.column_stack([rng.integers(20, 80, n), rng.integers(0, 2, n), rng.uniform(0.5, 5, n), np.zeros(n),
+                         rng.uniform(100, 400, n), rng.uniform(10, 80, n), rng.uniform(10, 80, n),
+                         rng.uniform(5, 8, n), rng.uniform(2, 4, n), rng.uniform(0.5, 1.5, n)]).astype(float)
+    X[:, 3] = X[:, 2] * 0.3
+    return X, (X[:, 2] > 2).astype(int)
+
+class FakeDB:
+    """Tabelul PREDICTIONS redus la randurile confirmate: (id, 10 valori, diagnostic)."""
+
+    def __init__(self):
+        self.rows = []
+        self.calls = 0
+
+    def add(self, X, y):
+        start = len(self.rows)
+        self.rows += [(start + i + 1, *X[i], int(y[i])) for i in range(len(y))]
+
+    def fetch_confirmed(self, after_id, limit, until_id=None):
+        self.calls += 1
+        rows = [r for r in self.rows if r[0] > after_id and (until_id is None or r[0] <= until_id)]
+        return rows[:limit]
+
+@pytest.fixture
+def setup(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "models").mkdir()
+    X, y = patients(120, 0)
+    df = pd.DataFrame(X, columns=COLUMNS).assign(Dataset=y)
+    handler = MLHandler([0.25])
+    _, _, svm, sc, _ = fit_model(df[COLUMNS], df['Dataset'], 0.25, 'SVM', 42)
+    _, _, mlp, _, _ = fit_model(df[COLUMNS], df['Dataset'], 0.25, 'MLP', 42)
+    handler.save_split(0.25, {'SVM': svm, 'MLP': mlp, 'SCALER': sc})
+    monkeypatch.setattr(handler, 'refresh_evaluation', lambda: None)
+    return handler, df, FakeDB(), str(tmp_path / "state.json")
+
+def test_rescale_mlp_is_exact(setup):
+    """Reexprimarea primului strat pentru un alt scaler nu schimba probabilitatile."""
+
+    handler, df, _, _ = setup
+    sc, mlp = handler.models_data[0.25]['SCALER'], copy.deepcopy(handler.models_data[0.25]['MLP'])
+    X = df[COLUMNS].to_numpy()
+    before = mlp.predict_proba(sc.transform(X))
+    new = copy.deepcopy(sc); new.partial_fit(X[:30] * 1.5)
+    rescale_mlp(mlp, sc, new)
+    np.testing.assert_allclose(mlp.predict_proba(new.transform(X)), before, atol=1e-10)
+
+def test_incremental_update_below_threshold(setup):
+    """Randurile noi actualizeaza MLP-ul si watermark-ul; SVM-ul si scalerul servit raman neschimbate."""
+
+    handler, _, db, state_path = setup
+    svm_before = handler.models_data[0.25]['SVM']
+    mlp_before = handler.models_data[0.25]['MLP'].coefs_[0].copy()
+    db.add(*patients(30, 1))
+
+    with patch.dict(retrain.retrain_config, {'batch_rows': 8, 'drift_threshold': 10.0, 'svm_fraction': 1.0}):
+        summary = Retrainer(handler, db, state_path).run(progress=lambda msg: None)
+
+    assert summary['rows'] == 30 and summary['watermark'] == 30
+    assert db.calls == 4
+    assert not summary['splits'][0.25]['svm_refit']
+    assert handler.models_data[0.25]['SVM'] is svm_before
+    assert not np.allclose(handler.models_data[0.25]['MLP'].coefs_[0], mlp_before)
+    state = load_state(state_path)
+    assert state['watermark'] == 30 and state['splits']['0.25']['scaler']['n'] == 90 + 30
+
+    # O noua rulare fara randuri noi nu face nimic
+    assert Retrainer(handler, db, state_path).run(progress=lambda msg: None)['rows'] == 0
+
+def test_svm_refit_over_threshold(setup):
+    """Peste pragul de randuri, SVM-ul este reantrenat pe setul initial plus randurile confirmate."""
+
+    handler, df, db, state_path = setup
+    db.add(*patients(40, 2))
+    with patch.dict(retrain.retrain_config, {'svm_min_rows': 25}), \
+         patch('retrain.load_dataset', return_value=df):
+        summary = Retrainer(handler, db, state_path).run(progress=lambda msg: None)
+
+    assert summary['splits'][0.25]['svm_refit']
+    assert handler.models_data[0.25]['SVM'].shape_fit_[0] == 90 + 40
+    assert handler.models_data[0.25]['SCALER'].n_samples_seen_ == 90 + 40
+    assert load_state(state_path)['splits']['0.25']['pending_rows'] == 0
+
+def test_only_invalid_rows_advance_watermark(setup):
+    """Daca toate randurile noi sunt invalide, modelele raman neschimbate dar watermark-ul avanseaza."""
+
+    handler, _, db, state_path = setup
+    mlp_before = handler.models_data[0.25]['MLP']
+    X, y = patients(3, 3)
+    X[:, 3] = X[:, 2] + 1
+    db.add(X, y)
+
+    summary = Retrainer(handler, db, state_path).run(progress=lambda msg: None)
+    assert summary['rows'] == 0 and summary['splits'] == {}
+    assert handler.models_data[0.25]['MLP'] is mlp_before
+    assert load_state(state_path)['watermark'] == 3
+    assert Retrainer(handler, db, state_path).run(progress=lambda msg: None)['watermark'] == 3
+
+def test_failed_split_does_not_replay_rows_on_published_ones(setup, monkeypatch):
+    """Daca un split esueaza, cele deja publicate isi pastreaza watermark-ul si nu primesc randurile a doua oara."""
+
+    handler, _, db, state_path = setup
+    models = handler.models_data[0.25]
+    handler.save_split(0.5, {'SVM': models['SVM'], 'MLP': models['MLP'], 'SCALER': models['SCALER']})
+    db.add(*patients(30, 4))
+    save_split, calls = handler.save_split, []
+
+    def failing(size, *args, **kwargs):
+        calls.append(size)
+        if size == 0.5 and calls.count(0.5) == 1: raise OSError("disc plin")
+        return save_split(size, *args, **kwargs)
+    monkeypatch.setattr(handler, 'save_split', failing)
+
+    with patch.dict(retrain.retrain_config, {'drift_threshold': 10.0, 'svm_fraction': 1.0}):
+        with pytest.raises(OSError):
+            Retrainer(handler, db, state_path).run(progress=lambda msg: None)
+        state = load_state(state_path)
+        assert state['watermark'] == 0 and state['splits']['0.25']['watermark'] == 30
+        mlp_25 = handler.models_data[0.25]['MLP']
+
+        summary = Retrainer(handler, db, state_path).run(progress=lambda msg: None)
+    assert list(summary['splits']) == [0.5] and calls == [0.25, 0.5, 0.5]
+    assert handler.models_data[0.25]['MLP'] is mlp_25
+    state = load_state(state_path)
+    assert state['watermark'] == 30 and state['splits']['0.25']['scaler']['n'] == 90 + 30
@@ -0,0 +1,64 @@
+import sys
+import os
+import json
+import numpy as np
+import pandas as pd
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import search
+from search import candidates, trial_key, run_search, ResultsStore, best_params, export_best
+from ml_logic import build_model, load_hyperparams
+
+SPACE = {'SVM': {'C': [0.1, 1.0], 'gamma': ['scale']},
+         'MLP': {'hidden_layer_sizes': [[8]], 'alpha': [0.001], 'max_iter': [200]}}
+
+def make_df(n=60, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.normal(size=(n, 10)), columns=['Age', 'Gender', 'TB', 'DB', 'Alk', 'Sgpt', 'Sgot', 'TP', 'ALB', 'AG'])
+    df['Dataset'] = (df['TB'] + df['Alk'] > 0).astype(int)
+    return df
+
+def test_candidates_grid_and_random():
+    """Testeaza generarea combinatiilor si esantionarea reproductibila."""
+
+    assert len(candidates('SVM')) == 16
+    sample = candidates('MLP', 'random', n_iter=5, seed=1)
+    assert len(sample) == 5 and sample == candidates('MLP', 'random', n_iter=5, seed=1)
+    assert trial_key('SVM', 0.2, {'C': 1.0}, 5, 42, "x") != trial_key('SVM', 0.3, {'C': 1.0}, 5, 42, "x")
+
+def test_search_resumes_from_store(tmp_path):
+    """Testeaza ca o cautare repetata reia probele terminate in loc sa le recalculeze."""
+
+    store_path = str(tmp_path / "results.jsonl")
+    with patch.dict(search.SEARCH_SPACE, SPACE):
+        rows = run_search(make_df(), [0.20, 0.30], store=ResultsStore(store_path), workers=1, folds=3,
+                          data_sha="abc", progress=lambda msg: None)
+        assert len(rows) == 6
+
+        # Un rand trunchiat la final (proces oprit in timpul scrierii) nu strica reluarea
+        with open(store_path, 'a', encoding='utf-8') as f: f.write('{"key": "partial"')
+        with patch('search.run_trial') as trial:
+            again = run_search(make_df(), [0.20, 0.30], store=ResultsStore(store_path), workers=1, folds=3,
+                               data_sha="abc", progress=lambda msg: None)
+        assert not trial.called
+        assert [r['key'] for r in again] == [r['key'] for r in rows]
+
+def test_export_feeds_build_model(tmp_path):
+    """Testeaza alegerea celei mai bune configuratii si folosirea ei de build_model."""
+
+    rows = [{'algo': 'SVM', 'size': s, 'params': {'C': c, 'gamma': 'scale'}, 'accuracy': acc}
+            for s, c, acc in ((0.2, 1.0, 0.70), (0.3, 1.0, 0.72), (0.2, 10.0, 0.75), (0.3, 10.0, 0.74))]
+    assert best_params(rows)['SVM']['params'] == {'C': 10.0, 'gamma': 'scale'}
+
+    path = str(tmp_path / "hyperparams.json")
+    export_best(rows, path)
+    with open(path, encoding='utf-8') as f: assert json.load(f)['SVM']['splits'] == 2
+    params = load_hyperparams(path)
+    assert params['SVM']['C'] == 10.0
+    assert params['MLP']['hidden_layer_sizes'] == [50, 25]
+
+    with patch.dict('ml_logic.ml_config', {'hyperparams': path}):
+        assert build_model('SVM', 42).C == 10.0
+        assert build_model('MLP', 42).hidden_layer_sizes == (50, 25)
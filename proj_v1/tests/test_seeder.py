@@ -0,0 +1,65 @@
+import sys
+import os
+import pandas as pd
+from unittest.mock import MagicMock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dataset import COLUMNS, LONG_NAMES
+from seeder import seed_frame
+
+class FakeCursor:
+    """Cursor minimal care simuleaza tabelele PATIENTS si PREDICTIONS si numara apelurile."""
+    def __init__(self):
+        self.patients = {}
+        self.predictions = set()
+        self.calls = 0
+        self._result = []
+
+    def execute(self, sql, params=()):
+        self.calls += 1
+        if sql.startswith("SELECT id FROM USERS"):
+            self._result = [(1,)]
+        elif "FROM PATIENTS WHERE cnp_internal_id IN" in sql:
+            self._result = [(c, self.patients[c]) for c in params if c in self.patients]
+        elif "FROM PREDICTIONS WHERE user_id" in sql:
+            self._result = [(p,) for p in params[1:] if (p, params[0]) in self.predictions]
+
+    def executemany(self, sql, rows):
+        self.calls += 1
+        for row in rows:
+            if "INTO PATIENTS" in sql: self.patients.setdefault(row[0], len(self.patients) + 1)
+            elif "INTO PREDICTIONS" in sql: self.predictions.add((row[0], row[1]))
+
+    def fetchall(self): return self._result
+
+    def fetchone(self): return self._result[0]
+
+    def close(self): pass
+
+def make_frame(n):
+    row = [50, 1, 0.9, 0.2, 150, 20, 25, 6.8, 3.3, 0.9, 1]
+    return pd.DataFrame([row] * n, columns=COLUMNS, index=range(100, 100 + n)).rename(columns=LONG_NAMES)
+
+def test_bulk_seeding_uses_constant_round_trips_per_chunk():
+    """Fiecare lot costa 4 interogari, indiferent de numarul de pacienti din el."""
+    cursor = FakeCursor()
+    conn = MagicMock(); conn.cursor.return_value = cursor
+    progress = []
+
+    inserted = seed_frame(conn, make_frame(25), batch_size=10, progress=progress.append)
+
+    assert inserted == 25
+    assert len(cursor.patients) == 25 and "UCI0000000100" in cursor.patients
+    # 2 interogari pentru utilizatori + 3 loturi x 4 interogari
+    assert cursor.calls == 2 + 3 * 4
+    assert conn.commit.call_count == 1 + 3
+    assert progress[-1].startswith("25/25")
+
+def test_bulk_seeding_is_idempotent():
+    """O a doua rulare nu dubleaza pacientii sau predictiile."""
+    cursor = FakeCursor()
+    conn = MagicMock(); conn.cursor.return_value = cursor
+    seed_frame(conn, make_frame(12), batch_size=5, progress=lambda msg: None)
+    assert seed_frame(conn, make_frame(12), batch_size=5, progress=lambda msg: None) == 0
+    assert len(cursor.patients) == 12 and len(cursor.predictions) == 12
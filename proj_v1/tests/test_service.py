@@ -0,0 +1,135 @@
+import sys
+import os
+import json
+import threading
+import urllib.request
+import urllib.error
+import numpy as np
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import service as service_module
+from service import MicroBatcher, PredictionService, create_server
+
+ROW = [50, 1, 0.9, 0.2, 150, 20, 25, 6.8, 3.3, 0.9]
+
+def fake_predict(X, split, algo):
+    """Eticheta 1 pentru varsta peste 40, probabilitatea este varsta / 100."""
+    return (X[:, 0] > 40).astype(int), X[:, 0] / 100.0
+
+def test_micro_batcher_coalesces_concurrent_requests():
+    """Cererile concurente sosite in aceeasi fereastra sunt rulate intr-un singur lot."""
+    calls = []
+    def predict(X, split, algo):
+        calls.append(len(X))
+        return fake_predict(X, split, algo)
+
+    batcher = MicroBatcher(predict, window_ms=200, max_batch=8)
+    rows = [[age] + ROW[1:] for age in range(30, 38)]
+    futures = [batcher.submit(np.array(r, dtype=float), 0.20, 'SVM') for r in rows]
+    results = [f.result(timeout=5) for f in futures]
+    batcher.close()
+
+    assert calls == [8]
+    assert results == [(int(r[0] > 40), r[0] / 100.0) for r in rows]
+
+def test_micro_batcher_propagates_errors():
+    """O eroare a modelului este transmisa tuturor cererilor din lot."""
+    batcher = MicroBatcher(MagicMock(side_effect=RuntimeError("model")), window_ms=1)
+    with pytest.raises(RuntimeError):
+        batcher.submit(np.array(ROW, dtype=float), 0.20, 'MLP').result(timeout=5)
+    batcher.close()
+
+@pytest.fixture
+def server():
+    handler = MagicMock()
+    handler.models_data = {0.20: {}, 0.30: {}}
+    handler.predict_batch.side_effect = fake_predict
+    handler.predict_versioned.side_effect = lambda X, split, algo: (*fake_predict(X, split, algo), f"{algo}-{int(split * 100)}-v1")
+    handler.predictions.stats.return_value = {'entries': 0, 'hits': 0, 'misses': 0, 'hit_rate': 0.0}
+    service = PredictionService(handler, window_ms=2, max_batch=16)
+    srv = create_server(service, '127.0.0.1', 0)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown(); srv.server_close(); service.batcher.close()
+
+def call(url, payload=None, headers=None):
+    data = None if payload is None else json.dumps(payload).encode()
+    req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json', **(headers or {})})
+    try:
+        with urllib.request.urlopen(req, timeout=5) as resp: return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+def test_http_endpoints(server):
+    """Endpoint-urile predict, predict_batch, health si metrics raspund in JSON."""
+    assert call(server + "/health") == (200, {'status': 'ok', 'splits': [0.20, 0.30]})
+
+    with ThreadPoolExecutor(8) as pool:
+        replies = list(pool.map(lambda _: call(server + "/predict", {'features': ROW, 'split': 0.2, 'algo': 'SVM'}), range(8)))
+    assert all(r == (200, {'label': 1, 'probability': 0.5, 'split': 0.2, 'algo': 'SVM'}) for r in replies)
+
+    status, body = call(server + "/predict_batch", {'rows': [ROW, [30] + ROW[1:]], 'split': 0.3, 'algo': 'MLP'})
+    assert status == 200 and body['labels'] == [1, 0]
+    assert body['model_version'] == "MLP-30-v1"
+
+    status, body = call(server + "/metrics")
+    assert body['latency']['/predict']['count'] == 8
+    assert body['latency']['/predict']['p99_ms'] >= body['latency']['/predict']['p50_ms']
+    assert body['prediction_cache']['hit_rate'] == 0.0
+
+def test_http_rejects_invalid_requests(server):
+    """Datele clinice invalide si modelele necunoscute primesc 400."""
+    bad = list(ROW); bad[3] = 5.0
+    status, body = call(server + "/predict", {'features': bad})
+    assert status == 400 and "Bilirubina Directă" in body['error']
+    assert call(server + "/predict", {'features': ROW, 'split': 0.9})[0] == 400
+    assert call(server + "/nimic")[0] == 404
+
+def test_http_requires_session_token_when_auth_enabled():
+    """Cu autentificarea activa, bcrypt ruleaza doar la /login; predictiile verifica doar token-ul."""
+    from auth import AuthService, hash_password
+    db = MagicMock()
+    db.find_user.return_value = (3, hash_password('parola', rounds=4), 'MEDIC')
+    handler = MagicMock()
+    handler.models_data = {0.20: {}}
+    handler.predict_batch.side_effect = fake_predict
+    service = PredictionService(handler, window_ms=2, auth=AuthService(db, rounds=4))
+    srv = create_server(service, '127.0.0.1', 0)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{srv.server_address[1]}"
+    try:
+        assert call(url + "/predict", {'features': ROW})[0] == 401
+        assert call(url + "/login", {'username': 'medic', 'password': 'gresit'})[0] == 401
+        status, body = call(url + "/login", {'username': 'medic', 'password': 'parola'})
+        assert status == 200 and body['role'] == 'MEDIC'
+
+        headers = {'Authorization': f"Bearer {body['token']}"}
+        for _ in range(3):
+            assert call(url + "/predict", {'features': ROW}, headers) == (200, {'label': 1, 'probability': 0.5, 'split': 0.2, 'algo': 'SVM'})
+        assert db.find_user.call_count == 2
+        assert call(url + "/predict", {'features': ROW}, {'Authorization': "Bearer x.y.z"})[0] == 401
+        assert call(url + "/health")[0] == 200
+    finally:
+        srv.shutdown(); srv.server_close(); service.batcher.close()
+
+def test_http_stuck_batcher_returns_503(monkeypatch):
+    """Daca lotul nu raspunde la timp, cererea primeste 503 in loc sa blocheze firul HTTP."""
+    monkeypatch.setitem(service_module.service_config, 'timeout_s', 0.1)
+    release = threading.Event()
+    handler = MagicMock()
+    handler.models_data = {0.20: {}}
+    handler.predict_batch.side_effect = lambda X, split, algo: release.wait() and fake_predict(X, split, algo)
+    service = PredictionService(handler, window_ms=1)
+    srv = create_server(service, '127.0.0.1', 0)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    try:
+        status, body = call(f"http://127.0.0.1:{srv.server_address[1]}/predict", {'features': ROW})
+        assert status == 503 and "la timp" in body['error']
+    finally:
+        release.set()
+        srv.shutdown(); srv.server_close(); service.batcher.close()
+    assert service.batcher.sizes() == [1]
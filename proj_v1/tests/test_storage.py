@@ -0,0 +1,134 @@
+import sys
+import os
+import uuid
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+from database import Database, db_config, open_database
+from sqlite_db import SqliteDatabase, translate
+
+CLIN = [50, 1, 0.9, 0.2, 150, 20, 25, 6.8, 3.3, 0.9]
+
+@pytest.fixture(params=['sqlite', 'mariadb'])
+def db(request, tmp_path):
+    """Aceeasi suita ruleaza pe ambele implementari; MariaDB doar cu ILPD_TEST_MARIADB=1 si serverul pornit."""
+
+    if request.param == 'sqlite':
+        store = SqliteDatabase(str(tmp_path / "test.db"), pool_size=4)
+    else:
+        if os.environ.get("ILPD_TEST_MARIADB") != "1": pytest.skip("MariaDB dezactivat (ILPD_TEST_MARIADB=1 il activeaza)")
+        store = Database(db_config, pool_size=4)
+        try: store.estimate_history_count()
+        except Exception as e: pytest.skip(f"MariaDB indisponibil: {e}")
+    yield store
+    store.close()
+
+@pytest.fixture
+def names():
+    """Nume unice, ca testele sa poata rula si pe o baza MariaDB deja populata."""
+
+    tag = uuid.uuid4().hex[:8]
+    return lambda kind, i=0: f"T{tag}{kind}{i}"
+
+def patient(names, i=0):
+    return (names('P', i)[:20], f"Pacient {i}", 'M', '1970-01-01')
+
+def entry(names, uid, i=0, result=1, confidence=0.7, version=None):
+    """O intrare din jurnalul de predictii, forma in care predictiile ajung in baza de date."""
+
+    return {'journal_id': uuid.uuid4().hex, 'patient': patient(names, i), 'user_id': uid, 'result': result,
+            'confidence': confidence, 'clin': CLIN, 'model_version': version}
+
+def save(db, entries):
+    """Scrie lotul si returneaza id-urile predictiilor noi, crescator."""
+
+    newest = db.fetch_history_page(1)
+    db.save_journal_batch(entries)
+    return sorted(row[0] for row in db.fetch_history_page(len(entries), after_id=newest[0][0] if newest else 0))
+
+def test_users(db, names):
+    """Utilizatorul creat este gasit cu hash-ul si rolul sau; numele duplicat este respins."""
+
+    uid = db.create_user(names('u'), '$2b$12$hash', 'ADMIN')
+    assert db.find_user(names('u')) == (uid, '$2b$12$hash', 'ADMIN')
+    assert db.find_user(names('absent')) is None
+    db.update_password_hash(uid, '$2b$13$nou')
+    assert db.find_user(names('u'))[1] == '$2b$13$nou'
+    with pytest.raises(Exception):
+        db.create_user(names('u'), 'x', 'MEDIC')
+
+def test_predictions_reuse_patient_and_page_history(db, names):
+    """Pacientul este inserat o singura data; istoricul este paginat descrescator dupa id."""
+
+    uid = db.create_user(names('u'), 'x')
+    ids = [save(db, [entry(names, uid, i % 3, i % 2, 0.5 + i / 100, f"SVM-20-v{i}")])[0] for i in range(12)]
+    assert ids == sorted(ids)
+
+    first = db.fetch_history_page(5)
+    assert [row[0] for row in first] == ids[::-1][:5]
+    assert first[0][1:4] == ("Pacient 2", patient(names, 2)[0], 1)
+    assert first[0][4] == pytest.approx(0.61, abs=1e-6)
+    assert [row[0] for row in db.fetch_history_page(5, before_id=ids[7])] == ids[2:7][::-1]
+    assert [row[0] for row in db.fetch_history_page(3, after_id=ids[4])] == ids[5:8][::-1]
+    assert db.estimate_history_count() >= 0
+
+def test_batched_insert_and_confirmation(db, names):
+    """Inserarea in lot produce randuri normale; doar cele confirmate ajung la re-antrenare."""
+
+    uid = db.create_user(names('u'), 'x')
+    assert db.save_journal_batch([entry(names, uid, 0, 1, 0.9, 'SVM-20-v1'), entry(names, uid, 0, 0, 0.2, 'MLP-20-v1')]) == 2
+    newest = db.fetch_history_page(2)
+    assert [row[3] for row in newest] == [0, 1]
+
+    before = newest[-1][0] - 1
+    db.confirm_prediction(newest[0][0], 1)
+    rows = db.fetch_confirmed(before, 10)
+    assert [(row[0], row[-1]) for row in rows] == [(newest[0][0], 1)]
+    assert list(rows[0][1:11]) == pytest.approx(CLIN)
+    assert db.fetch_confirmed(before, 10, until_id=newest[-1][0]) == []
+
+def test_failed_save_leaves_nothing_behind(db, names):
+    """Un utilizator inexistent respinge predictia si anuleaza si inserarea pacientului (aceeasi tranzactie)."""
+
+    with pytest.raises(Exception):
+        db.save_journal_batch([entry(names, 10 ** 9)])
+    uid = db.create_user(names('u'), 'x')
+    pid = save(db, [entry(names, uid)])[0]
+    assert db.fetch_history_page(1)[0][0] == pid
+
+def test_concurrent_writers(db, names):
+    """Mai multe fire scriu simultan prin pool fara pierderi."""
+
+    uid = db.create_user(names('u'), 'x')
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        written = list(pool.map(lambda i: db.save_journal_batch([entry(names, uid, i)]), range(40)))
+    assert written == [1] * 40
+    assert {row[2] for row in db.fetch_history_page(40)} == {patient(names, i)[0] for i in range(40)}
+
+def test_backend_is_selected_by_config(tmp_path, monkeypatch):
+    """storage_config alege implementarea; dialectul MariaDB este tradus pentru SQLite."""
+
+    monkeypatch.setitem(database.storage_config, 'sqlite_path', str(tmp_path / "cfg.db"))
+    monkeypatch.setitem(database.storage_config, 'backend', 'sqlite')
+    assert isinstance(open_database(), SqliteDatabase)
+    assert type(open_database('mariadb')) is Database
+    with pytest.raises(ValueError):
+        open_database('oracle')
+    assert translate("INSERT IGNORE INTO T VALUES (%s, %s)") == "INSERT OR IGNORE INTO T VALUES (?, ?)"
+
+def test_journal_batch_is_idempotent(db, names):
+    """Lotul din jurnal gaseste pacientii existenti fara SELECT separat; reluarea aceluiasi lot nu dubleaza nimic."""
+
+    uid = db.create_user(names('u'), 'x')
+    existing = save(db, [entry(names, uid, 0)])[0]
+    entries = [entry(names, uid, i % 2, 1, 0.8, 'SVM-20-v1') for i in range(4)]
+    assert db.save_journal_batch(entries) == 4
+    assert db.save_journal_batch(entries) == 0
+    rows = db.fetch_history_page(10, after_id=existing)
+    assert len(rows) == 4
+    assert sorted(row[2] for row in rows) == sorted(patient(names, i % 2)[0] for i in range(4))
+    assert db.timings()['upsert_patient']['count'] == 5
+    assert 'patient_id' not in db.timings()
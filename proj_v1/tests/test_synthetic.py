@@ -0,0 +1,69 @@
+import sys
+import os
+import pytest
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic import CopulaModel, generate, write_csv, write_npy, write_db
+from bench import fixture_rows
+from sqlite_db import SqliteConnection
+from dataset import COLUMNS, FEATURES
+from utils import validate_patient_data
+from auth import auth_config
+
+@pytest.fixture(scope="module")
+def model():
+    return CopulaModel.fit(fixture_rows(583))
+
+def test_rows_are_valid_and_reproducible(model):
+    """Randurile trec validarea formularului (inclusiv DB <= TB) si depind doar de samanta."""
+
+    first = pd.concat(generate(model, 5000, seed=7, chunk_rows=2000))
+    again = pd.concat(generate(model, 5000, seed=7, chunk_rows=2000))
+    assert first.equals(again)
+    assert list(first.columns) == COLUMNS and list(first.index) == list(range(5000))
+    assert not first.equals(pd.concat(generate(model, 5000, seed=8, chunk_rows=2000)))
+
+    assert (first['DB'] <= first['TB']).all()
+    for col in ('Age', 'Gender', 'Alk', 'Sgpt', 'Sgot'):
+        assert (first[col] == first[col].round()).all()
+    for row in first.head(200).itertuples(index=False):
+        ok, msg = validate_patient_data(row.Age, "Masculin" if row.Gender else "Feminin", row.TB, row.DB,
+                                        row.Alk, row.Sgpt, row.Sgot, row.TP, row.ALB, row.AG)
+        assert ok, msg
+
+def test_distributions_and_correlations_are_preserved(model):
+    """Mediile, proportia claselor si corelatiile de rang ale sursei sunt reproduse."""
+
+    source = fixture_rows(583)
+    sample = next(generate(model, 50000, seed=1, chunk_rows=50000))
+    for col in FEATURES:
+        assert sample[col].mean() == pytest.approx(source[col].mean(), rel=0.1, abs=0.05)
+    assert sample['Dataset'].mean() == pytest.approx(source['Dataset'].mean(), abs=0.02)
+    cols = [c for c in FEATURES if c != 'DB']
+    diff = source[cols].corr(method='spearman') - sample[cols].corr(method='spearman')
+    assert np.abs(diff.to_numpy()).max() < 0.1
+
+def test_csv_and_npy_outputs(model, tmp_path):
+    """Ambele formate contin aceleasi randuri, scrise pe bucati."""
+
+    rows = 2500
+    csv_path, npy_path = str(tmp_path / "syn.csv"), str(tmp_path / "syn.npy")
+    assert write_csv(generate(model, rows, seed=3, chunk_rows=1000), csv_path) == rows
+    assert write_npy(generate(model, rows, seed=3, chunk_rows=1000), npy_path, rows) == rows
+
+    from_csv = pd.read_csv(csv_path, usecols=COLUMNS)
+    np.testing.assert_allclose(np.load(npy_path), from_csv[COLUMNS].to_numpy())
+    assert not any(name.endswith(".tmp") for name in os.listdir(tmp_path))
+
+def test_db_output_uses_seeder_batches(model, tmp_path, monkeypatch):
+    """Scrierea in baza de date foloseste loturile seeder-ului si CNP-uri unice pe tot setul generat."""
+
+    monkeypatch.setitem(auth_config, 'bcrypt_rounds', 4)
+    conn = SqliteConnection(str(tmp_path / "syn.db"))
+    assert write_db(generate(model, 2300, seed=5, chunk_rows=1000), conn, progress=lambda msg: None) == 2300
+    cur = conn.raw.cursor()
+    assert cur.execute("SELECT COUNT(*), MIN(cnp_internal_id) FROM PATIENTS").fetchone() == (2300, "SYN0000000000")
+    assert cur.execute("SELECT COUNT(*) FROM PREDICTIONS WHERE direct_bilirubin > total_bilirubin").fetchone() == (0,)
@@ -0,0 +1,98 @@
+import sys
+import os
+import time
+import threading
+import pytest
+from unittest.mock import MagicMock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from workers import TaskRunner, BusyIndicator, QueueFullError
+
+class FakeRoot:
+    """Inlocuieste fereastra Tk: callback-urile programate cu after() sunt rulate explicit de test."""
+    def __init__(self):
+        self.scheduled = []
+        self.thread = threading.current_thread()
+
+    def after(self, ms, fn, *args):
+        self.scheduled.append((fn, args))
+
+    def pump(self, timeout=5):
+        deadline = time.monotonic() + timeout
+        while self.scheduled and time.monotonic() < deadline:
+            fn, args = self.scheduled.pop(0)
+            fn(*args)
+            time.sleep(0.005)
+
+def test_results_are_delivered_on_ui_thread():
+    root = FakeRoot()
+    runner = TaskRunner(root, max_workers=2, max_pending=4, poll_ms=1)
+    seen = []
+    runner.submit(lambda x: (x * 2, threading.current_thread()), 21,
+                  on_done=lambda r: seen.append((r[0], r[1] is not root.thread, threading.current_thread() is root.thread)))
+    root.pump()
+    assert seen == [(42, True, True)]
+    runner.shutdown()
+
+def test_errors_and_busy_indicator():
+    root = FakeRoot()
+    runner = TaskRunner(root, poll_ms=1)
+    widget = MagicMock(); widget.cget.return_value = "Login"
+    errors = []
+    runner.submit(MagicMock(side_effect=ValueError("Parola incorecta!")),
+                  on_error=errors.append, busy=BusyIndicator(widget, "Se verifica..."))
+    widget.configure.assert_called_with(state="disabled", text="Se verifica...")
+    root.pump()
+    assert isinstance(errors[0], ValueError)
+    widget.configure.assert_called_with(state="normal", text="Login")
+    runner.shutdown()
+
+def test_cancelled_task_result_is_dropped():
+    root = FakeRoot()
+    runner = TaskRunner(root, poll_ms=1)
+    release = threading.Event()
+    done = []
+    handle = runner.submit(release.wait, on_done=done.append)
+    handle.cancel()
+    release.set()
+    root.pump()
+    assert done == [] and runner.pending() == 0
+    runner.shutdown()
+
+def test_queue_is_bounded():
+    root = FakeRoot()
+    runner = TaskRunner(root, max_workers=1, max_pending=2, poll_ms=1)
+    release = threading.Event()
+    runner.submit(release.wait); runner.submit(release.wait)
+    with pytest.raises(QueueFullError):
+        runner.submit(release.wait)
+    release.set()
+    root.pump()
+    # Dupa livrarea rezultatelor locurile din coada sunt eliberate
+    runner.submit(lambda: None)
+    root.pump()
+    runner.shutdown()
+
+def test_task_finishing_during_poll_is_delivered(monkeypatch):
+    """O sarcina terminata chiar in timpul verificarii este livrata si isi elibereaza locul din coada."""
+
+    root = FakeRoot()
+    runner = TaskRunner(root, max_pending=1, poll_ms=1)
+    gate = threading.Event()
+    seen = []
+    handle = runner.submit(gate.wait, on_done=seen.append)
+    answers = iter([False])
+    original = handle.done
+
+    def done():
+        # Prima citire vede sarcina in curs, apoi sarcina se termina
+        result = next(answers, None)
+        if result is None: return original()
+        gate.set(); handle.future.result(timeout=5)
+        return result
+    monkeypatch.setattr(handle, 'done', done)
+    root.pump()
+    assert seen == [True]
+    runner.submit(lambda: None)
+    runner.shutdown()
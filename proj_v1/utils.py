@@ -20,6 +20,9 @@
 #                                                                        #
 ##########################################################################
 from datetime import datetime
+from lazy import lazy_import
+
+np = lazy_import("numpy")
 
 def calculate_age_from_dob(dob_str):
     """
@@ -83,3 +86,33 @@ def validate_patient_data(age, gender, total_bilirubin, direct_bilirubin,
 
     except Exception as e:
         return False, f"Eroare neașteptată la validare: {str(e)}"
+
+def validate_patient_batch(X):
+    """
+    Varianta vectorizata a validate_patient_data pentru o matrice N x 10 (ordinea din formular)
+    Returneaza: (np.ndarray bool cu randurile valide, lista de (index_rand, mesaj) pentru cele invalide)
+    """
+    X = np.asarray(X, dtype=np.float64)
+    if X.ndim != 2 or X.shape[1] != 10:
+        raise ValueError(f"Se asteapta o matrice cu 10 coloane, primit forma {X.shape}.")
+
+    labels = ["Vârsta", "Gen", "Bilirubina Totală", "Bilirubina Directă", "Fosfataza Alcalină",
+              "ALT", "AST", "Proteine Totale", "Albumina", "Raport A/G"]
+    # Regulile sunt evaluate in aceeasi ordine ca in validarea pentru un singur pacient
+    rules = [(~np.isfinite(X[:, 0]), lambda r: "Vârsta trebuie să fie un număr."),
+             ((X[:, 0] < 0) | (X[:, 0] > 120),
+              lambda r: f"Vârsta introdusă ({X[r, 0]}) este invalidă. Trebuie să fie între 0 și 120."),
+             (~np.isin(X[:, 1], (0, 1)), lambda r: "Genul trebuie să fie 0 (Feminin) sau 1 (Masculin).")]
+    for col in range(2, 10):
+        rules.append((~np.isfinite(X[:, col]),
+                      lambda r, c=col: f"Valoarea pentru '{labels[c]}' trebuie să fie numerică."))
+        rules.append((X[:, col] < 0, lambda r, c=col: f"Valoarea pentru '{labels[c]}' nu poate fi negativă."))
+    rules.append((X[:, 3] > X[:, 2], lambda r: "Bilirubina Directă nu poate fi mai mare decât Bilirubina Totală."))
+
+    valid = np.ones(X.shape[0], dtype=bool)
+    errors = {}
+    for failed, message in rules:
+        for r in np.flatnonzero(failed & valid):
+            errors[int(r)] = message(r)
+        valid &= ~failed
+    return valid, sorted(errors.items())
@@ -0,0 +1,137 @@
+##########################################################################
+#                                                                        #
+#  Copyright:   (c) 2026, Proiect MPS                                    #
+#  Autori:      Albu A. Sorin (R.Moldova) 1409A                          #
+#               Glavan P. Pavel (R.Moldova) 1409A                        #
+#               Duda I.I. Andrei-Ionuț 1409A                             #
+#               Jireadă C. Teodor 1409A                                  #
+#               Popovici I.L. Andrei 1409A                               #
+#               Noroc D. Sorin (R.Moldova) 1409A                         #
+#               Timofte C. Constantin 1409A                              #
+#               Matei I. Ion (R.Moldova) 1410B                           #
+#                                                                        #
+#  Descriere:   Sistem Expert pentru Predictia Bolilor Hepatice          #
+#               Utilizand algoritmii SVM si Multilayer Perceptron (MLP)  #
+#               Bazat pe setul de date ILPD (Indian Liver Patient)       #
+#                                                                        #
+#  Acest cod si informatiile sunt oferite "ca atare" fara nicio garantie #
+#  de orice fel, exprimata sau implicita. Acest proiect este realizat    #
+#  in scop didactic pentru disciplina Managementul Proiectelor Software. #
+#                                                                        #
+##########################################################################
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+log = logging.getLogger(__name__)
+
+worker_config = {
+    'max_workers': 2,
+    # Numarul maxim de sarcini in asteptare; peste acest prag cererile noi sunt refuzate
+    'max_pending': 8,
+    # Intervalul (ms) la care firul Tk verifica sarcinile terminate
+    'poll_ms': 30
+}
+
+class QueueFullError(Exception):
+    """
+    Coada de sarcini este plina; interfata trebuie sa ceara utilizatorului sa astepte
+    """
+
+class BusyIndicator:
+    """
+    Dezactiveaza un buton (si afiseaza un text de asteptare) cat timp sarcina asociata ruleaza
+    """
+    def __init__(self, widget, busy_text="Se proceseaza..."):
+        self.widget = widget
+        self.busy_text = busy_text
+        self._saved = None
+
+    def start(self):
+        self._saved = self.widget.cget("text")
+        self.widget.configure(state="disabled", text=self.busy_text)
+        try: self.widget.winfo_toplevel().configure(cursor="watch")
+        except Exception: pass
+
+    def stop(self):
+        self.widget.configure(state="normal", text=self._saved)
+        try: self.widget.winfo_toplevel().configure(cursor="")
+        except Exception: pass
+
+class TaskHandle:
+    """
+    Referinta la o sarcina trimisa; cancel() opreste sarcina daca nu a pornit
+    si, in orice caz, impiedica livrarea rezultatului catre interfata
+    """
+    def __init__(self, future):
+        self.future = future
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+        self.future.cancel()
+
+    def done(self):
+        return self.future.done()
+
+class TaskRunner:
+    """
+    Ruleaza munca lenta (predictie, baza de date, bcrypt) pe fire de lucru
+    Rezultatele sunt livrate inapoi pe firul Tk prin after(), singurul fir care are voie sa atinga widget-urile
+    """
+    def __init__(self, root, max_workers=None, max_pending=None, poll_ms=None):
+        self.root = root
+        self.poll_ms = poll_ms or worker_config['poll_ms']
+        self._executor = ThreadPoolExecutor(max_workers or worker_config['max_workers'], thread_name_prefix="ui-worker")
+        self._slots = threading.BoundedSemaphore(max_pending or worker_config['max_pending'])
+        self._pending = []
+        self._polling = False
+
+    def submit(self, fn, *args, on_done=None, on_error=None, busy=None):
+        """
+        Programeaza fn(*args) pe un fir de lucru; on_done(rezultat) sau on_error(exceptie) ruleaza pe firul Tk
+        Returneaza: TaskHandle; ridica QueueFullError daca sunt prea multe sarcini in asteptare
+        """
+        if not self._slots.acquire(blocking=False):
+            raise QueueFullError("Prea multe operatii in curs, incercati din nou.")
+        try:
+            handle = TaskHandle(self._executor.submit(fn, *args))
+        except Exception:
+            self._slots.release()
+            raise
+        if busy: busy.start()
+        self._pending.append((handle, on_done, on_error, busy))
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._poll)
+        return handle
+
+    def pending(self):
+        return len(self._pending)
+
+    def _poll(self):
+        """
+        Ruleaza pe firul Tk: livreaza rezultatele sarcinilor terminate si se reprogrameaza cat timp mai sunt sarcini
+        """
+        # done() este citit o singura data per sarcina: una terminata intre doua citiri s-ar pierde din ambele liste
+        finished, still = [], []
+        for item in self._pending: (finished if item[0].done() else still).append(item)
+        self._pending = still
+        for handle, on_done, on_error, busy in finished:
+            self._slots.release()
+            if busy: busy.stop()
+            if handle.cancelled or handle.future.cancelled(): continue
+            error = handle.future.exception()
+            try:
+                if error is not None:
+                    if on_error: on_error(error)
+                    else: log.error("Sarcina esuata: %s", error)
+                elif on_done: on_done(handle.future.result())
+            except Exception:
+                log.exception("Eroare in callback-ul sarcinii")
+        if self._pending: self.root.after(self.poll_ms, self._poll)
+        else: self._polling = False
+
+    def shutdown(self):
+        for handle, _, _, _ in self._pending: handle.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)